@@ -47,15 +47,25 @@ from . import aggregator as agg
 from . import plot
 from .dataset.imaging import MaskedImaging, SimulatorImaging
 from .dataset.interferometer import MaskedInterferometer, SimulatorInterferometer
-from .fit.fit import FitImaging, FitInterferometer
+from .fit.fit import (
+    FitImaging,
+    FitImagingLikelihood,
+    FitImagingWorkspace,
+    FitInterferometer,
+)
 from .fit.fit_point_source import (
     FitPositionsSourceMaxSeparation,
     FitPositionsImage,
     FitFluxes,
 )
 from .lens.settings import SettingsLens
-from .lens.ray_tracing import Tracer
-from .lens.positions_solver import PositionsSolver
+from .lens.ray_tracing import Tracer, TracerBatch
+from .lens.deflections_tree import DeflectionsTree
+from .lens.positions_solver import (
+    PositionsSolver,
+    PositionsSolverNewton,
+    PositionsSolverTriangles,
+)
 from .pipeline.setup import (
     SetupPipeline,
     SetupHyper,
@@ -5,6 +5,7 @@ from autoarray.structures import arrays
 from autoarray.structures import grids
 from autoarray.structures import kernel
 from autogalaxy.dataset import imaging as im
+from autolens.dataset.kernel_fft import KernelFFT
 from autolens.lens import ray_tracing
 
 
@@ -44,6 +45,17 @@ class MaskedImaging(imaging.MaskedImaging):
             imaging=imaging, mask=mask, settings=settings
         )
 
+        # If the grid and inversion grid are computed identically they share one object, so that tracers reuse the
+        # traced grid of one for the other within a `trace_cache_scope`.
+
+        if settings.grid_inversion_class is settings.grid_class:
+            self.grid_inversion = self.grid
+
+        # The FFT of the PSF is computed once and reused by every unmasked model image blurred with the PSF.
+
+        if self.psf is not None:
+            self.psf_fft = KernelFFT(kernel=self.psf)
+
 
 class SimulatorImaging(imaging.SimulatorImaging):
     def __init__(
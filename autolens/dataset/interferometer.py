@@ -49,6 +49,12 @@ class MaskedInterferometer(interferometer.MaskedInterferometer):
             settings=settings,
         )
 
+        # If the grid and inversion grid are computed identically they share one object, so that tracers reuse the
+        # traced grid of one for the other within a `trace_cache_scope`.
+
+        if settings.grid_inversion_class is settings.grid_class:
+            self.grid_inversion = self.grid
+
 
 class SimulatorInterferometer(interferometer.SimulatorInterferometer):
     def __init__(
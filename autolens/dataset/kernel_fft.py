@@ -0,0 +1,109 @@
+import numpy as np
+import scipy.fft
+import scipy.signal
+from autoarray import exc
+
+
+class KernelFFT:
+    def __init__(self, kernel):
+        """
+        Convolves a batch of 2D arrays (e.g. the padded images of every galaxy of a tracer) with a `Kernel` (e.g. a
+        PSF) in one pass.
+
+        For large kernels the arrays are convolved using Fast Fourier Transforms, where the FFT of the kernel is
+        computed once for every padded array shape and cached. An instance is therefore created once per
+        `MaskedImaging`, such that every model image blurred using its PSF reuses the PSF's FFT. For small kernels
+        the arrays are convolved directly instead, which gives results identical to
+        `Kernel.convolved_array_from_array`.
+
+        Parameters
+        ----------
+        kernel : Kernel
+            The kernel (e.g. a PSF) the arrays are convolved with.
+        """
+        self.kernel = kernel
+        self.kernel_ffts = {}
+
+    def fft_shape_from_shape(self, shape_2d):
+        """
+        The shape of the FFTs of an array of 2D shape `shape_2d`, which is padded by the kernel shape such that the
+        convolution is linear and not circular.
+        """
+        return (
+            scipy.fft.next_fast_len(shape_2d[0] + self.kernel.shape_2d[0] - 1),
+            scipy.fft.next_fast_len(shape_2d[1] + self.kernel.shape_2d[1] - 1),
+        )
+
+    def use_fft_for_shape(self, shape_2d):
+        """
+        Whether arrays of 2D shape `shape_2d` are convolved via FFTs, which is faster than direct convolution when
+        the number of kernel pixels exceeds the log of the number of FFT pixels. Kernels of 3x3 pixels or fewer are
+        always convolved directly, as both methods take a comparable time.
+        """
+        kernel_pixels = self.kernel.shape_2d[0] * self.kernel.shape_2d[1]
+
+        if kernel_pixels <= 9:
+            return False
+
+        fft_shape = self.fft_shape_from_shape(shape_2d=shape_2d)
+
+        return kernel_pixels > np.log2(fft_shape[0] * fft_shape[1])
+
+    def kernel_fft_from_shape(self, shape_2d):
+        """
+        The FFT of the kernel used to convolve arrays of 2D shape `shape_2d`, which is computed once per shape.
+        """
+        fft_shape = self.fft_shape_from_shape(shape_2d=shape_2d)
+
+        if fft_shape not in self.kernel_ffts:
+            self.kernel_ffts[fft_shape] = scipy.fft.rfft2(
+                np.asarray(self.kernel.in_2d), s=fft_shape
+            )
+
+        return self.kernel_ffts[fft_shape]
+
+    def convolved_arrays_2d_from_arrays_2d(self, arrays_2d):
+        """
+        Convolve a batch of 2D arrays with the kernel, returning the convolved arrays with the same shape as the
+        input arrays (equivalent to `scipy.signal.convolve2d` with mode="same").
+
+        Parameters
+        ----------
+        arrays_2d : np.ndarray
+            The arrays which are convolved, as an ndarray of shape [total_arrays, total_y_pixels, total_x_pixels].
+
+        Raises
+        ------
+        KernelException if either kernel dimension is even
+        """
+        if self.kernel.shape_2d[0] % 2 == 0 or self.kernel.shape_2d[1] % 2 == 0:
+            raise exc.KernelException("Kernel Kernel must be odd")
+
+        arrays_2d = np.asarray(arrays_2d)
+
+        shape_2d = arrays_2d.shape[1:]
+
+        if not self.use_fft_for_shape(shape_2d=shape_2d):
+            return np.stack(
+                [
+                    scipy.signal.convolve2d(
+                        array_2d, np.asarray(self.kernel.in_2d), mode="same"
+                    )
+                    for array_2d in arrays_2d
+                ]
+            )
+
+        fft_shape = self.fft_shape_from_shape(shape_2d=shape_2d)
+
+        convolved_arrays_2d = scipy.fft.irfft2(
+            scipy.fft.rfft2(arrays_2d, s=fft_shape)
+            * self.kernel_fft_from_shape(shape_2d=shape_2d),
+            s=fft_shape,
+        )
+
+        y_start = self.kernel.shape_2d[0] // 2
+        x_start = self.kernel.shape_2d[1] // 2
+
+        return convolved_arrays_2d[
+            :, y_start : y_start + shape_2d[0], x_start : x_start + shape_2d[1]
+        ]
@@ -1,9 +1,41 @@
+import copy
+from functools import wraps
+
 import numpy as np
 
 from autoconf import conf
 from autoarray.fit import fit as aa_fit
 from autoarray.inversion import pixelizations as pix, inversions as inv
+from autoarray.util import fit_util, inversion_util
 from autogalaxy.galaxy import galaxy as g
+from autogalaxy.profiles import light_profiles as lp, mass_profiles as mp
+from autolens.lens import ray_tracing
+
+
+def cached_product(func):
+    """
+    Turns a method of a fit which computes a derived product from its tracer (e.g. the model image of every plane)
+    into a property, whose value is computed on first access and cached on the fit.
+
+    The product is computed within a `trace_cache_scope` of the fit's `TraceCache`, such that the grids traced by the
+    fit and its other products are reused instead of being traced again. The cached products and traced grids are
+    released by the fit's `release_cache`.
+    """
+
+    @property
+    @wraps(func)
+    def wrapper(fit):
+
+        cached_products = fit.__dict__.setdefault("_cached_products", {})
+
+        if func.__name__ not in cached_products:
+
+            with fit.tracer.trace_cache_scope(trace_cache=fit.trace_cache):
+                cached_products[func.__name__] = func(fit)
+
+        return cached_products[func.__name__]
+
+    return wrapper
 
 
 class FitImaging(aa_fit.FitImaging):
@@ -57,31 +89,35 @@ class FitImaging(aa_fit.FitImaging):
             image = masked_imaging.image
             noise_map = masked_imaging.noise_map
 
-        self.blurred_image = tracer.blurred_image_from_grid_and_convolver(
-            grid=masked_imaging.grid,
-            convolver=masked_imaging.convolver,
-            blurring_grid=masked_imaging.blurring_grid,
-        )
+        self.trace_cache = ray_tracing.TraceCache()
 
-        self.profile_subtracted_image = image - self.blurred_image
+        with tracer.trace_cache_scope(trace_cache=self.trace_cache):
 
-        if not tracer.has_pixelization:
+            self.blurred_image = tracer.blurred_image_from_grid_and_convolver(
+                grid=masked_imaging.grid,
+                convolver=masked_imaging.convolver,
+                blurring_grid=masked_imaging.blurring_grid,
+            )
 
-            inversion = None
-            model_image = self.blurred_image
+            self.profile_subtracted_image = image - self.blurred_image
 
-        else:
+            if not tracer.has_pixelization:
 
-            inversion = tracer.inversion_imaging_from_grid_and_data(
-                grid=masked_imaging.grid_inversion,
-                image=self.profile_subtracted_image,
-                noise_map=noise_map,
-                convolver=masked_imaging.convolver,
-                settings_pixelization=settings_pixelization,
-                settings_inversion=settings_inversion,
-            )
+                inversion = None
+                model_image = self.blurred_image
 
-            model_image = self.blurred_image + inversion.mapped_reconstructed_image
+            else:
+
+                inversion = tracer.inversion_imaging_from_grid_and_data(
+                    grid=masked_imaging.grid_inversion,
+                    image=self.profile_subtracted_image,
+                    noise_map=noise_map,
+                    convolver=masked_imaging.convolver,
+                    settings_pixelization=settings_pixelization,
+                    settings_inversion=settings_inversion,
+                )
+
+                model_image = self.blurred_image + inversion.mapped_reconstructed_image
 
         super().__init__(
             masked_imaging=masked_imaging,
@@ -94,7 +130,16 @@ class FitImaging(aa_fit.FitImaging):
     def grid(self):
         return self.masked_imaging.grid
 
-    @property
+    def release_cache(self):
+        """
+        Release the cached derived products of the fit (e.g. `model_images_of_planes`) and the grids traced by its
+        tracer, for example to bound the memory of a fit that is kept after its figures are output. Products accessed
+        afterwards are recomputed.
+        """
+        self._cached_products = {}
+        self.trace_cache.clear()
+
+    @cached_product
     def galaxy_model_image_dict(self) -> {g.Galaxy: np.ndarray}:
         """
         A dictionary associating galaxies with their corresponding model images
@@ -119,7 +164,7 @@ class FitImaging(aa_fit.FitImaging):
 
         return galaxy_model_image_dict
 
-    @property
+    @cached_product
     def model_images_of_planes(self):
 
         model_images_of_planes = self.tracer.blurred_images_of_planes_from_grid_and_psf(
@@ -136,7 +181,7 @@ class FitImaging(aa_fit.FitImaging):
 
         return model_images_of_planes
 
-    @property
+    @cached_product
     def subtracted_images_of_planes(self):
 
         subtracted_images_of_planes = []
@@ -157,22 +202,31 @@ class FitImaging(aa_fit.FitImaging):
 
         return subtracted_images_of_planes
 
-    @property
+    @cached_product
+    def padded_grid(self):
+        return self.grid.padded_grid_from_kernel_shape(
+            kernel_shape_2d=self.masked_imaging.psf.shape_2d
+        )
+
+    @cached_product
     def unmasked_blurred_image(self):
         return self.tracer.unmasked_blurred_image_from_grid_and_psf(
-            grid=self.grid, psf=self.masked_imaging.psf
+            grid=self.grid, psf=self.masked_imaging.psf, padded_grid=self.padded_grid
         )
 
-    @property
+    @cached_product
     def unmasked_blurred_image_of_planes(self):
         return self.tracer.unmasked_blurred_image_of_planes_from_grid_and_psf(
-            grid=self.grid, psf=self.masked_imaging.psf
+            grid=self.grid, psf=self.masked_imaging.psf, padded_grid=self.padded_grid
         )
 
-    @property
+    @cached_product
     def unmasked_blurred_image_of_planes_and_galaxies(self):
         return self.tracer.unmasked_blurred_image_of_planes_and_galaxies_from_grid_and_psf(
-            grid=self.grid, psf=self.masked_imaging.psf
+            grid=self.grid,
+            psf=self.masked_imaging.psf,
+            psf_fft=self.masked_imaging.psf_fft,
+            padded_grid=self.padded_grid,
         )
 
     @property
@@ -180,6 +234,583 @@ class FitImaging(aa_fit.FitImaging):
         return len(list(filter(None, self.tracer.regularizations_of_planes)))
 
 
+class FitImagingWorkspace:
+    def __init__(self, masked_imaging):
+        """The preallocated float64 buffers which a `FitImagingLikelihood` computes every fit in.
+
+        The blurred image, model image, profile subtracted image, hyper noise-map and chi-squared map of every fit are
+        computed in buffers of shape [total_unmasked_pixels]. The tracer traces the grid and blurring grid of the
+        masked imaging, which are concatenated once, in the traced grid buffers and sums and bins the images of its
+        planes in the image buffers (see `Tracer.binned_image_and_blurring_image_from_grid_and_blurring_grid`).
+
+        An `Analysis` creates one workspace for its masked imaging, so a non-linear search reuses the same buffers for
+        every likelihood evaluation instead of allocating new arrays every time. The deflection angles and images of
+        the light and mass profiles are still new arrays computed by the profiles, which set the peak memory of a
+        likelihood evaluation.
+
+        Parameters
+        -----------
+        masked_imaging : MaskedImaging
+            The masked imaging dataset whose fits the buffers are used for.
+        """
+        shape = (masked_imaging.image.shape[0],)
+
+        self.blurred_image = np.zeros(shape=shape)
+        self.model_image = np.zeros(shape=shape)
+        self.profile_subtracted_image = np.zeros(shape=shape)
+        self.noise_map = np.zeros(shape=shape)
+        self.chi_squared_map = np.zeros(shape=shape)
+
+        blurring_grid = getattr(masked_imaging, "blurring_grid", None)
+
+        if blurring_grid is None:
+            self.grid_and_blurring_grid = np.asarray(masked_imaging.grid)
+            self.binned_blurring_image = np.zeros(shape=(0,))
+        else:
+            self.grid_and_blurring_grid = np.concatenate(
+                (masked_imaging.grid, blurring_grid)
+            )
+            self.binned_blurring_image = np.zeros(
+                shape=(blurring_grid.shape[0] // blurring_grid.mask.sub_length,)
+            )
+
+        self.image = np.zeros(shape=(self.grid_and_blurring_grid.shape[0],))
+        self.binned_image = np.zeros(shape=shape)
+
+        self.traced_grids = np.zeros(shape=(0,) + self.grid_and_blurring_grid.shape)
+        self.scaled_deflections = np.zeros(shape=self.grid_and_blurring_grid.shape)
+
+    def traced_grids_workspace_from(self, total_planes):
+        """
+        Returns the buffers the grid and blurring grid are traced in by a tracer up to its plane `total_planes - 1`
+        (see `Tracer.traced_grids_workspace_from`), which are grown when a tracer with more planes is traced.
+        """
+        if self.traced_grids.shape[0] < total_planes:
+            self.traced_grids = np.zeros(
+                shape=(total_planes,) + self.grid_and_blurring_grid.shape
+            )
+
+        return self.traced_grids, self.scaled_deflections
+
+    @property
+    def nbytes(self):
+        return sum(
+            buffer.nbytes
+            for buffer in (
+                self.blurred_image,
+                self.model_image,
+                self.profile_subtracted_image,
+                self.noise_map,
+                self.chi_squared_map,
+                self.grid_and_blurring_grid,
+                self.image,
+                self.binned_image,
+                self.binned_blurring_image,
+                self.traced_grids,
+                self.scaled_deflections,
+            )
+        )
+
+
+class LightProfileImageCache(lp.LightProfile):
+    def __init__(self, light_profile, workspace, plane_index):
+        """Stands in for a light profile of a tracer whose image is the same for every fit of a
+        `FitImagingLikelihood` (see `FitImagingLikelihood.tracer_with_constant_images_from`).
+
+        The image of the light profile on the grid and blurring grid of the masked imaging, which are traced together
+        in the traced grid buffers of the fit's `FitImagingWorkspace`, is computed by the light profile once and
+        returned for every later fit. The traced grid of the light profile's plane is recognised as a view of the
+        workspace's buffer for that plane. Images on any other grid, or with a `grid_radial_minimum`, are computed by
+        the light profile.
+
+        Parameters
+        -----------
+        light_profile : LightProfile
+            The light profile whose image is cached.
+        workspace : FitImagingWorkspace
+            The workspace whose traced grid of the plane the image is cached for.
+        plane_index : int
+            The index of the plane of the light profile.
+        """
+        super().__init__()
+
+        self.light_profile = light_profile
+        self.workspace = workspace
+        self.plane_index = plane_index
+        self.image = None
+
+    def is_traced_grid_of_workspace(self, grid):
+        """
+        Whether a grid is the grid and blurring grid of the workspace traced to the plane of the light profile, which
+        is the case if it views the same memory, with the same shape and strides, as the workspace's buffer.
+        """
+        traced_grids = self.workspace.traced_grids
+
+        if self.plane_index >= traced_grids.shape[0]:
+            return False
+
+        return (
+            np.asarray(grid).__array_interface__
+            == traced_grids[self.plane_index].__array_interface__
+        )
+
+    def image_from_grid(self, grid, grid_radial_minimum=None):
+
+        if grid_radial_minimum is not None or not self.is_traced_grid_of_workspace(
+            grid=grid
+        ):
+            return self.light_profile.image_from_grid(
+                grid=grid, grid_radial_minimum=grid_radial_minimum
+            )
+
+        if self.image is None:
+            self.image = self.light_profile.image_from_grid(grid=grid)
+            self.image.setflags(write=False)
+
+        return self.image
+
+
+class FitImagingLikelihood:
+    def __init__(
+        self,
+        masked_imaging,
+        settings_pixelization=pix.SettingsPixelization(),
+        settings_inversion=inv.SettingsInversion(),
+        workspace=None,
+        hyper_noise_limit=None,
+        use_constant_image_cache=False,
+    ):
+        """Computes the figure of merit (the log likelihood, or the log evidence if the tracer has a pixelization) of
+        the fit of a tracer to a masked imaging dataset, without creating a `FitImaging`.
+
+        This is used by a non-linear search, which only requires the figure of merit of every fit. The blurred image,
+        model image, residuals, chi-squareds and hyper noise-map are computed in the buffers of a
+        `FitImagingWorkspace`, and no `MaskedImaging`, residual-map or chi-squared-map structures are created. The
+        noise normalization of the dataset's noise-map is computed once. The figure of merit is identical to that of
+        the `FitImaging`, which should be used for results and visualization.
+
+        The hyper noise-map of the previous fit is reused while the hyper galaxies and hyper background noise are
+        unchanged (see `hyper_noise_map_and_noise_normalization_from`).
+
+        If `use_constant_image_cache` is `True`, the image of light profiles which are fixed between fits is computed
+        once and reused (see `tracer_with_constant_images_from`). The images of all light profiles are summed and
+        blurred in the same order as the `FitImaging`, so the figure of merit is unchanged. The blurred images of fixed
+        light profiles are therefore not cached, as blurring them separately from the other light profiles would
+        change the rounding of the model image.
+
+        Parameters
+        -----------
+        masked_imaging : MaskedImaging
+            The masked imaging dataset that is fitted.
+        settings_pixelization : SettingsPixelization
+            The settings of the pixelization of tracers with an inversion.
+        settings_inversion : SettingsInversion
+            The settings of the inversion of tracers with an inversion.
+        workspace : FitImagingWorkspace or None
+            The buffers every fit is computed in, which are created for the masked imaging if not input.
+        hyper_noise_limit : float or None
+            The value the hyper noise-map is rounded down to, which is read from the config if not input.
+        use_constant_image_cache : bool
+            If `True`, the image of light profiles which are fixed between fits is computed once and reused.
+        """
+        self.masked_imaging = masked_imaging
+        self.settings_pixelization = settings_pixelization
+        self.settings_inversion = settings_inversion
+
+        if workspace is None:
+            workspace = FitImagingWorkspace(masked_imaging=masked_imaging)
+
+        self.workspace = workspace
+
+        noise_map = np.asarray(masked_imaging.noise_map)
+
+        self.noise_normalization = fit_util.noise_normalization_from(
+            noise_map=masked_imaging.noise_map
+        )
+
+        if hyper_noise_limit is None:
+            hyper_noise_limit = conf.instance["general"]["hyper"]["hyper_noise_limit"]
+
+        self.hyper_noise_limit = hyper_noise_limit
+
+        # The noise-map of the `FitImaging` inversion without hyper components, which is the noise-map plus a zero
+        # hyper noise-map rounded down to the hyper noise limit.
+
+        self.noise_map_limited = np.where(
+            noise_map > hyper_noise_limit, hyper_noise_limit, noise_map
+        )
+
+        self.hyper_noise_map_key = None
+        self.hyper_noise_map_images = None
+        self.hyper_noise_normalization = None
+
+        self.use_constant_image_cache = use_constant_image_cache
+        self.previous_tracer_settings = None
+        self.previous_profiles_of_planes = None
+        self.light_profile_image_caches = []
+        self.tracer_with_constant_images_key = None
+        self.tracer_with_constant_images = None
+
+    def tracer_with_constant_images_from(self, tracer):
+        """Returns a tracer whose light profiles which are constant, and therefore have the same image for every fit,
+        are replaced by a `LightProfileImageCache` which computes their image once and reuses it for later fits.
+
+        A light profile is constant if it is the same object as a light profile of the same plane of the previous
+        fit's tracer, the tracers have the same plane redshifts, cosmology and settings, and every mass profile in the
+        planes below it is the same object as in the previous fit. This is the case for profiles passed to a phase as
+        instances rather than models. Light profiles behind a free mass profile, or in a tracer with a free galaxy
+        redshift, are therefore not constant, as their traced grids change between fits. Light profiles which are
+        also mass profiles are never constant.
+
+        The returned tracer has the planes, cosmology and settings of the input tracer. Once all of its light profiles
+        are cached, it is reused for every fit whose galaxies have the same attributes (e.g. when only the hyper
+        components change). Images are only cached
+        when the grid and blurring grid are traced together (see `can_trace_grid_and_blurring_grid_together`), where
+        the images of every plane are summed in the same order as the input tracer.
+
+        Parameters
+        -----------
+        tracer : ray_tracing.Tracer
+            The tracer, which describes the ray-tracing and strong lens configuration.
+        """
+        tracer_settings = (
+            tracer.plane_redshifts,
+            tracer.cosmology,
+            tracer.deflections_opening_angle,
+        )
+
+        # The reused tracer references the attributes of the galaxies in the key, so their identities cannot be
+        # reused by different objects while it is cached. The `id` of every galaxy is unique, so is not in the key.
+
+        tracer_with_constant_images_key = (
+            tuple(tracer.plane_redshifts),
+            id(tracer.cosmology),
+            tracer.deflections_opening_angle,
+            tuple(
+                tuple(
+                    tuple(
+                        (name, id(value))
+                        for name, value in galaxy.__dict__.items()
+                        if name != "id"
+                    )
+                    for galaxy in plane.galaxies
+                )
+                for plane in tracer.planes
+            ),
+        )
+
+        if tracer_with_constant_images_key == self.tracer_with_constant_images_key:
+            return self.tracer_with_constant_images
+
+        profiles_of_planes = [
+            (
+                [
+                    light_profile
+                    for galaxy in plane.galaxies
+                    for light_profile in galaxy.light_profiles
+                ],
+                [
+                    mass_profile
+                    for galaxy in plane.galaxies
+                    for mass_profile in galaxy.mass_profiles
+                ],
+            )
+            for plane in tracer.planes
+        ]
+
+        constant_light_profiles_of_planes = [[] for plane in tracer.planes]
+
+        if (
+            self.previous_tracer_settings is not None
+            and tracer.plane_redshifts == self.previous_tracer_settings[0]
+            and tracer.cosmology is self.previous_tracer_settings[1]
+            and tracer.deflections_opening_angle == self.previous_tracer_settings[2]
+            and tracer.can_trace_grid_and_blurring_grid_together(
+                grid=self.masked_imaging.grid,
+                blurring_grid=self.masked_imaging.blurring_grid,
+            )
+        ):
+
+            for plane_index, (light_profiles, mass_profiles) in enumerate(
+                profiles_of_planes
+            ):
+
+                (
+                    previous_light_profiles,
+                    previous_mass_profiles,
+                ) = self.previous_profiles_of_planes[plane_index]
+
+                constant_light_profiles_of_planes[plane_index] = [
+                    light_profile
+                    for light_profile in light_profiles
+                    if any(
+                        light_profile is previous_light_profile
+                        for previous_light_profile in previous_light_profiles
+                    )
+                    and not isinstance(light_profile, mp.MassProfile)
+                ]
+
+                if len(mass_profiles) != len(previous_mass_profiles) or any(
+                    mass_profile is not previous_mass_profile
+                    for mass_profile, previous_mass_profile in zip(
+                        mass_profiles, previous_mass_profiles
+                    )
+                ):
+                    break
+
+        self.previous_tracer_settings = tracer_settings
+        self.previous_profiles_of_planes = profiles_of_planes
+
+        # The cache of a light profile is kept while it is constant, as its traced grid is then unchanged since the
+        # fit the cache was created for.
+
+        light_profile_image_caches = []
+
+        for plane_index, constant_light_profiles in enumerate(
+            constant_light_profiles_of_planes
+        ):
+
+            for light_profile in constant_light_profiles:
+
+                light_profile_image_cache = next(
+                    (
+                        image_cache
+                        for cache_plane_index, image_cache in self.light_profile_image_caches
+                        if cache_plane_index == plane_index
+                        and image_cache.light_profile is light_profile
+                    ),
+                    None,
+                )
+
+                if light_profile_image_cache is None:
+                    light_profile_image_cache = LightProfileImageCache(
+                        light_profile=light_profile,
+                        workspace=self.workspace,
+                        plane_index=plane_index,
+                    )
+
+                light_profile_image_caches.append(
+                    (plane_index, light_profile_image_cache)
+                )
+
+        self.light_profile_image_caches = light_profile_image_caches
+
+        if light_profile_image_caches:
+
+            tracer = tracer.tracer_with_galaxies_of_planes_from(
+                galaxies_of_planes=[
+                    [
+                        galaxy_with_light_profiles_replaced_from(
+                            galaxy=galaxy,
+                            light_profile_image_caches=[
+                                image_cache
+                                for cache_plane_index, image_cache in light_profile_image_caches
+                                if cache_plane_index == plane_index
+                            ],
+                        )
+                        for galaxy in plane.galaxies
+                    ]
+                    for plane_index, plane in enumerate(tracer.planes)
+                ]
+            )
+
+        # The tracer is only reused once the images of all of its light profiles which can be constant are cached.
+
+        if len(light_profile_image_caches) == sum(
+            not isinstance(light_profile, mp.MassProfile)
+            for light_profiles, mass_profiles in profiles_of_planes
+            for light_profile in light_profiles
+        ):
+            self.tracer_with_constant_images_key = tracer_with_constant_images_key
+        else:
+            self.tracer_with_constant_images_key = None
+
+        self.tracer_with_constant_images = tracer
+
+        return tracer
+
+    def hyper_noise_map_and_noise_normalization_from(
+        self, tracer, hyper_background_noise
+    ):
+        """Returns the hyper noise-map of the masked imaging for a tracer's hyper galaxies and a hyper background
+        noise, and its noise normalization.
+
+        The hyper noise-map is computed in the workspace and keyed by the parameters and hyper images of every hyper
+        galaxy and the noise scale of the hyper background noise. If the key is identical to that of the previous
+        call (e.g. in phases where the hyper components are fixed) the previous hyper noise-map and noise
+        normalization are returned without being recomputed.
+
+        Parameters
+        -----------
+        tracer : ray_tracing.Tracer
+            The tracer, whose hyper galaxies scale the noise-map.
+        hyper_background_noise : HyperBackgroundNoise
+            The hyper noise component which scales the background noise of the noise-map.
+        """
+        hyper_galaxies = [
+            galaxy
+            for plane in tracer.planes
+            for galaxy in plane.galaxies
+            if galaxy.has_hyper_galaxy
+        ]
+
+        hyper_noise_map_key = (
+            tuple(
+                (
+                    galaxy.hyper_galaxy.contribution_factor,
+                    galaxy.hyper_galaxy.noise_factor,
+                    galaxy.hyper_galaxy.noise_power,
+                    id(galaxy.hyper_model_image),
+                    id(galaxy.hyper_galaxy_image),
+                )
+                for galaxy in hyper_galaxies
+            ),
+            None
+            if hyper_background_noise is None
+            else hyper_background_noise.noise_scale,
+        )
+
+        if hyper_noise_map_key != self.hyper_noise_map_key:
+
+            noise_map = hyper_noise_map_from_noise_map_tracer_and_hyper_background_noise(
+                noise_map=self.masked_imaging.noise_map,
+                tracer=tracer,
+                hyper_background_noise=hyper_background_noise,
+                out=self.workspace.noise_map,
+                hyper_noise_limit=self.hyper_noise_limit,
+            )
+
+            self.hyper_noise_normalization = fit_util.noise_normalization_from(
+                noise_map=noise_map
+            )
+            self.hyper_noise_map_key = hyper_noise_map_key
+
+            # The hyper images are kept so that the identities in the key cannot be reused by different images.
+
+            self.hyper_noise_map_images = [
+                (galaxy.hyper_model_image, galaxy.hyper_galaxy_image)
+                for galaxy in hyper_galaxies
+            ]
+
+        return self.workspace.noise_map, self.hyper_noise_normalization
+
+    def figure_of_merit_from_tracer(
+        self,
+        tracer,
+        hyper_image_sky=None,
+        hyper_background_noise=None,
+        use_hyper_scaling=True,
+    ):
+        """Returns the figure of merit of the fit of a tracer to the masked imaging, which is identical to the
+        `figure_of_merit` of the `FitImaging` of the same inputs.
+
+        Parameters
+        -----------
+        tracer : ray_tracing.Tracer
+            The tracer, which describes the ray-tracing and strong lens configuration.
+        hyper_image_sky : HyperImageSky
+            The hyper sky component which scales the background sky of the image.
+        hyper_background_noise : HyperBackgroundNoise
+            The hyper noise component which scales the background noise of the noise-map.
+        use_hyper_scaling : bool
+            If False, the hyper galaxies, hyper sky and hyper background noise are not used.
+        """
+        workspace = self.workspace
+
+        image = self.masked_imaging.image
+        noise_map = self.masked_imaging.noise_map
+        noise_normalization = self.noise_normalization
+
+        if not use_hyper_scaling:
+
+            noise_map_inversion = noise_map
+
+        elif (
+            tracer.has_hyper_galaxy
+            or hyper_image_sky is not None
+            or hyper_background_noise is not None
+        ):
+
+            image = hyper_image_from_image_and_hyper_image_sky(
+                image=image, hyper_image_sky=hyper_image_sky
+            )
+
+            (
+                noise_map,
+                noise_normalization,
+            ) = self.hyper_noise_map_and_noise_normalization_from(
+                tracer=tracer, hyper_background_noise=hyper_background_noise
+            )
+
+            noise_map_inversion = noise_map
+
+        else:
+
+            noise_map_inversion = self.noise_map_limited
+
+        if self.use_constant_image_cache:
+            tracer = self.tracer_with_constant_images_from(tracer=tracer)
+
+        with tracer.trace_cache_scope():
+
+            model_image = tracer.blurred_image_from_grid_and_convolver(
+                grid=self.masked_imaging.grid,
+                convolver=self.masked_imaging.convolver,
+                blurring_grid=self.masked_imaging.blurring_grid,
+                out=workspace.blurred_image,
+                workspace=workspace,
+            )
+
+            if tracer.has_pixelization:
+
+                np.subtract(image, model_image, out=workspace.profile_subtracted_image)
+
+                inversion = tracer.inversion_imaging_from_grid_and_data(
+                    grid=self.masked_imaging.grid_inversion,
+                    image=workspace.profile_subtracted_image,
+                    noise_map=noise_map_inversion,
+                    convolver=self.masked_imaging.convolver,
+                    settings_pixelization=self.settings_pixelization,
+                    settings_inversion=self.settings_inversion,
+                )
+
+                np.add(
+                    model_image,
+                    inversion_util.mapped_reconstructed_data_from(
+                        mapping_matrix=inversion.blurred_mapping_matrix,
+                        reconstruction=inversion.reconstruction,
+                    ),
+                    out=workspace.model_image,
+                )
+
+                model_image = workspace.model_image
+
+            else:
+
+                inversion = None
+
+        chi_squared_map = workspace.chi_squared_map
+
+        np.subtract(image, model_image, out=chi_squared_map)
+        np.divide(chi_squared_map, noise_map, out=chi_squared_map)
+        np.square(chi_squared_map, out=chi_squared_map)
+
+        chi_squared = fit_util.chi_squared_from(chi_squared_map=chi_squared_map)
+
+        if inversion is None:
+            return fit_util.log_likelihood_from(
+                chi_squared=chi_squared, noise_normalization=noise_normalization
+            )
+
+        return fit_util.log_evidence_from(
+            chi_squared=chi_squared,
+            regularization_term=inversion.regularization_term,
+            log_curvature_regularization_term=inversion.log_det_curvature_reg_matrix_term,
+            log_regularization_term=inversion.log_det_regularization_matrix_term,
+            noise_normalization=noise_normalization,
+        )
+
+
 class FitInterferometer(aa_fit.FitInterferometer):
     def __init__(
         self,
@@ -222,35 +853,40 @@ class FitInterferometer(aa_fit.FitInterferometer):
 
         self.tracer = tracer
 
-        self.profile_visibilities = tracer.profile_visibilities_from_grid_and_transformer(
-            grid=masked_interferometer.grid,
-            transformer=masked_interferometer.transformer,
-        )
-
-        self.profile_subtracted_visibilities = (
-            masked_interferometer.visibilities - self.profile_visibilities
-        )
-
-        if not tracer.has_pixelization:
-
-            inversion = None
-            model_visibilities = self.profile_visibilities
+        self.trace_cache = ray_tracing.TraceCache()
 
-        else:
+        with tracer.trace_cache_scope(trace_cache=self.trace_cache):
 
-            inversion = tracer.inversion_interferometer_from_grid_and_data(
-                grid=masked_interferometer.grid_inversion,
-                visibilities=self.profile_subtracted_visibilities,
-                noise_map=noise_map,
+            self.profile_visibilities = tracer.profile_visibilities_from_grid_and_transformer(
+                grid=masked_interferometer.grid,
                 transformer=masked_interferometer.transformer,
-                settings_pixelization=settings_pixelization,
-                settings_inversion=settings_inversion,
             )
 
-            model_visibilities = (
-                self.profile_visibilities + inversion.mapped_reconstructed_visibilities
+            self.profile_subtracted_visibilities = (
+                masked_interferometer.visibilities - self.profile_visibilities
             )
 
+            if not tracer.has_pixelization:
+
+                inversion = None
+                model_visibilities = self.profile_visibilities
+
+            else:
+
+                inversion = tracer.inversion_interferometer_from_grid_and_data(
+                    grid=masked_interferometer.grid_inversion,
+                    visibilities=self.profile_subtracted_visibilities,
+                    noise_map=noise_map,
+                    transformer=masked_interferometer.transformer,
+                    settings_pixelization=settings_pixelization,
+                    settings_inversion=settings_inversion,
+                )
+
+                model_visibilities = (
+                    self.profile_visibilities
+                    + inversion.mapped_reconstructed_visibilities
+                )
+
         super().__init__(
             masked_interferometer=masked_interferometer,
             model_visibilities=model_visibilities,
@@ -262,7 +898,15 @@ class FitInterferometer(aa_fit.FitInterferometer):
     def grid(self):
         return self.masked_interferometer.grid
 
-    @property
+    def release_cache(self):
+        """
+        Release the cached derived products of the fit (e.g. `galaxy_model_visibilities_dict`) and the grids traced
+        by its tracer. Products accessed afterwards are recomputed.
+        """
+        self._cached_products = {}
+        self.trace_cache.clear()
+
+    @cached_product
     def galaxy_model_image_dict(self) -> {g.Galaxy: np.ndarray}:
         """
         A dictionary associating galaxies with their corresponding model images
@@ -289,7 +933,7 @@ class FitInterferometer(aa_fit.FitInterferometer):
 
         return galaxy_model_image_dict
 
-    @property
+    @cached_product
     def galaxy_model_visibilities_dict(self) -> {g.Galaxy: np.ndarray}:
         """
         A dictionary associating galaxies with their corresponding model images
@@ -313,6 +957,7 @@ class FitInterferometer(aa_fit.FitInterferometer):
 
         return galaxy_model_visibilities_dict
 
+    @cached_product
     def model_visibilities_of_planes(self):
 
         model_visibilities_of_planes = self.tracer.profile_visibilities_of_planes_from_grid_and_transformer(
@@ -333,6 +978,37 @@ class FitInterferometer(aa_fit.FitInterferometer):
         return len(list(filter(None, self.tracer.regularizations_of_planes)))
 
 
+def galaxy_with_light_profiles_replaced_from(galaxy, light_profile_image_caches):
+    """
+    Returns a shallow copy of a galaxy whose light profiles are replaced by their input `LightProfileImageCache`,
+    which shares the galaxy's other profiles, pixelization and hyper components. If the galaxy has none of the
+    cached light profiles it is returned unchanged.
+
+    Parameters
+    ----------
+    galaxy : Galaxy
+        The galaxy which is copied.
+    light_profile_image_caches : [LightProfileImageCache]
+        The caches whose light profiles are replaced in the copy, if the galaxy has them.
+    """
+    replacements = {
+        key: image_cache
+        for key, value in galaxy.__dict__.items()
+        for image_cache in light_profile_image_caches
+        if value is image_cache.light_profile
+    }
+
+    if not replacements:
+        return galaxy
+
+    galaxy = copy.copy(galaxy)
+
+    for key, image_cache in replacements.items():
+        setattr(galaxy, key, image_cache)
+
+    return galaxy
+
+
 def hyper_image_from_image_and_hyper_image_sky(image, hyper_image_sky):
 
     if hyper_image_sky is not None:
@@ -342,11 +1018,27 @@ def hyper_image_from_image_and_hyper_image_sky(image, hyper_image_sky):
 
 
 def hyper_noise_map_from_noise_map_tracer_and_hyper_background_noise(
-    noise_map, tracer, hyper_background_noise
+    noise_map, tracer, hyper_background_noise, out=None, hyper_noise_limit=None
 ):
 
+    if hyper_noise_limit is None:
+        hyper_noise_limit = conf.instance["general"]["hyper"]["hyper_noise_limit"]
+
     hyper_noise_map = tracer.hyper_noise_map_from_noise_map(noise_map=noise_map)
 
+    if out is not None:
+
+        if hyper_background_noise is not None:
+            np.add(noise_map, hyper_background_noise.noise_scale, out=out)
+        else:
+            np.copyto(out, noise_map)
+
+        if hyper_noise_map is not None:
+            np.add(out, hyper_noise_map, out=out)
+            np.minimum(out, hyper_noise_limit, out=out)
+
+        return out
+
     if hyper_background_noise is not None:
         noise_map = hyper_background_noise.hyper_noise_map_from_noise_map(
             noise_map=noise_map
@@ -354,7 +1046,6 @@ def hyper_noise_map_from_noise_map_tracer_and_hyper_background_noise(
 
     if hyper_noise_map is not None:
         noise_map = noise_map + hyper_noise_map
-        noise_map_limit = conf.instance["general"]["hyper"]["hyper_noise_limit"]
-        noise_map[noise_map > noise_map_limit] = noise_map_limit
+        noise_map[noise_map > hyper_noise_limit] = hyper_noise_limit
 
     return noise_map
@@ -97,12 +97,21 @@ class FitPositionsImage(FitData):
         """
 
         self.positions_solver = positions_solver
-        self.model_positions_all = positions_solver.solve_from_tracer(tracer=tracer)
+
+        (
+            self.model_positions_all,
+            magnifications_all,
+            _,
+        ) = positions_solver.solve_from_tracer(tracer=tracer, positions=positions)
 
         model_positions = self.model_positions_all.grid_of_closest_from_grid_pair(
             grid_pair=positions
         )
 
+        self.model_magnifications = self.model_magnifications_from(
+            magnifications_all=magnifications_all, positions=positions
+        )
+
         super().__init__(
             data=positions,
             noise_map=noise_map,
@@ -111,6 +120,42 @@ class FitPositionsImage(FitData):
             inversion=None,
         )
 
+    def model_magnifications_from(self, magnifications_all, positions):
+        """The magnifications the positions solver returned for the model positions paired to every observed position,
+        which are reused by `FitFluxes` to avoid recomputing them. None is returned if the solver did not compute them.
+
+        Parameters
+        ----------
+        magnifications_all : arrays.ValuesIrregularGrouped
+            The magnifications of every model position, grouped following `model_positions_all`.
+        positions : grids.GridIrregularGrouped
+            The observed (y,x) positions the model positions are paired to.
+        """
+        if magnifications_all is None:
+            return None
+
+        model_magnifications = []
+
+        for model_positions, magnifications, grouped_positions in zip(
+            self.model_positions_all.in_grouped_list,
+            magnifications_all.in_grouped_list,
+            positions.in_grouped_list,
+        ):
+
+            distances = np.sum(
+                np.square(
+                    np.asarray(grouped_positions)[:, None, :]
+                    - np.asarray(model_positions)[None, :, :]
+                ),
+                axis=2,
+            )
+
+            model_magnifications.append(
+                list(np.asarray(magnifications)[np.argmin(distances, axis=1)])
+            )
+
+        return arrays.ValuesIrregularGrouped(values=model_magnifications)
+
     @property
     def positions(self):
         return self.data
@@ -126,16 +171,21 @@ class FitPositionsImage(FitData):
 
 
 class FitFluxes(FitData):
-    def __init__(self, fluxes, noise_map, positions, tracer):
+    def __init__(self, fluxes, noise_map, positions, tracer, magnifications=None):
 
         # TODO : The fluxes, positions etc that come into here will be IrregularGrouped structures with dictionary inputs.
         # TODO : We need them as numpy array sso that we caninherit and subtract efficiently. Easy to do.
         # TODO : These can be generated from PointSourceData classes.
 
+        # The magnifications computed by the positions solver (see `FitPositionsImage.model_magnifications`) can be
+        # input, which are those of the model positions paired to the positions computed with a finite-difference
+        # buffer of the solver's final pixel scale. Otherwise they are computed at the positions.
+
+        if magnifications is None:
+            magnifications = tracer.magnification_irregular_from_grid(grid=positions)
+
         self.positions = positions
-        self.magnifications = abs(
-            tracer.magnification_irregular_from_grid(grid=positions)
-        )
+        self.magnifications = abs(magnifications)
 
         model_fluxes = arrays.ValuesIrregularGrouped(
             values=[
@@ -0,0 +1,295 @@
+import numpy as np
+from autogalaxy.profiles.mass_profiles import dark_mass_profiles as dmp
+from autogalaxy.profiles.mass_profiles import total_mass_profiles as tmp
+
+
+def total_mass_and_extent_from(mass_profile):
+    """
+    Returns the total angular mass of a mass profile with a finite mass and the radius beyond which its deflection
+    angles are approximated as those of a point mass of this total mass, or (None, None) if the profile's mass is
+    infinite (e.g. an isothermal profile) or it is not spherical.
+
+    The angular mass M is the integral of the convergence, such that the deflection angle of a point mass at
+    distance r is M / (pi * r), where a `PointMass` has M = pi * einstein_radius ** 2.
+
+    For a `SphericalTruncatedNFW` the total mass is the limit of the truncated NFW deflection angles at infinity and
+    the extent is its truncation radius, outside which its density falls off as r ** -5.
+
+    Parameters
+    ----------
+    mass_profile : MassProfile
+        The mass profile whose total mass and extent are computed.
+    """
+    if isinstance(mass_profile, tmp.PointMass):
+        return np.pi * mass_profile.einstein_radius ** 2.0, 0.0
+
+    if isinstance(mass_profile, dmp.SphericalTruncatedNFW):
+
+        tau = mass_profile.tau
+
+        total_mass = (
+            4.0
+            * np.pi
+            * mass_profile.kappa_s
+            * mass_profile.scale_radius ** 2.0
+            * (tau ** 2.0 / (tau ** 2.0 + 1.0) ** 2.0)
+            * (((tau ** 2.0 - 1.0) * np.log(tau)) + (tau * np.pi) - (tau ** 2.0 + 1.0))
+        )
+
+        return total_mass, mass_profile.truncation_radius
+
+    return None, None
+
+
+class DeflectionsTreeNode:
+    def __init__(self, mass_profile_indexes, children, centre, extent, multipoles):
+        """
+        A node of a `DeflectionsTree`, which groups the mass profiles within one cell of the quadtree.
+
+        Parameters
+        ----------
+        mass_profile_indexes : np.ndarray
+            The indexes of the mass profiles grouped by this node.
+        children : [DeflectionsTreeNode]
+            The nodes of the non-empty sub-cells of this node's cell, which is empty for a leaf node.
+        centre : complex
+            The centre of mass (x + iy) of the node's mass profiles, which the multipole expansion is about.
+        extent : float
+            The radius about the centre of mass enclosing all mass profiles of the node and their extents.
+        multipoles : np.ndarray
+            The complex multipole coefficients a_k = sum_i(M_i * (w_i - centre) ** k) of the node's mass profiles.
+        """
+        self.mass_profile_indexes = mass_profile_indexes
+        self.children = children
+        self.centre = centre
+        self.extent = extent
+        self.multipoles = multipoles
+
+    def deflections_from_complex_grid(self, complex_grid):
+        """
+        Returns the deflection angles of the node's mass profiles at (x + iy) coordinates far from the node, using
+        the multipole expansion:
+
+        alpha_x + i * alpha_y = conj(sum_k(a_k / z ** (k + 1))) / pi
+
+        where z is the coordinate relative to the node's centre of mass.
+        """
+        z = complex_grid - self.centre
+
+        inverse_z = 1.0 / z
+        inverse_z_power = inverse_z.copy()
+
+        deflections = np.zeros(shape=z.shape, dtype="complex")
+
+        for multipole in self.multipoles:
+            deflections += multipole * inverse_z_power
+            inverse_z_power *= inverse_z
+
+        return np.conj(deflections) / np.pi
+
+
+class DeflectionsTree:
+    def __init__(
+        self, mass_profiles, opening_angle=0.5, expansion_order=4, leaf_size=8
+    ):
+        """
+        Computes the summed deflection angles of many mass profiles (e.g. a plane of line-of-sight halos) using a
+        Barnes-Hut quadtree, which scales as O(N_pix log N_halo) as opposed to the O(N_pix N_halo) direct sum.
+
+        Mass profiles with a finite total mass (see `total_mass_and_extent_from`) are grouped into a quadtree of
+        cells. For every (y,x) coordinate, a cell whose extent is small compared to its distance from the coordinate
+        (extent / distance < opening_angle) has the deflection angles of all its mass profiles approximated by a
+        multipole expansion about its centre of mass. Cells near a coordinate are opened, with the mass profiles of
+        leaf cells near the coordinate evaluated exactly. Mass profiles with infinite mass (e.g. the main lens) are
+        always evaluated exactly.
+
+        Parameters
+        ----------
+        mass_profiles : [MassProfile]
+            The mass profiles whose deflection angles are summed.
+        opening_angle : float
+            The accuracy parameter of the tree, where smaller values open more cells and evaluate more mass profiles
+            exactly. The error of the multipole expansion scales as opening_angle ** (expansion_order + 1), and that
+            of approximating a truncated profile as a point mass as opening_angle ** 2.
+        expansion_order : int
+            The highest order of the multipole expansion of every cell (0 is a monopole).
+        leaf_size : int
+            The maximum number of mass profiles in a leaf cell of the quadtree.
+        """
+
+        self.mass_profiles = mass_profiles
+        self.opening_angle = opening_angle
+        self.expansion_order = expansion_order
+        self.leaf_size = leaf_size
+
+        total_masses = []
+        extents = []
+        tree_mass_profile_indexes = []
+        self.exact_mass_profile_indexes = []
+
+        for mass_profile_index, mass_profile in enumerate(mass_profiles):
+
+            total_mass, extent = total_mass_and_extent_from(mass_profile=mass_profile)
+
+            if total_mass is None:
+                self.exact_mass_profile_indexes.append(mass_profile_index)
+            else:
+                tree_mass_profile_indexes.append(mass_profile_index)
+                total_masses.append(total_mass)
+                extents.append(extent)
+
+        self.total_masses = np.zeros(shape=len(mass_profiles))
+        self.extents = np.zeros(shape=len(mass_profiles))
+        self.total_masses[tree_mass_profile_indexes] = total_masses
+        self.extents[tree_mass_profile_indexes] = extents
+
+        self.complex_centres = np.array(
+            [
+                mass_profile.centre[1] + 1j * mass_profile.centre[0]
+                for mass_profile in mass_profiles
+            ],
+            dtype="complex",
+        )
+
+        if tree_mass_profile_indexes:
+
+            centres = self.complex_centres[tree_mass_profile_indexes]
+
+            box_centre = 0.5 * (np.max(centres.real) + np.min(centres.real)) + 0.5j * (
+                np.max(centres.imag) + np.min(centres.imag)
+            )
+            box_half_width = 0.5 * max(
+                np.ptp(centres.real), np.ptp(centres.imag), 1.0e-8
+            )
+
+            self.root = self.node_from(
+                mass_profile_indexes=np.asarray(tree_mass_profile_indexes),
+                box_centre=box_centre,
+                box_half_width=box_half_width,
+            )
+        else:
+            self.root = None
+
+    def node_from(self, mass_profile_indexes, box_centre, box_half_width):
+        """
+        Recursively build the quadtree node of the mass profiles within a square cell, splitting the cell into
+        four sub-cells until it contains `leaf_size` or fewer mass profiles.
+        """
+        masses = self.total_masses[mass_profile_indexes]
+        centres = self.complex_centres[mass_profile_indexes]
+
+        total_mass = np.sum(masses)
+
+        if total_mass > 0.0:
+            centre = np.sum(masses * centres) / total_mass
+        else:
+            centre = np.mean(centres)
+
+        extent = np.max(np.abs(centres - centre) + self.extents[mass_profile_indexes])
+
+        multipoles = np.array(
+            [
+                np.sum(masses * (centres - centre) ** order)
+                for order in range(self.expansion_order + 1)
+            ]
+        )
+
+        children = []
+
+        if len(mass_profile_indexes) > self.leaf_size and box_half_width > 1.0e-8:
+
+            in_upper_half = centres.imag >= box_centre.imag
+            in_right_half = centres.real >= box_centre.real
+
+            for is_upper in (True, False):
+                for is_right in (True, False):
+
+                    in_sub_cell = (in_upper_half == is_upper) & (
+                        in_right_half == is_right
+                    )
+
+                    if not np.any(in_sub_cell):
+                        continue
+
+                    children.append(
+                        self.node_from(
+                            mass_profile_indexes=mass_profile_indexes[in_sub_cell],
+                            box_centre=box_centre
+                            + 0.5
+                            * box_half_width
+                            * ((1.0 if is_right else -1.0) + (1j if is_upper else -1j)),
+                            box_half_width=0.5 * box_half_width,
+                        )
+                    )
+
+        return DeflectionsTreeNode(
+            mass_profile_indexes=mass_profile_indexes,
+            children=children,
+            centre=centre,
+            extent=extent,
+            multipoles=multipoles,
+        )
+
+    def deflections_from_grid(self, grid):
+        """
+        Returns the summed deflection angles of every mass profile on a grid of (y,x) coordinates.
+
+        The tree is traversed once per cell for all coordinates at once, where the coordinates far from a cell use
+        its multipole expansion and the remaining coordinates are passed to its children (or, for a leaf cell, have
+        the deflection angles of its mass profiles evaluated exactly).
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y,x) coordinates the deflection angles are computed on.
+        """
+        deflections = np.zeros(shape=(grid.shape[0], 2))
+
+        for mass_profile_index in self.exact_mass_profile_indexes:
+            deflections += self.mass_profiles[mass_profile_index].deflections_from_grid(
+                grid=grid
+            )
+
+        if self.root is None:
+            return deflections
+
+        grid = np.asarray(grid)
+
+        complex_grid = grid[:, 1] + 1j * grid[:, 0]
+
+        nodes_and_pixel_indexes = [(self.root, np.arange(grid.shape[0]))]
+
+        while nodes_and_pixel_indexes:
+
+            node, pixel_indexes = nodes_and_pixel_indexes.pop()
+
+            distances = np.abs(complex_grid[pixel_indexes] - node.centre)
+
+            is_far = node.extent < self.opening_angle * distances
+
+            if np.any(is_far):
+
+                far_pixel_indexes = pixel_indexes[is_far]
+
+                far_deflections = node.deflections_from_complex_grid(
+                    complex_grid=complex_grid[far_pixel_indexes]
+                )
+
+                deflections[far_pixel_indexes, 0] += far_deflections.imag
+                deflections[far_pixel_indexes, 1] += far_deflections.real
+
+            near_pixel_indexes = pixel_indexes[~is_far]
+
+            if near_pixel_indexes.shape[0] == 0:
+                continue
+
+            if node.children:
+                for child in node.children:
+                    nodes_and_pixel_indexes.append((child, near_pixel_indexes))
+            else:
+                for mass_profile_index in node.mass_profile_indexes:
+                    deflections[near_pixel_indexes] += self.mass_profiles[
+                        mass_profile_index
+                    ].deflections_from_grid(grid=grid[near_pixel_indexes])
+
+        return deflections
@@ -1,6 +1,10 @@
 from autoarray import decorator_util
+import itertools
+import json
+import multiprocessing
 import numpy as np
-from autoarray.structures import grids
+import time
+from autoarray.structures import arrays, grids
 
 
 class AbstractPositionsSolver:
@@ -19,22 +23,80 @@ class AbstractPositionsSolver:
         self.distance_from_source_centre = distance_from_source_centre
         self.distance_from_mass_profile_centre = distance_from_mass_profile_centre
 
-    def grid_with_points_below_magnification_threshold_removed(self, lensing_obj, grid):
+        self.magnifications = None
+        self.parities = None
+
+    def magnifications_and_parities_from(self, lensing_obj, grid, buffer):
+        """Compute the magnification and parity of every (y,x) coordinate of a grid, where the Jacobian of the lens
+        equation is computed via central finite differences of the lensing object's deflection angles (as in
+        `magnification_irregular_from_grid`).
+
+        The deflection angles of the 4 offsets of every coordinate are computed in one call to the lensing object.
+        The parity of a coordinate is the sign of the determinant of its Jacobian, which is +1 for images which
+        preserve the orientation of the source and -1 for images which invert it.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        grid : autoarray.GridIrregularGroupedUniform or ndarray
+            The (y,x) coordinates whose magnifications and parities are computed.
+        buffer : float
+            The offset of the (y,x) coordinates used to compute the Jacobian.
+        """
+        grid = np.asarray(grid).reshape(-1, 2)
+
+        offsets = np.array(
+            [[buffer, 0.0], [-buffer, 0.0], [0.0, -buffer], [0.0, buffer]]
+        )
 
-        magnifications = np.abs(
-            lensing_obj.magnification_irregular_from_grid(
-                grid=grid, buffer=grid.pixel_scale
+        deflections = np.asarray(
+            lensing_obj.deflections_from_grid(
+                grid=(grid[None, :, :] + offsets[:, None, :]).reshape(-1, 2)
             )
+        ).reshape(4, grid.shape[0], 2)
+
+        deflections_up = deflections[0]
+        deflections_down = deflections[1]
+        deflections_left = deflections[2]
+        deflections_right = deflections[3]
+
+        shear_yy = 0.5 * (deflections_up[:, 0] - deflections_down[:, 0]) / buffer
+        shear_xy = 0.5 * (deflections_up[:, 1] - deflections_down[:, 1]) / buffer
+        shear_yx = 0.5 * (deflections_right[:, 0] - deflections_left[:, 0]) / buffer
+        shear_xx = 0.5 * (deflections_right[:, 1] - deflections_left[:, 1]) / buffer
+
+        det_A = (1 - shear_xx) * (1 - shear_yy) - shear_xy * shear_yx
+
+        return 1.0 / det_A, np.sign(det_A).astype("int")
+
+    def grid_with_points_below_magnification_threshold_removed(self, lensing_obj, grid):
+        """Remove all coordinates from a grid whose absolute magnification is below the magnification_threshold.
+
+        The magnifications and parities of the retained coordinates are stored as the `magnifications` and
+        `parities` attributes, such that after a solve they are those of the returned positions.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        grid : autoarray.GridIrregularGroupedUniform
+            The (y,x) coordinates which are removed if their magnification is below the threshold, where the
+            pixel-scale of the grid is the buffer used to compute the magnifications.
+        """
+        magnifications, parities = self.magnifications_and_parities_from(
+            lensing_obj=lensing_obj, grid=grid, buffer=grid.pixel_scale
         )
 
-        grid_mag = []
+        mask = np.abs(magnifications) > self.magnification_threshold
 
-        for index, magnification in enumerate(magnifications):
-            if magnification > self.magnification_threshold:
-                grid_mag.append(grid[index, :])
+        self.magnifications = magnifications[mask]
+        self.parities = parities[mask]
 
         return grids.GridIrregularGroupedUniform(
-            grid=grid_mag, pixel_scales=grid.pixel_scales
+            grid=np.asarray(grid).reshape(-1, 2)[mask], pixel_scales=grid.pixel_scales
         )
 
     def grid_with_coordinates_from_mass_profile_centre_removed(self, lensing_obj, grid):
@@ -134,7 +196,26 @@ class AbstractPositionsSolver:
             ),
         )
 
-    def grid_peaks_from(self, lensing_obj, grid, source_plane_coordinate):
+    def source_plane_grid_from(self, lensing_obj, grid):
+        """Ray-trace a grid of (y,x) coordinates to the source-plane using the deflection angles of the lensing object.
+
+        The traced grid does not depend on the source-plane coordinate whose multiple images are solved for, thus it
+        can be computed once and passed to `grid_peaks_from` for every source-plane coordinate.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        grid : autoarray.GridIrregularGroupedUniform or ndarray
+            The grid of (y,x) Cartesian coordinates which is ray-traced to the source-plane.
+        """
+        deflections = lensing_obj.deflections_from_grid(grid=grid)
+        return grid.grid_from_deflection_grid(deflection_grid=deflections)
+
+    def grid_peaks_from(
+        self, lensing_obj, grid, source_plane_coordinate, source_plane_grid=None
+    ):
         """Find the 'peaks' of a grid of coordinates, where a peak corresponds to a (y,x) coordinate on the grid which
         traces closer to the input (y,x) source-plane coordinate than any of its 8 adjacent neighbors. This is
         performed by:
@@ -159,20 +240,23 @@ class AbstractPositionsSolver:
         source_plane_coordinate : (y,x)
             The (y,x) coordinate in the source-plane pixels that the distance of traced grid coordinates are computed
             for.
+        source_plane_grid : Grid
+            The grid ray-traced to the source-plane (see `source_plane_grid_from`). If None, it is computed using the
+            lensing object, otherwise steps 1) and 2) are skipped.
         """
-        deflections = lensing_obj.deflections_from_grid(grid=grid)
-        source_plane_grid = grid.grid_from_deflection_grid(deflection_grid=deflections)
+        if source_plane_grid is None:
+            source_plane_grid = self.source_plane_grid_from(
+                lensing_obj=lensing_obj, grid=grid
+            )
+
         source_plane_distances = source_plane_grid.distances_from_coordinate(
             coordinate=source_plane_coordinate
         )
 
-        neighbors, has_neighbors = grid_square_neighbors_1d_from(shape_1d=grid.shape[0])
-
-        grid_peaks = grid_peaks_from(
-            distance_1d=source_plane_distances,
-            grid_1d=grid,
-            neighbors=neighbors.astype("int"),
-            has_neighbors=has_neighbors,
+        grid_peaks = grids_peaks_from(
+            distance_1d=np.asarray(source_plane_distances),
+            grid_1d=np.asarray(grid),
+            total_grids=1,
         )
 
         return grids.GridIrregularGroupedUniform(
@@ -226,6 +310,101 @@ class AbstractPositionsSolver:
             grid=grid_within_distance_of_centre, pixel_scales=grid.pixel_scales
         )
 
+    def solve_catalogue(
+        self,
+        lensing_objs,
+        source_plane_coordinates,
+        file_path,
+        processes=1,
+        chunk_size=10,
+    ):
+        """Solve for the multiple images of a catalogue of (lensing object, source-plane coordinate) pairs, for example
+        the tracers and source positions of a simulation campaign, writing the results to a file as they are solved.
+
+        The pairs are distributed over a pool of `processes` processes in chunks of `chunk_size` pairs. The input
+        iterables are consumed in batches of `processes * chunk_size` pairs, such that they may be generators (e.g.
+        `Tracer.generator_from_compact_files`) which are never fully held in memory. Every pair is solved with
+        `solve` by a copy of this solver, thus every result is identical to solving the pairs one by one.
+
+        The results are written to `file_path` in the line-delimited .json format, where every line is the
+        dictionary of one pair (see `catalogue_entry_from`) in the order of the input pairs. Floats are written
+        with their shortest exact representation, such that reading them back gives identical values.
+
+        Parameters
+        ----------
+        lensing_objs : iterable of autogalaxy.LensingObject
+            The lensing objects (e.g. tracers) of the catalogue.
+        source_plane_coordinates : iterable of (float, float)
+            The source-plane coordinate whose multiple images are solved for with each lensing object.
+        file_path : str
+            The path of the line-delimited .json file the results are written to.
+        processes : int
+            The number of processes the pairs are solved on. If 1, they are solved in this process.
+        chunk_size : int
+            The number of pairs sent to a process at once.
+
+        Returns
+        -------
+        (int, float)
+            The number of pairs solved and the throughput in pairs solved per second.
+        """
+        pairs = zip(lensing_objs, source_plane_coordinates)
+
+        batch_size = processes * chunk_size
+
+        if processes > 1:
+            pool = multiprocessing.Pool(
+                processes=processes,
+                initializer=catalogue_worker_initializer,
+                initargs=(self,),
+            )
+        else:
+            pool = None
+
+        total_solves = 0
+
+        start = time.time()
+
+        try:
+
+            with open(file_path, "w") as f:
+
+                while True:
+
+                    batch = list(itertools.islice(pairs, batch_size))
+
+                    if len(batch) == 0:
+                        break
+
+                    if pool is not None:
+                        entries = pool.map(
+                            catalogue_worker_entry_from, batch, chunksize=chunk_size
+                        )
+                    else:
+                        entries = [
+                            catalogue_entry_from(
+                                solver=self,
+                                lensing_obj=lensing_obj,
+                                source_plane_coordinate=source_plane_coordinate,
+                            )
+                            for lensing_obj, source_plane_coordinate in batch
+                        ]
+
+                    for entry in entries:
+                        entry["index"] = total_solves
+                        f.write(json.dumps(entry) + "\n")
+                        total_solves += 1
+
+                    f.flush()
+
+        finally:
+
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        return total_solves, total_solves / max(time.time() - start, 1.0e-12)
+
 
 class PositionsSolver(AbstractPositionsSolver):
     def __init__(
@@ -237,6 +416,10 @@ class PositionsSolver(AbstractPositionsSolver):
         magnification_threshold=0.0,
         distance_from_source_centre=None,
         distance_from_mass_profile_centre=None,
+        use_warm_start=False,
+        warm_start_buffer=4,
+        adaptive_grid_levels=None,
+        adaptive_grid_buffer=0.5,
     ):
         """Given a `LensingObject` (e.g. a _MassProfile, `Galaxy`, `Plane` or _Tracer_) this class uses their
         deflections_from_grid method to determine the (y,x) coordinates the multiple-images appear given a (y,x)
@@ -260,6 +443,33 @@ class PositionsSolver(AbstractPositionsSolver):
           - Image pixels which do not correspond to genuine multiple images may be detected as they meet the peak
             criteria. This can occurance in certain circumstances where a non-multiple image still traces closer than its
             8 neighbors. Depending on how the `PositionFinder` is being used these can be removed.
+
+        If `use_warm_start` is True, `solve_from_tracer` seeds every solve with the positions it found the previous
+        time it was called and the observed positions (if input). The peak pixels are then first searched for on
+        small grids around these seeds, which are (2 * warm_start_buffer + 1) pixels across at the resolution of
+        the initial grid. The full initial grid is only used if this does not recover the expected number of
+        images. This is faster when the solver is called for many similar lensing objects, for example the tracers
+        of successive samples of a non-linear search.
+
+        If `adaptive_grid_levels` is input, the whole initial grid is not ray-traced in step 1). Instead, it is
+        covered by square cells which are 2 ** adaptive_grid_levels pixels across, whose corners are ray-traced
+        to the source-plane. Only cells whose ray-traced corners could contain the source-plane coordinate are
+        subdivided into 4 cells, until the cells are 1 pixel across (see `adaptive_grid_from`). The peak pixels are
+        then found amongst the corners of the remaining cells, such that the number of deflection angle calculations
+        scales with the area around the multiple images rather than the area of the initial grid.
+
+        Parameters
+        ----------
+        use_warm_start : bool
+            If True, the solutions of every call to `solve_from_tracer` seed the next call.
+        warm_start_buffer : int
+            The number of pixels of the initial grid the warm-start grids extend either side of every seed.
+        adaptive_grid_levels : int
+            The number of times the cells of the adaptive initial grid are subdivided. If None, every pixel of the
+            initial grid is ray-traced.
+        adaptive_grid_buffer : float
+            The cells of the adaptive grid are retained if the bounding box of their ray-traced corners, expanded on
+            every side by this fraction of its largest extent, contains the source-plane coordinate.
         """
 
         super(PositionsSolver, self).__init__(
@@ -273,6 +483,139 @@ class PositionsSolver(AbstractPositionsSolver):
         self.grid = grid.in_1d_binned
         self.pixel_scale_precision = pixel_scale_precision
 
+        self.use_warm_start = use_warm_start
+        self.warm_start_buffer = warm_start_buffer
+        self.warm_start_solutions = []
+
+        self.adaptive_grid_levels = adaptive_grid_levels
+        self.adaptive_grid_buffer = adaptive_grid_buffer
+
+    def adaptive_grid_from(self, lensing_obj, source_plane_coordinate):
+        """Returns the (y,x) coordinates of the pixels of the initial grid which may be near a multiple image of a
+        source-plane coordinate, by ray-tracing an adaptive grid of square cells.
+
+        The initial grid is covered by cells which are 2 ** adaptive_grid_levels pixels across, whose corners are
+        pixels of the initial grid. The corners of every cell are ray-traced to the source-plane and a cell is retained
+        if the bounding box of its ray-traced corners (expanded by `adaptive_grid_buffer`) contains the source-plane
+        coordinate. Every retained cell is subdivided into 4 cells and the process is repeated until the cells are 1
+        pixel across. Corners shared by neighboring cells are ray-traced once.
+
+        The returned pixels are the corners of the retained cells which are not on the edge of the initial grid,
+        for which the peak pixel criteria can be evaluated.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane whose multiple images are solved for.
+        """
+        grid = np.asarray(self.grid)
+        pixel_scale = self.grid.pixel_scale
+
+        y_max = np.max(grid[:, 0])
+        x_min = np.min(grid[:, 1])
+
+        shape_2d = (
+            int(np.round((y_max - np.min(grid[:, 0])) / pixel_scale)) + 1,
+            int(np.round((np.max(grid[:, 1]) - x_min) / pixel_scale)) + 1,
+        )
+
+        cell_size = 2 ** self.adaptive_grid_levels
+        key_width = shape_2d[1] + cell_size
+
+        corner_offsets = np.array([[0, 0], [0, 1], [1, 1], [1, 0]])
+
+        cells = np.stack(
+            np.meshgrid(
+                np.arange(0, shape_2d[0] - 1, cell_size),
+                np.arange(0, shape_2d[1] - 1, cell_size),
+                indexing="ij",
+            ),
+            axis=-1,
+        ).reshape(-1, 2)
+
+        while True:
+
+            corners = cells[:, None, :] + cell_size * corner_offsets[None, :, :]
+
+            keys, inverse = np.unique(
+                corners[:, :, 0] * key_width + corners[:, :, 1], return_inverse=True
+            )
+
+            coordinates = np.stack(
+                (
+                    y_max - (keys // key_width) * pixel_scale,
+                    x_min + (keys % key_width) * pixel_scale,
+                ),
+                axis=-1,
+            )
+
+            traced_coordinates = coordinates - np.asarray(
+                lensing_obj.deflections_from_grid(grid=coordinates)
+            )
+
+            cells = cells[
+                triangles_near_coordinate_from(
+                    triangles=traced_coordinates[inverse.reshape(-1, 4)],
+                    coordinate=source_plane_coordinate,
+                    buffer=self.adaptive_grid_buffer,
+                )
+            ]
+
+            if cell_size == 1:
+                break
+
+            cell_size = cell_size // 2
+
+            cells = (
+                cells[:, None, :] + cell_size * corner_offsets[None, :, :]
+            ).reshape(-1, 2)
+
+        corners = np.unique(
+            (cells[:, None, :] + corner_offsets[None, :, :]).reshape(-1, 2), axis=0
+        )
+
+        corners = corners[
+            (corners[:, 0] > 0)
+            & (corners[:, 0] < shape_2d[0] - 1)
+            & (corners[:, 1] > 0)
+            & (corners[:, 1] < shape_2d[1] - 1)
+        ]
+
+        return np.stack(
+            (y_max - corners[:, 0] * pixel_scale, x_min + corners[:, 1] * pixel_scale),
+            axis=-1,
+        )
+
+    def grid_peaks_adaptive_from(self, lensing_obj, source_plane_coordinate):
+        """Find the 'peaks' of the initial grid (see `grid_peaks_from`), where only the pixels of the adaptive grid
+        (see `adaptive_grid_from`) and their 8 neighbors are ray-traced to the source-plane.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane whose multiple images are solved for.
+        """
+        grid_peaks = self.grids_peaks_around_coordinates_from(
+            coordinates=self.adaptive_grid_from(
+                lensing_obj=lensing_obj, source_plane_coordinate=source_plane_coordinate
+            ),
+            pixel_scale=self.grid.pixel_scale,
+            buffer=1,
+            upscale_factor=1,
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+        )
+
+        return grids.GridIrregularGroupedUniform(
+            grid=grid_peaks, pixel_scales=self.grid.pixel_scales
+        )
+
     def refined_coordinates_from_coordinate(
         self, coordinate, pixel_scale, lensing_obj, source_plane_coordinate
     ):
@@ -297,154 +640,1098 @@ class PositionsSolver(AbstractPositionsSolver):
             for.
         """
 
-        grid = self.grid_buffed_and_upscaled_around_coordinate_from(
-            coordinate=coordinate,
-            pixel_scales=(pixel_scale, pixel_scale),
-            buffer=4,
-            upscale_factor=self.upscale_factor,
-        )
-
-        grid = self.grid_peaks_from(
+        refined_coordinates = self.refined_coordinates_from_coordinates(
+            coordinates=[coordinate],
+            pixel_scale=pixel_scale,
             lensing_obj=lensing_obj,
-            grid=grid,
             source_plane_coordinate=source_plane_coordinate,
         )
 
-        if len(grid) == 0:
+        if len(refined_coordinates) == 0:
             return None
         else:
-            return [tuple(coordinate) for coordinate in grid]
+            return [tuple(coordinate) for coordinate in refined_coordinates]
 
-    def solve_from_tracer(self, tracer):
-        """Needs work - idea is it solves for all image plane multiple image positions using the redshift distribution of
-        the tracer."""
-        return grids.GridIrregularGrouped(
-            grid=[
-                self.solve(lensing_obj=tracer, source_plane_coordinate=centre)
-                for centre in tracer.light_profile_centres
-            ]
-        )
+    def refined_coordinates_from_coordinates(
+        self, coordinates, pixel_scale, lensing_obj, source_plane_coordinate
+    ):
+        """For a list of (y,x) coordinates, determine the refined coordinates of every coordinate, which are the peak
+        pixels on a higher resolution grid around each coordinate (see `refined_coordinates_from_coordinate`).
 
-    def solve(self, lensing_obj, source_plane_coordinate):
+        The buffed and upscaled grids around all coordinates are stacked into one grid, such that the deflection
+        angles of every grid are computed in a single call to the lensing object and the peaks of every grid are
+        found in one vectorized comparison. The refined coordinates are returned in the same order as computing them
+        for each coordinate in turn.
 
-        coordinates_list = self.grid_peaks_from(
+        Parameters
+        ----------
+        coordinates : [(float, float)] or ndarray
+            The (y,x) coordinates around which the upscaled grids used to find the refined coordinates are computed.
+        pixel_scale : float
+            The pixel-scale resolution of the grid the coordinates were found on, which is reduced to
+            pixel_scale / upscale_factor for the upscaled grids.
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane pixels that the distance of traced grid coordinates are computed
+            for.
+        """
+        if self.use_upscaling:
+            upscale_factor = self.upscale_factor
+        else:
+            upscale_factor = 1
+
+        return self.grids_peaks_around_coordinates_from(
+            coordinates=coordinates,
+            pixel_scale=pixel_scale,
+            buffer=4,
+            upscale_factor=upscale_factor,
             lensing_obj=lensing_obj,
-            grid=self.grid,
             source_plane_coordinate=source_plane_coordinate,
         )
 
-        coordinates_list = self.grid_with_coordinates_from_mass_profile_centre_removed(
-            lensing_obj=lensing_obj, grid=coordinates_list
+    def grids_peaks_around_coordinates_from(
+        self,
+        coordinates,
+        pixel_scale,
+        buffer,
+        upscale_factor,
+        lensing_obj,
+        source_plane_coordinate,
+    ):
+        """For a list of (y,x) coordinates, form a square grid around every coordinate and return the peak pixels of
+        every grid, which trace closer to the source-plane coordinate than their 8 neighboring pixels.
+
+        The grids are stacked into one grid, such that their deflection angles are computed in a single call to the
+        lensing object. The stacked grid is passed to the lensing object as an ndarray, which avoids the overhead of
+        grouping its coordinates into a `GridIrregularGroupedUniform`.
+
+        Parameters
+        ----------
+        coordinates : [(float, float)] or ndarray
+            The (y,x) coordinates around which the grids are formed.
+        pixel_scale : float
+            The pixel-scale of the grid the coordinates were found on, which is reduced to
+            pixel_scale / upscale_factor for the grids.
+        buffer : int
+            The number of pixels (at resolution pixel_scale) each grid extends either side of its coordinate.
+        upscale_factor : int
+            The factor by which the resolution of the grids is increased relative to pixel_scale.
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane pixels that the distance of traced grid coordinates are computed
+            for.
+        """
+        coordinates = np.asarray(coordinates).reshape(-1, 2)
+
+        if coordinates.shape[0] == 0:
+            return np.zeros(shape=(0, 2))
+
+        grid = grids_buffed_around_coordinates_from(
+            coordinates=coordinates,
+            pixel_scales=(pixel_scale, pixel_scale),
+            buffer=buffer,
+            upscale_factor=upscale_factor,
         )
 
-        coordinates_list = self.grid_with_points_below_magnification_threshold_removed(
-            lensing_obj=lensing_obj, grid=coordinates_list
+        deflections = np.asarray(lensing_obj.deflections_from_grid(grid=grid))
+        source_plane_distances = np.sqrt(
+            np.sum(np.square(grid - deflections - source_plane_coordinate), axis=1)
         )
 
-        if not self.use_upscaling:
+        return grids_peaks_from(
+            distance_1d=source_plane_distances,
+            grid_1d=grid,
+            total_grids=coordinates.shape[0],
+        )
 
-            return grids.GridIrregularGrouped(grid=coordinates_list)
+    def solve_from_tracer(self, tracer, positions=None):
+        """Needs work - idea is it solves for all image plane multiple image positions using the redshift distribution of
+        the tracer.
 
-        pixel_scale = self.grid.pixel_scale
+        The deflection angles of the initial grid do not depend on the source-plane coordinate, thus the initial grid
+        is ray-traced to the source-plane once and its peak pixels are found for every light profile centre using
+        this traced grid.
 
-        while pixel_scale > self.pixel_scale_precision:
+        If `use_warm_start` is True, the solve for every light profile centre is seeded by the positions found for
+        that centre the previous time this method was called and the observed `positions`. The expected number of
+        images is the number of observed positions of that centre (or the number of previous positions if no
+        observed positions are input).
 
-            refined_coordinates_list = []
+        Parameters
+        ----------
+        tracer : Tracer
+            The tracer whose light profile centres the multiple images are solved for.
+        positions : GridIrregularGrouped
+            The observed multiple image positions, grouped in the same order as the tracer's light profile centres,
+            which seed the warm-start solve.
+
+        Returns
+        -------
+        (GridIrregularGrouped, ValuesIrregularGrouped, ValuesIrregularGrouped)
+            The multiple image positions of every light profile centre, and their magnifications and parities
+            computed when the positions were solved for (see `magnifications_and_parities_from`).
+        """
+        centres = list(tracer.light_profile_centres)
 
-            for coordinate in coordinates_list:
+        positions_list = []
 
-                refined_coordinates = self.refined_coordinates_from_coordinate(
-                    coordinate=coordinate,
-                    pixel_scale=pixel_scale,
-                    lensing_obj=lensing_obj,
-                    source_plane_coordinate=source_plane_coordinate,
-                )
+        if positions is not None:
+            positions_list = [
+                np.asarray(group).reshape(-1, 2) for group in positions.in_grouped_list
+            ]
 
-                if refined_coordinates is not None:
-                    refined_coordinates_list += refined_coordinates
+        if len(self.warm_start_solutions) != len(centres):
+            self.warm_start_solutions = [np.zeros(shape=(0, 2)) for centre in centres]
 
-            refined_coordinates_list = grid_remove_duplicates(
-                grid=np.asarray(refined_coordinates_list)
-            )
+        source_plane_grid = None
 
-            pixel_scale = pixel_scale / self.upscale_factor
+        solutions = []
+        magnifications = []
+        parities = []
 
-            coordinates_list = refined_coordinates_list
+        for index, centre in enumerate(centres):
 
-        coordinates_list = self.grid_within_distance_of_source_plane_centre(
-            lensing_obj=lensing_obj,
-            grid=grids.GridIrregularGroupedUniform(
-                grid=coordinates_list, pixel_scales=(pixel_scale, pixel_scale)
-            ),
-            source_plane_coordinate=source_plane_coordinate,
-            distance=self.distance_from_source_centre,
-        )
+            solution = None
 
-        coordinates_list = self.grid_with_points_below_magnification_threshold_removed(
-            lensing_obj=lensing_obj, grid=coordinates_list
-        )
+            if self.use_warm_start:
 
-        return grids.GridIrregularGrouped(grid=coordinates_list)
+                seed_coordinates = [self.warm_start_solutions[index]]
 
+                if len(positions_list) == len(centres):
+                    seed_coordinates.append(positions_list[index])
+                    total_images = positions_list[index].shape[0]
+                elif self.warm_start_solutions[index].shape[0] > 0:
+                    total_images = self.warm_start_solutions[index].shape[0]
+                else:
+                    total_images = None
 
-@decorator_util.jit()
-def grid_remove_duplicates(grid):
+                solution = self.solve_from_seed_coordinates(
+                    lensing_obj=tracer,
+                    source_plane_coordinate=centre,
+                    seed_coordinates=np.concatenate(seed_coordinates),
+                    total_images=total_images,
+                )
 
-    tolerance = 1e-8
+            if solution is None:
 
-    grid_no_duplicates = []
+                if source_plane_grid is None and self.adaptive_grid_levels is None:
+                    source_plane_grid = self.source_plane_grid_from(
+                        lensing_obj=tracer, grid=self.grid
+                    )
 
-    separations = np.zeros((grid.shape[0], grid.shape[0]))
+                solution = self.solve(
+                    lensing_obj=tracer,
+                    source_plane_coordinate=centre,
+                    source_plane_grid=source_plane_grid,
+                )
 
-    for i in range(grid.shape[0]):
-        for j in range(grid.shape[0]):
-            separations[i, j] = np.sqrt(
-                np.square(grid[i, 0] - grid[j, 0]) + np.square(grid[i, 1] - grid[j, 1])
-            )
-            separations[i, i] = tolerance * 2
+            if self.use_warm_start:
+                self.warm_start_solutions[index] = np.asarray(solution).reshape(-1, 2)
 
-    for i in range(grid.shape[0]):
+            solutions.append(solution)
+            magnifications.append(list(self.magnifications))
+            parities.append(list(self.parities))
 
-        is_duplicate = False
+        return (
+            grids.GridIrregularGrouped(grid=solutions),
+            arrays.ValuesIrregularGrouped(values=magnifications),
+            arrays.ValuesIrregularGrouped(values=parities),
+        )
 
-        for j in range(grid.shape[0]):
+    def solve(
+        self,
+        lensing_obj,
+        source_plane_coordinate,
+        seed_coordinates=None,
+        total_images=None,
+        source_plane_grid=None,
+    ):
+        """Solve for the (y,x) coordinates of the multiple images of a source-plane coordinate.
 
-            if separations[i, j] < tolerance:
+        If `seed_coordinates` are input, the peak pixels are first found on small grids around every seed (see
+        `solve_from_seed_coordinates`). If these give `total_images` or more images they are returned, otherwise
+        the peak pixels of the full initial grid are used.
 
-                is_duplicate = True
-                separations[i, j] = tolerance * 2
-                separations[j, i] = tolerance * 2
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane whose multiple images are solved for.
+        seed_coordinates : [(float, float)] or ndarray
+            The (y,x) image-plane coordinates near which the multiple images are expected, e.g. a previous solution.
+        total_images : int
+            The number of multiple images expected, below which the full initial grid is used. If None, the full
+            initial grid is always used.
+        source_plane_grid : Grid
+            The initial grid ray-traced to the source-plane by the lensing object (see `source_plane_grid_from`),
+            which is shared by every source-plane coordinate solved for the same lensing object. If None, it is
+            computed.
+        """
+        solution = self.solve_from_seed_coordinates(
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+            seed_coordinates=seed_coordinates,
+            total_images=total_images,
+        )
 
-        if not is_duplicate:
-            grid_no_duplicates.append((grid[i, 0], grid[i, 1]))
+        if solution is not None:
+            return solution
 
-    return grid_no_duplicates
+        if self.adaptive_grid_levels is not None:
 
+            coordinates_list = self.grid_peaks_adaptive_from(
+                lensing_obj=lensing_obj, source_plane_coordinate=source_plane_coordinate
+            )
 
-@decorator_util.jit()
-def grid_buffed_around_coordinate_from(
-    coordinate, pixel_scales, buffer, upscale_factor=1
-):
-    """
-    From an input 1D grid, return a 1D buffed grid where (y,x) coordinates are added next to all grid pixels whose
-    neighbors in the 8 neighboring directions were masked and not included in the grid.
+        else:
 
-    This is performed by determining the 1D grid's mask in 2D, adding the entries to the 2D mask to the eight
-    neighboring pixels and using this buffed mask to create the new 1D buffed grid.
+            coordinates_list = self.grid_peaks_from(
+                lensing_obj=lensing_obj,
+                grid=self.grid,
+                source_plane_coordinate=source_plane_coordinate,
+                source_plane_grid=source_plane_grid,
+            )
 
-    Parameters
-    ----------
-    grid_1d : np.ndarray
-        The irregular 1D grid of (y,x) coordinates over which a square uniform grid is overlaid.
-    pixel_scales : (float, float)
-        The pixel scale of the uniform grid that laid over the irregular grid of (y,x) coordinates.
-    """
+        return self.solve_from_coordinates(
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+            coordinates_list=coordinates_list,
+        )
 
-    total_coordinates = (upscale_factor * (2 * buffer + 1)) ** 2
+    def solve_from_seed_coordinates(
+        self, lensing_obj, source_plane_coordinate, seed_coordinates, total_images
+    ):
+        """Solve for the (y,x) coordinates of the multiple images of a source-plane coordinate starting from the peak
+        pixels of small grids around every seed coordinate, which are (2 * warm_start_buffer + 1) pixels across at
+        the resolution of the initial grid.
 
-    grid_1d = np.zeros(shape=(total_coordinates, 2))
+        None is returned if fewer than `total_images` images are found, if no seed coordinates are input or if
+        `total_images` is None, in which case the full initial grid should be used.
 
-    grid_index = 0
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane whose multiple images are solved for.
+        seed_coordinates : [(float, float)] or ndarray
+            The (y,x) image-plane coordinates near which the multiple images are expected, e.g. a previous solution.
+        total_images : int
+            The number of multiple images expected.
+        """
+        if seed_coordinates is None or total_images is None:
+            return None
+
+        if len(seed_coordinates) == 0:
+            return None
+
+        coordinates_list = self.grids_peaks_around_coordinates_from(
+            coordinates=seed_coordinates,
+            pixel_scale=self.grid.pixel_scale,
+            buffer=self.warm_start_buffer,
+            upscale_factor=1,
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+        )
+
+        coordinates_list = grid_remove_duplicates(
+            grid=coordinates_list, tolerance=0.5 * self.grid.pixel_scale
+        )
+
+        if len(coordinates_list) == 0:
+            return None
+
+        solution = self.solve_from_coordinates(
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+            coordinates_list=grids.GridIrregularGroupedUniform(
+                grid=coordinates_list, pixel_scales=self.grid.pixel_scales
+            ),
+        )
+
+        if len(solution) < total_images:
+            return None
+
+        return solution
+
+    def solve_from_coordinates(
+        self, lensing_obj, source_plane_coordinate, coordinates_list
+    ):
+        """Solve for the (y,x) coordinates of the multiple images of a source-plane coordinate, starting from the peak
+        pixels `coordinates_list` of a grid at the resolution of the initial grid.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane whose multiple images are solved for.
+        coordinates_list : GridIrregularGroupedUniform
+            The peak pixels which are refined to the multiple images.
+        """
+        coordinates_list = self.grid_with_coordinates_from_mass_profile_centre_removed(
+            lensing_obj=lensing_obj, grid=coordinates_list
+        )
+
+        coordinates_list = self.grid_with_points_below_magnification_threshold_removed(
+            lensing_obj=lensing_obj, grid=coordinates_list
+        )
+
+        if not self.use_upscaling:
+
+            return grids.GridIrregularGrouped(grid=coordinates_list)
+
+        pixel_scale = self.grid.pixel_scale
+
+        while pixel_scale > self.pixel_scale_precision:
+
+            refined_coordinates_list = self.refined_coordinates_from_coordinates(
+                coordinates=coordinates_list,
+                pixel_scale=pixel_scale,
+                lensing_obj=lensing_obj,
+                source_plane_coordinate=source_plane_coordinate,
+            )
+
+            refined_coordinates_list = grid_remove_duplicates(
+                grid=refined_coordinates_list
+            )
+
+            pixel_scale = pixel_scale / self.upscale_factor
+
+            coordinates_list = refined_coordinates_list
+
+        coordinates_list = self.grid_within_distance_of_source_plane_centre(
+            lensing_obj=lensing_obj,
+            grid=grids.GridIrregularGroupedUniform(
+                grid=coordinates_list, pixel_scales=(pixel_scale, pixel_scale)
+            ),
+            source_plane_coordinate=source_plane_coordinate,
+            distance=self.distance_from_source_centre,
+        )
+
+        coordinates_list = self.grid_with_points_below_magnification_threshold_removed(
+            lensing_obj=lensing_obj, grid=coordinates_list
+        )
+
+        return grids.GridIrregularGrouped(grid=coordinates_list)
+
+
+class PositionsSolverNewton(PositionsSolver):
+    def __init__(
+        self,
+        grid,
+        pixel_scale_precision=None,
+        magnification_threshold=0.0,
+        distance_from_source_centre=None,
+        distance_from_mass_profile_centre=None,
+        max_iterations=50,
+        max_distance_from_peak=3.0,
+        jacobian_buffer=1.0e-4,
+        use_warm_start=False,
+        warm_start_buffer=4,
+        adaptive_grid_levels=None,
+        adaptive_grid_buffer=0.5,
+    ):
+        """Given a `LensingObject` (e.g. a _MassProfile, `Galaxy`, `Plane` or _Tracer_) this class determines the (y,x)
+        coordinates the multiple-images of a (y,x) source-centre coordinate appear at, by solving the lens equation
+        with Newton's method.
+
+        This is performed as follows:
+
+         1) Find the 'peak' pixels on the initial image-plane grid, which trace closer to the centre of the source
+            than their 8 neighboring pixels (as for the `PositionsSolver`).
+         2) Starting from every peak pixel, iterate Newton's method on the lens equation, where the Jacobian of the
+            lens equation is computed via finite differences of the lensing object's deflection angles. The
+            deflection angles of every candidate image and its offsets are computed in one call per iteration.
+         3) Stop once every candidate's Newton step is below `pixel_scale_precision`. Candidates which do not
+            converge within `max_iterations` (e.g. peak pixels which are not genuine multiple images) are removed.
+
+        Newton's method converges quadratically, so this uses far fewer deflection angle calculations than the
+        iterative upscaling of the `PositionsSolver` for a small `pixel_scale_precision`. The deflection angles of
+        a `Tracer` are those of its final plane, so the Jacobian includes the lensing of every plane of a multi-plane
+        tracer.
+
+        The number of Newton iterations used by the most recent call to `solve` is stored as the `iterations`
+        attribute.
+
+        Parameters
+        ----------
+        grid : Grid
+            The initial image-plane grid whose peak pixels are the starting points of Newton's method.
+        pixel_scale_precision : float
+            The size of the Newton step below which a candidate image is converged.
+        max_iterations : int
+            The maximum number of Newton iterations, after which candidates which have not converged are removed.
+        max_distance_from_peak : float
+            The distance (in pixels of the initial grid) a candidate may move from its peak pixel before it is removed.
+        jacobian_buffer : float
+            The offset of the (y,x) coordinates used to compute the Jacobian of the lens equation via central finite
+            differences.
+        use_warm_start : bool
+            If True, the solutions of every call to `solve_from_tracer` seed the next call (see `PositionsSolver`).
+        warm_start_buffer : int
+            The number of pixels of the initial grid the warm-start grids extend either side of every seed.
+        adaptive_grid_levels : int
+            The number of times the cells of the adaptive initial grid are subdivided (see `PositionsSolver`). If
+            None, every pixel of the initial grid is ray-traced.
+        adaptive_grid_buffer : float
+            The fraction of the extent of the ray-traced cells of the adaptive grid they are expanded by.
+        """
+
+        super(PositionsSolverNewton, self).__init__(
+            grid=grid,
+            pixel_scale_precision=pixel_scale_precision,
+            magnification_threshold=magnification_threshold,
+            distance_from_source_centre=distance_from_source_centre,
+            distance_from_mass_profile_centre=distance_from_mass_profile_centre,
+            use_warm_start=use_warm_start,
+            warm_start_buffer=warm_start_buffer,
+            adaptive_grid_levels=adaptive_grid_levels,
+            adaptive_grid_buffer=adaptive_grid_buffer,
+        )
+
+        self.max_iterations = max_iterations
+        self.max_distance_from_peak = max_distance_from_peak
+        self.jacobian_buffer = jacobian_buffer
+        self.iterations = 0
+
+    def newton_coordinates_from_coordinates(
+        self, coordinates, lensing_obj, source_plane_coordinate
+    ):
+        """For a list of (y,x) coordinates, iterate Newton's method on the lens equation until every coordinate
+        converges to the image-plane coordinate which traces to the source-plane coordinate.
+
+        Every iteration computes the deflection angles of every unconverged coordinate and its 4 offsets (used to
+        compute the Jacobian via central finite differences) in one call to the lensing object. Newton steps are
+        limited to the pixel-scale of the initial grid, to prevent coordinates near critical curves (where the
+        Jacobian is close to singular) from being thrown to distant parts of the image-plane. A genuine multiple image
+        is within about a pixel of the peak pixel it starts from, so coordinates which move more than
+        `max_distance_from_peak` pixels away from their starting point are removed.
+
+        Returns the converged coordinates and the number of Newton iterations used.
+
+        Parameters
+        ----------
+        coordinates : [(float, float)] or ndarray
+            The (y,x) coordinates Newton's method starts from.
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane the coordinates are solved for.
+        """
+        coordinates = np.array(coordinates, dtype="float").reshape(-1, 2)
+        coordinates_initial = coordinates.copy()
+
+        source_plane_coordinate = np.asarray(source_plane_coordinate)
+
+        is_converged = np.full(shape=coordinates.shape[0], fill_value=False)
+        step_sizes_previous = np.full(shape=coordinates.shape[0], fill_value=np.inf)
+        is_failed = np.full(shape=coordinates.shape[0], fill_value=False)
+
+        buffer = self.jacobian_buffer
+        max_step = self.grid.pixel_scale
+
+        offsets = np.array(
+            [[0.0, 0.0], [buffer, 0.0], [-buffer, 0.0], [0.0, buffer], [0.0, -buffer]]
+        )
+
+        iterations = 0
+
+        while iterations < self.max_iterations:
+
+            active = np.flatnonzero(~is_converged & ~is_failed)
+
+            if active.shape[0] == 0:
+                break
+
+            iterations += 1
+
+            grid = (offsets[:, None, :] + coordinates[active]).reshape(-1, 2)
+
+            deflections = np.asarray(
+                lensing_obj.deflections_from_grid(
+                    grid=grids.GridIrregularGroupedUniform(
+                        grid=grid, pixel_scales=(buffer, buffer)
+                    )
+                )
+            ).reshape(5, active.shape[0], 2)
+
+            residuals = coordinates[active] - deflections[0] - source_plane_coordinate
+
+            a_yy = 1.0 - (deflections[1, :, 0] - deflections[2, :, 0]) / (2.0 * buffer)
+            a_yx = -(deflections[3, :, 0] - deflections[4, :, 0]) / (2.0 * buffer)
+            a_xy = -(deflections[1, :, 1] - deflections[2, :, 1]) / (2.0 * buffer)
+            a_xx = 1.0 - (deflections[3, :, 1] - deflections[4, :, 1]) / (2.0 * buffer)
+
+            det_a = a_yy * a_xx - a_yx * a_xy
+
+            steps = np.stack(
+                (
+                    (a_xx * residuals[:, 0] - a_yx * residuals[:, 1]) / det_a,
+                    (a_yy * residuals[:, 1] - a_xy * residuals[:, 0]) / det_a,
+                ),
+                axis=1,
+            )
+
+            step_sizes = np.sqrt(np.sum(np.square(steps), axis=1))
+
+            is_failed[active] = ~np.isfinite(step_sizes) | (
+                step_sizes > step_sizes_previous[active]
+            )
+
+            step_sizes_previous[active] = np.minimum(step_sizes, max_step)
+
+            steps[step_sizes > max_step] *= (
+                max_step / step_sizes[step_sizes > max_step]
+            )[:, None]
+
+            coordinates[active] -= steps
+
+            is_converged[active] = step_sizes < self.pixel_scale_precision
+
+            is_failed[active] |= (
+                np.sqrt(
+                    np.sum(
+                        np.square(coordinates[active] - coordinates_initial[active]),
+                        axis=1,
+                    )
+                )
+                > self.max_distance_from_peak * max_step
+            )
+
+        return coordinates[is_converged], iterations
+
+    def solve_from_coordinates(
+        self, lensing_obj, source_plane_coordinate, coordinates_list
+    ):
+
+        coordinates_list = self.grid_with_coordinates_from_mass_profile_centre_removed(
+            lensing_obj=lensing_obj, grid=coordinates_list
+        )
+
+        coordinates_list = self.grid_with_points_below_magnification_threshold_removed(
+            lensing_obj=lensing_obj, grid=coordinates_list
+        )
+
+        coordinates, self.iterations = self.newton_coordinates_from_coordinates(
+            coordinates=coordinates_list,
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+        )
+
+        coordinates_list = grid_remove_duplicates(
+            grid=coordinates, tolerance=self.pixel_scale_precision
+        )
+
+        coordinates_list = self.grid_within_distance_of_source_plane_centre(
+            lensing_obj=lensing_obj,
+            grid=grids.GridIrregularGroupedUniform(
+                grid=coordinates_list,
+                pixel_scales=(self.pixel_scale_precision, self.pixel_scale_precision),
+            ),
+            source_plane_coordinate=source_plane_coordinate,
+            distance=self.distance_from_source_centre,
+        )
+
+        coordinates_list = self.grid_with_points_below_magnification_threshold_removed(
+            lensing_obj=lensing_obj, grid=coordinates_list
+        )
+
+        return grids.GridIrregularGrouped(grid=coordinates_list)
+
+
+class PositionsSolverTriangles(AbstractPositionsSolver):
+    def __init__(self, grid, pixel_scale_precision=None, magnification_threshold=0.0):
+        """Given a `LensingObject` (e.g. a _MassProfile, `Galaxy`, `Plane` or _Tracer_) this class determines the (y,x)
+        coordinates the multiple-images of a (y,x) source-centre coordinate appear at, by mapping triangles of the
+        image-plane to the source-plane.
+
+        This is performed as follows:
+
+         1) Every square cell of the initial (square and uniform) grid is split into two triangles, whose vertices are
+            ray-traced to the source-plane with a single deflection angle calculation.
+         2) The source-plane triangles are stored in a `TriangleIndex`, which bins them by their bounding boxes such
+            that the triangles near a source-plane coordinate are found without testing every triangle.
+         3) Every triangle near the source-plane coordinate is subdivided into 4 triangles, whose vertices are
+            ray-traced, and the sub-triangles near the source-plane coordinate are retained. This is repeated until
+            the triangles are smaller than `pixel_scale_precision`, with the deflection angles of all triangles
+            computed in one call per subdivision. After the final subdivision only the triangles which contain the
+            source-plane coordinate are retained.
+         4) The multiple image is the point of every final triangle which maps to the source-plane coordinate,
+            interpolating linearly between its vertices.
+
+        A triangle is 'near' a coordinate if its source-plane bounding box, expanded by half its size, contains it
+        (see `triangles_near_coordinate_from`). This retains triangles whose curved source-plane edges contain the
+        coordinate while their straight edges do not, which happens for large triangles where the lens mapping is
+        non-linear.
+
+        Every multiple image lies in a triangle containing the source-plane coordinate, so all images are found in
+        one deterministic pass without the 'peak' heuristic of the `PositionsSolver`. Triangles over a singularity of
+        the deflection angles (e.g. the centre of a singular isothermal mass profile) map to source-plane triangles
+        which do not shrink as they are subdivided and are removed, such that the spurious demagnified solutions the
+        `distance_from_mass_profile_centre` input of the `PositionsSolver` removes are not found.
+
+        Parameters
+        ----------
+        grid : Grid
+            The initial square and uniform image-plane grid which is triangulated.
+        pixel_scale_precision : float
+            The size of the image-plane triangles below which their subdivision stops.
+        magnification_threshold : float
+            Images whose absolute magnification is below this value are removed.
+        """
+
+        super(PositionsSolverTriangles, self).__init__(
+            magnification_threshold=magnification_threshold
+        )
+
+        self.grid = grid.in_1d_binned
+        self.pixel_scale_precision = pixel_scale_precision
+
+        self.triangles = grid_square_triangles_from(
+            shape_of_edge=int(np.sqrt(self.grid.shape[0]))
+        )
+
+    @property
+    def total_subdivisions(self):
+        """
+        The number of times the triangles of the initial grid are subdivided (halving their size) such that their
+        size is below the `pixel_scale_precision`.
+        """
+        return max(
+            int(np.ceil(np.log2(self.grid.pixel_scale / self.pixel_scale_precision))),
+            0,
+        )
+
+    def traced_coordinates_from(self, lensing_obj, coordinates):
+        """
+        Ray-trace (y,x) coordinates of shape [..., 2] to the source-plane, returning them in the same shape.
+
+        The coordinates are passed to the lensing object as an ndarray, which avoids the overhead of grouping them
+        into a `GridIrregularGroupedUniform` for every subdivision.
+        """
+        coordinates = np.asarray(coordinates)
+
+        deflections = lensing_obj.deflections_from_grid(grid=coordinates.reshape(-1, 2))
+
+        return coordinates - np.asarray(deflections).reshape(coordinates.shape)
+
+    def triangle_index_from(self, lensing_obj):
+        """
+        Ray-trace the initial grid to the source-plane and return the `TriangleIndex` of its triangles.
+        """
+        grid = np.asarray(self.grid)
+
+        source_plane_grid = grid - np.asarray(
+            lensing_obj.deflections_from_grid(grid=self.grid)
+        )
+
+        return TriangleIndex(
+            image_triangles=grid[self.triangles],
+            source_triangles=source_plane_grid[self.triangles],
+        )
+
+    def coordinates_from_triangle_index(
+        self, triangle_index, lensing_obj, source_plane_coordinate
+    ):
+        """
+        Returns the multiple images of a source-plane coordinate, by subdividing the triangles of a `TriangleIndex`
+        which contain it (see the class docstring).
+        """
+        triangle_indexes = triangle_index.triangle_indexes_near(
+            coordinate=source_plane_coordinate
+        )
+
+        image_triangles = triangle_index.image_triangles[triangle_indexes]
+        source_triangles = triangle_index.source_triangles[triangle_indexes]
+
+        if self.total_subdivisions == 0:
+
+            is_containing = triangles_containing_coordinate_from(
+                triangles=source_triangles, coordinate=source_plane_coordinate
+            )
+
+            image_triangles = image_triangles[is_containing]
+            source_triangles = source_triangles[is_containing]
+
+        for subdivision in range(self.total_subdivisions):
+
+            if image_triangles.shape[0] == 0:
+                break
+
+            image_midpoints = triangles_midpoints_from(triangles=image_triangles)
+            source_midpoints = self.traced_coordinates_from(
+                lensing_obj=lensing_obj, coordinates=image_midpoints
+            )
+
+            source_sizes = triangles_sizes_from(triangles=source_triangles)
+
+            image_triangles = triangles_subdivided_from(
+                triangles=image_triangles, midpoints=image_midpoints
+            )
+            source_triangles = triangles_subdivided_from(
+                triangles=source_triangles, midpoints=source_midpoints
+            )
+
+            if subdivision < self.total_subdivisions - 1:
+
+                is_containing = triangles_near_coordinate_from(
+                    triangles=source_triangles, coordinate=source_plane_coordinate
+                )
+
+            else:
+
+                is_containing = triangles_containing_coordinate_from(
+                    triangles=source_triangles, coordinate=source_plane_coordinate
+                ) & (
+                    triangles_sizes_from(triangles=source_triangles)
+                    <= 0.75 * np.repeat(source_sizes, 4)
+                )
+
+            image_triangles = image_triangles[is_containing]
+            source_triangles = source_triangles[is_containing]
+
+        return coordinates_in_triangles_from(
+            image_triangles=image_triangles,
+            source_triangles=source_triangles,
+            coordinate=source_plane_coordinate,
+        )
+
+    def solve_from_tracer(self, tracer, positions=None):
+        """
+        Solve for the multiple images of the centre of every light profile of a tracer, where the initial grid is
+        ray-traced to the source-plane once and shared by every centre.
+
+        The observed `positions` are not used, but are accepted for the same call signature as the `PositionsSolver`.
+        The positions are returned with their magnifications and parities, as for the `PositionsSolver`.
+        """
+        triangle_index = self.triangle_index_from(lensing_obj=tracer)
+
+        solutions = []
+        magnifications = []
+        parities = []
+
+        for centre in tracer.light_profile_centres:
+
+            solutions.append(
+                self.solve_from_triangle_index(
+                    triangle_index=triangle_index,
+                    lensing_obj=tracer,
+                    source_plane_coordinate=centre,
+                )
+            )
+            magnifications.append(list(self.magnifications))
+            parities.append(list(self.parities))
+
+        return (
+            grids.GridIrregularGrouped(grid=solutions),
+            arrays.ValuesIrregularGrouped(values=magnifications),
+            arrays.ValuesIrregularGrouped(values=parities),
+        )
+
+    def solve(self, lensing_obj, source_plane_coordinate):
+
+        return self.solve_from_triangle_index(
+            triangle_index=self.triangle_index_from(lensing_obj=lensing_obj),
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+        )
+
+    def solve_from_triangle_index(
+        self, triangle_index, lensing_obj, source_plane_coordinate
+    ):
+
+        coordinates = self.coordinates_from_triangle_index(
+            triangle_index=triangle_index,
+            lensing_obj=lensing_obj,
+            source_plane_coordinate=source_plane_coordinate,
+        )
+
+        coordinates_list = grid_remove_duplicates(
+            grid=coordinates, tolerance=self.pixel_scale_precision
+        )
+
+        coordinates_list = self.grid_with_points_below_magnification_threshold_removed(
+            lensing_obj=lensing_obj,
+            grid=grids.GridIrregularGroupedUniform(
+                grid=coordinates_list,
+                pixel_scales=(self.pixel_scale_precision, self.pixel_scale_precision),
+            ),
+        )
+
+        return grids.GridIrregularGrouped(grid=coordinates_list)
+
+
+class TriangleIndex:
+    def __init__(
+        self, image_triangles, source_triangles, buffer=0.5, max_bins_per_triangle=16
+    ):
+        """
+        A spatial index of the source-plane triangles of an image-plane triangulation, which finds the triangles
+        containing a source-plane coordinate without testing every triangle.
+
+        The source-plane is divided into square bins whose size is the median size of the triangles' bounding boxes,
+        and every triangle is stored in every bin its bounding box overlaps. Triangles whose bounding box overlaps
+        more than `max_bins_per_triangle` bins (e.g. triangles stretched over a critical curve or a singularity) are
+        stored separately and tested for every coordinate. Triangles with non-finite source-plane vertices are not
+        stored.
+
+        Parameters
+        ----------
+        image_triangles : np.ndarray
+            The (y,x) vertices of every image-plane triangle, of shape [total_triangles, 3, 2].
+        source_triangles : np.ndarray
+            The (y,x) vertices of every triangle ray-traced to the source-plane, of shape [total_triangles, 3, 2].
+        buffer : float
+            The bounding box of every triangle is expanded on every side by this factor times its largest extent (see
+            `triangles_near_coordinate_from`).
+        max_bins_per_triangle : int
+            The number of bins a triangle's bounding box can overlap before it is tested for every coordinate.
+        """
+        self.image_triangles = image_triangles
+        self.source_triangles = source_triangles
+        self.buffer = buffer
+        self.max_bins_per_triangle = max_bins_per_triangle
+
+        is_finite = np.all(np.isfinite(source_triangles), axis=(1, 2))
+
+        triangle_indexes = np.flatnonzero(is_finite)
+
+        bounding_boxes_min = np.min(source_triangles[triangle_indexes], axis=1)
+        bounding_boxes_max = np.max(source_triangles[triangle_indexes], axis=1)
+
+        buffers = buffer * np.max(bounding_boxes_max - bounding_boxes_min, axis=1)
+
+        bounding_boxes_min -= buffers[:, None]
+        bounding_boxes_max += buffers[:, None]
+
+        if triangle_indexes.shape[0] == 0:
+            self.bin_size = 1.0
+        else:
+            self.bin_size = max(
+                np.median(np.max(bounding_boxes_max - bounding_boxes_min, axis=1)),
+                1.0e-12,
+            )
+
+        bins_min = np.floor(bounding_boxes_min / self.bin_size).astype("int")
+        bins_max = np.floor(bounding_boxes_max / self.bin_size).astype("int")
+
+        bins_shape = bins_max - bins_min + 1
+        total_bins = bins_shape[:, 0] * bins_shape[:, 1]
+
+        is_large = total_bins > self.max_bins_per_triangle
+
+        self.large_triangle_indexes = triangle_indexes[is_large]
+
+        triangle_indexes = triangle_indexes[~is_large]
+        bins_min = bins_min[~is_large]
+        bins_shape = bins_shape[~is_large]
+        total_bins = total_bins[~is_large]
+
+        bin_triangle_indexes = np.repeat(triangle_indexes, total_bins)
+        bin_offsets = np.arange(np.sum(total_bins)) - np.repeat(
+            np.cumsum(total_bins) - total_bins, total_bins
+        )
+        bins_x_shape = np.repeat(bins_shape[:, 1], total_bins)
+
+        bin_keys = self.bin_keys_from(
+            y_bins=np.repeat(bins_min[:, 0], total_bins) + bin_offsets // bins_x_shape,
+            x_bins=np.repeat(bins_min[:, 1], total_bins) + bin_offsets % bins_x_shape,
+        )
+
+        sort_indexes = np.argsort(bin_keys, kind="stable")
+
+        self.bin_keys = bin_keys[sort_indexes]
+        self.bin_triangle_indexes = bin_triangle_indexes[sort_indexes]
+
+    @staticmethod
+    def bin_keys_from(y_bins, x_bins):
+        """
+        Combine the (y,x) indexes of source-plane bins into one integer key per bin.
+        """
+        return (y_bins.astype("int64") << 32) + (x_bins.astype("int64") & 0xFFFFFFFF)
+
+    def triangle_indexes_near(self, coordinate):
+        """
+        Returns the indexes of the triangles whose expanded source-plane bounding box contains a (y,x) source-plane
+        coordinate (see `triangles_near_coordinate_from`).
+
+        Parameters
+        ----------
+        coordinate : (float, float)
+            The (y,x) source-plane coordinate.
+        """
+        bin_key = self.bin_keys_from(
+            y_bins=np.floor(np.asarray([coordinate[0]]) / self.bin_size),
+            x_bins=np.floor(np.asarray([coordinate[1]]) / self.bin_size),
+        )[0]
+
+        triangle_indexes = np.concatenate(
+            (
+                self.bin_triangle_indexes[
+                    np.searchsorted(
+                        self.bin_keys, bin_key, side="left"
+                    ) : np.searchsorted(self.bin_keys, bin_key, side="right")
+                ],
+                self.large_triangle_indexes,
+            )
+        )
+
+        triangle_indexes = np.sort(triangle_indexes)
+
+        is_near = triangles_near_coordinate_from(
+            triangles=self.source_triangles[triangle_indexes],
+            coordinate=coordinate,
+            buffer=self.buffer,
+        )
+
+        return triangle_indexes[is_near]
+
+
+def catalogue_entry_from(solver, lensing_obj, source_plane_coordinate):
+    """
+    Solve for the multiple images of a source-plane coordinate and return the .json dictionary of the solution,
+    containing the source-plane coordinate and the (y,x) coordinates, magnifications and parities of its images.
+    """
+    positions = solver.solve(
+        lensing_obj=lensing_obj, source_plane_coordinate=source_plane_coordinate
+    )
+
+    return {
+        "source_plane_coordinate": [float(value) for value in source_plane_coordinate],
+        "positions": np.asarray(positions).reshape(-1, 2).tolist(),
+        "magnifications": np.asarray(solver.magnifications, dtype="float").tolist(),
+        "parities": np.asarray(solver.parities, dtype="int").tolist(),
+    }
+
+
+catalogue_worker_solver = None
+
+
+def catalogue_worker_initializer(solver):
+    """
+    Store the solver of a `solve_catalogue` process, such that it is sent to every process once rather than with
+    every chunk of pairs.
+    """
+    global catalogue_worker_solver
+    catalogue_worker_solver = solver
+
+
+def catalogue_worker_entry_from(pair):
+    """
+    Returns the `catalogue_entry_from` of a (lensing object, source-plane coordinate) pair using the solver of a
+    `solve_catalogue` process.
+    """
+    return catalogue_entry_from(
+        solver=catalogue_worker_solver,
+        lensing_obj=pair[0],
+        source_plane_coordinate=pair[1],
+    )
+
+
+@decorator_util.jit()
+def grid_remove_duplicates(grid, tolerance=1e-8):
+    """
+    Remove the duplicate (y,x) coordinates of a grid, where two coordinates are duplicates if they are separated by
+    less than a tolerance (default 1e-8). A coordinate is removed if any coordinate after it in the grid is a duplicate of
+    it, such that of every set of duplicates only the last coordinate is retained and the order of the grid is
+    preserved.
+
+    Duplicates are found via a spatial hash, which assigns every coordinate to a square cell whose size is the
+    tolerance, such that a coordinate can only have duplicates in its own cell or the 8 neighboring cells. Coordinates
+    are hashed from the end of the grid to its start and compared to the coordinates already in these 9 cells, which
+    are the coordinates after it. This takes linear time and memory in the number of coordinates (as opposed to
+    comparing every pair of coordinates), which matters when the `PositionsSolver` produces many candidate positions.
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        The (y,x) coordinates whose duplicates are removed, of shape [total_coordinates, 2].
+    tolerance : float
+        The separation below which two coordinates are duplicates.
+    """
+
+    total_coordinates = grid.shape[0]
+
+    is_duplicate = np.full(shape=total_coordinates, fill_value=False)
+
+    cell_first_index = dict()
+    next_index_in_cell = np.full(shape=total_coordinates, fill_value=-1)
+
+    for i in range(total_coordinates - 1, -1, -1):
+
+        if not (np.isfinite(grid[i, 0]) and np.isfinite(grid[i, 1])):
+            continue
+
+        y_cell = int(np.floor(grid[i, 0] / tolerance))
+        x_cell = int(np.floor(grid[i, 1] / tolerance))
+
+        for y in range(y_cell - 1, y_cell + 2):
+            for x in range(x_cell - 1, x_cell + 2):
+
+                if (y, x) in cell_first_index:
+
+                    j = cell_first_index[(y, x)]
+
+                    while j != -1 and not is_duplicate[i]:
+
+                        separation = np.sqrt(
+                            np.square(grid[i, 0] - grid[j, 0])
+                            + np.square(grid[i, 1] - grid[j, 1])
+                        )
+
+                        if separation < tolerance:
+                            is_duplicate[i] = True
+
+                        j = next_index_in_cell[j]
+
+        if (y_cell, x_cell) in cell_first_index:
+            next_index_in_cell[i] = cell_first_index[(y_cell, x_cell)]
+
+        cell_first_index[(y_cell, x_cell)] = i
+
+    grid_no_duplicates = []
+
+    for i in range(total_coordinates):
+        if not is_duplicate[i]:
+            grid_no_duplicates.append((grid[i, 0], grid[i, 1]))
+
+    return grid_no_duplicates
+
+
+@decorator_util.jit()
+def grid_buffed_around_coordinate_from(
+    coordinate, pixel_scales, buffer, upscale_factor=1
+):
+    """
+    From an input 1D grid, return a 1D buffed grid where (y,x) coordinates are added next to all grid pixels whose
+    neighbors in the 8 neighboring directions were masked and not included in the grid.
+
+    This is performed by determining the 1D grid's mask in 2D, adding the entries to the 2D mask to the eight
+    neighboring pixels and using this buffed mask to create the new 1D buffed grid.
+
+    Parameters
+    ----------
+    grid_1d : np.ndarray
+        The irregular 1D grid of (y,x) coordinates over which a square uniform grid is overlaid.
+    pixel_scales : (float, float)
+        The pixel scale of the uniform grid that laid over the irregular grid of (y,x) coordinates.
+    """
+
+    total_coordinates = (upscale_factor * (2 * buffer + 1)) ** 2
+
+    grid_1d = np.zeros(shape=(total_coordinates, 2))
+
+    grid_index = 0
 
     pixel_scales_upscaled = (
         pixel_scales[0] / upscale_factor,
@@ -487,6 +1774,50 @@ def grid_buffed_around_coordinate_from(
     return grid_1d
 
 
+@decorator_util.jit()
+def grids_buffed_around_coordinates_from(
+    coordinates, pixel_scales, buffer, upscale_factor=1
+):
+    """
+    For an input array of (y,x) coordinates, return the buffed and upscaled grid around every coordinate (see
+    `grid_buffed_around_coordinate_from`) stacked into one 1D grid, where the grid of each coordinate follows the grid
+    of the previous coordinate.
+
+    Parameters
+    ----------
+    coordinates : np.ndarray
+        The (y,x) coordinates around which the buffed and upscaled grids are created, of shape [total_coordinates, 2].
+    pixel_scales : (float, float)
+        The pixel scale of the grid the coordinates are on, which is reduced to pixel_scales / upscale_factor.
+    buffer : int
+        The number of pixels around every (y,x) coordinate that its grid is computed on.
+    upscale_factor : int
+        The factor by which the resolution of the grids is increased relative to the input pixel-scales.
+    """
+
+    total_coordinates_per_grid = (upscale_factor * (2 * buffer + 1)) ** 2
+
+    grid_1d = np.zeros(shape=(coordinates.shape[0] * total_coordinates_per_grid, 2))
+
+    for coordinate_index in range(coordinates.shape[0]):
+
+        grid_start = coordinate_index * total_coordinates_per_grid
+
+        grid_1d[
+            grid_start : grid_start + total_coordinates_per_grid, :
+        ] = grid_buffed_around_coordinate_from(
+            coordinate=(
+                coordinates[coordinate_index, 0],
+                coordinates[coordinate_index, 1],
+            ),
+            pixel_scales=pixel_scales,
+            buffer=buffer,
+            upscale_factor=upscale_factor,
+        )
+
+    return grid_1d
+
+
 @decorator_util.jit()
 def pair_coordinate_to_closest_pixel_on_grid(coordinate, grid_1d):
 
@@ -538,7 +1869,7 @@ def grid_square_neighbors_1d_from(shape_1d):
     shape_of_edge = int(np.sqrt(shape_1d))
 
     has_neighbors = np.full(shape=shape_1d, fill_value=False)
-    neighbors_1d = np.full(shape=(shape_1d, 8), fill_value=-1.0)
+    neighbors_1d = np.full(shape=(shape_1d, 8), fill_value=-1)
 
     index = 0
 
@@ -563,48 +1894,236 @@ def grid_square_neighbors_1d_from(shape_1d):
     return neighbors_1d, has_neighbors
 
 
-@decorator_util.jit()
-def grid_peaks_from(distance_1d, grid_1d, neighbors, has_neighbors):
-    """Given an input grid of (y,x) coordinates and a 1d array of their distances to the centre of the source,
-    determine the coordinates which are closer to the source than their 8 neighboring pixels.
+# The neighbor tables of square grids, keyed by the number of pixels along the grid's edge. The `PositionsSolver`
+# finds peaks on the same initial grid and on upscaled grids of the same shape at every resolution level, so each
+# table is only computed once.
+
+grid_square_neighbors_cache = {}
+
+
+def grid_square_neighbors_cached_from(shape_of_edge):
+    """
+    Returns the neighbor table of a square grid with `shape_of_edge` pixels along each edge, which is computed once
+    per edge length and cached. The table is returned as:
+
+     - The 1D indexes of the grid pixels which have 8 neighbors.
+     - An integer array of shape [8, total_pixels_with_neighbors] giving the 1D indexes of the 8 neighbors of these
+       pixels, in the order of `grid_square_neighbors_1d_from`.
+
+    The cached arrays are read-only, as they are shared by every call.
+
+    Parameters
+    ----------
+    shape_of_edge : int
+        The number of pixels along each edge of the square grid.
+    """
+    if shape_of_edge not in grid_square_neighbors_cache:
+
+        neighbors_1d, has_neighbors = grid_square_neighbors_1d_from(
+            shape_1d=shape_of_edge ** 2
+        )
+
+        grid_indexes = np.flatnonzero(has_neighbors)
+        neighbors = np.ascontiguousarray(neighbors_1d[grid_indexes].T)
+
+        grid_indexes.setflags(write=False)
+        neighbors.setflags(write=False)
+
+        grid_square_neighbors_cache[shape_of_edge] = (grid_indexes, neighbors)
+
+    return grid_square_neighbors_cache[shape_of_edge]
+
+
+def grids_peaks_from(distance_1d, grid_1d, total_grids):
+    """Given an input grid of (y,x) coordinates consisting of `total_grids` square grids stacked one after another
+    (see `grids_buffed_around_coordinates_from`) and a 1d array of their distances to the centre of the source,
+    determine the coordinates of every square grid which are closer to the source than their 8 neighboring pixels.
 
     These pixels are selected as the next closest set of pixels to the source and used to define the coordinates of
-    the next higher resolution grid.
+    the next higher resolution grid. The peaks of every grid are returned in order, where a single square grid is
+    input with `total_grids=1`. The distances of the pixels of every grid are compared to each of their 8 neighbors
+    in turn, using vectorized comparisons against the cached neighbor table of the square grids (see
+    `grid_square_neighbors_cached_from`).
 
     Parameters
     ----------
     distance_1d : np.ndarray
         The distance of every (y,x) grid coordinate to the centre of the source in the source-plane.
     grid_1d : np.ndarray
-        The irregular 1D grid of (y,x) coordinates whose distances to the source are compared.
-    neighbors : np.ndarray
-        A 2D array of shape [pixels, 8] giving the 1D index of every grid pixel to its 8 neighboring pixels.
-    has_neighbors : np.ndarray
-        An array of bools, where `True` means a pixel has 8 neighbors and `False` means it has less than 8 and is not
-        compared to the source distance.
+        The stacked 1D grids of (y,x) coordinates whose distances to the source are compared.
+    total_grids : int
+        The number of square grids stacked in the input grid.
     """
-    peaks_list = []
+    shape_1d = grid_1d.shape[0] // total_grids
 
-    for grid_index in range(grid_1d.shape[0]):
+    grid_indexes, neighbors = grid_square_neighbors_cached_from(
+        shape_of_edge=int(np.sqrt(shape_1d))
+    )
+
+    distances = np.asarray(distance_1d).reshape(total_grids, shape_1d)
+    distances_of_grid_indexes = distances[:, grid_indexes]
+
+    is_peak = distances_of_grid_indexes <= distances[:, neighbors[0]]
+
+    for neighbor_index in range(1, 8):
+        is_peak &= distances_of_grid_indexes <= distances[:, neighbors[neighbor_index]]
+
+    grid_indexes = grid_indexes + shape_1d * np.arange(total_grids)[:, None]
+
+    return np.asarray(grid_1d)[grid_indexes[is_peak]]
+
+
+def grid_square_triangles_from(shape_of_edge):
+    """
+    Returns the triangulation of a square grid with `shape_of_edge` pixels along each edge, where every square cell
+    between 4 neighboring grid pixels is split into an upper-left and lower-right triangle.
+
+    The triangles are returned as an integer array of shape [total_triangles, 3], giving the 1D indexes of the grid
+    pixels at every triangle's vertices.
+
+    Parameters
+    ----------
+    shape_of_edge : int
+        The number of pixels along each edge of the square grid.
+    """
+    y, x = np.meshgrid(
+        np.arange(shape_of_edge - 1), np.arange(shape_of_edge - 1), indexing="ij"
+    )
+
+    top_left = (y * shape_of_edge + x).ravel()
+    top_right = top_left + 1
+    bottom_left = top_left + shape_of_edge
+    bottom_right = bottom_left + 1
+
+    return np.stack(
+        (
+            np.stack((top_left, top_right, bottom_left), axis=1),
+            np.stack((top_right, bottom_right, bottom_left), axis=1),
+        ),
+        axis=1,
+    ).reshape(-1, 3)
+
+
+def triangles_midpoints_from(triangles):
+    """
+    Returns the midpoints of the 3 edges of every triangle of an array of shape [total_triangles, 3, 2], as an array
+    of shape [total_triangles, 3, 2] whose entries are the midpoints of the edges (0, 1), (1, 2) and (2, 0).
+    """
+    return 0.5 * (triangles + np.roll(triangles, shift=-1, axis=1))
+
+
+def triangles_subdivided_from(triangles, midpoints):
+    """
+    Subdivide every triangle of an array of shape [total_triangles, 3, 2] into 4 triangles, whose vertices are the
+    triangle's vertices and its edge midpoints (see `triangles_midpoints_from`).
+
+    The midpoints are input separately, such that image-plane triangles and their ray-traced source-plane triangles
+    are subdivided in the same way, with the source-plane midpoints being the ray-traced image-plane midpoints.
+
+    Returns an array of shape [4 * total_triangles, 3, 2], where the 4 sub-triangles of every triangle are adjacent.
+    """
+    return np.stack(
+        (
+            np.stack((triangles[:, 0], midpoints[:, 0], midpoints[:, 2]), axis=1),
+            np.stack((midpoints[:, 0], triangles[:, 1], midpoints[:, 1]), axis=1),
+            np.stack((midpoints[:, 2], midpoints[:, 1], triangles[:, 2]), axis=1),
+            np.stack((midpoints[:, 0], midpoints[:, 1], midpoints[:, 2]), axis=1),
+        ),
+        axis=1,
+    ).reshape(-1, 3, 2)
+
+
+def triangles_sizes_from(triangles):
+    """
+    Returns the length of the longest edge of every triangle of an array of shape [total_triangles, 3, 2].
+    """
+    return np.max(
+        np.sqrt(
+            np.sum(np.square(triangles - np.roll(triangles, shift=-1, axis=1)), axis=2)
+        ),
+        axis=1,
+    )
+
+
+def triangles_cross_products_from(triangles, coordinate):
+    """
+    Returns the cross products of every edge of every triangle of an array of shape [total_triangles, 3, 2] with
+    the vector from the edge's first vertex to a (y,x) coordinate, whose signs give the side of every edge the
+    coordinate is on.
+    """
+    edges = np.roll(triangles, shift=-1, axis=1) - triangles
+    offsets = np.asarray(coordinate) - triangles
+
+    return edges[:, :, 1] * offsets[:, :, 0] - edges[:, :, 0] * offsets[:, :, 1]
+
+
+def triangles_containing_coordinate_from(triangles, coordinate):
+    """
+    Returns a bool array which is `True` for every triangle of an array of shape [total_triangles, 3, 2] which
+    contains a (y,x) coordinate, including coordinates on its edges.
+    """
+    cross_products = triangles_cross_products_from(
+        triangles=triangles, coordinate=coordinate
+    )
+
+    return np.all(cross_products >= 0.0, axis=1) | np.all(cross_products <= 0.0, axis=1)
+
+
+def triangles_near_coordinate_from(triangles, coordinate, buffer=0.5):
+    """
+    Returns a bool array which is `True` for every triangle of an array of shape [total_triangles, 3, 2] whose
+    bounding box, expanded on every side by `buffer` times its largest extent, contains a (y,x) coordinate.
 
-        if has_neighbors[grid_index]:
+    Ray-traced triangles are only approximated by the triangles between their ray-traced vertices, such that a
+    large triangle whose ray-traced vertices do not contain a source-plane coordinate may still contain part of its
+    pre-image. Testing against the expanded bounding box retains these triangles until they are small enough for the
+    approximation to hold.
+    """
+    bounding_boxes_min = np.min(triangles, axis=1)
+    bounding_boxes_max = np.max(triangles, axis=1)
+
+    buffers = buffer * np.max(bounding_boxes_max - bounding_boxes_min, axis=1)
+
+    coordinate = np.asarray(coordinate)
+
+    return np.all(
+        (bounding_boxes_min - buffers[:, None] <= coordinate)
+        & (coordinate <= bounding_boxes_max + buffers[:, None]),
+        axis=1,
+    )
 
-            distance = distance_1d[grid_index]
 
-            if (
-                distance <= distance_1d[neighbors[grid_index, 0]]
-                and distance <= distance_1d[neighbors[grid_index, 1]]
-                and distance <= distance_1d[neighbors[grid_index, 2]]
-                and distance <= distance_1d[neighbors[grid_index, 3]]
-                and distance <= distance_1d[neighbors[grid_index, 4]]
-                and distance <= distance_1d[neighbors[grid_index, 5]]
-                and distance <= distance_1d[neighbors[grid_index, 6]]
-                and distance <= distance_1d[neighbors[grid_index, 7]]
-            ):
+def coordinates_in_triangles_from(image_triangles, source_triangles, coordinate):
+    """
+    For every image-plane triangle whose source-plane triangle contains a (y,x) source-plane coordinate, return the
+    image-plane coordinate that maps to the source-plane coordinate when the mapping is linearly interpolated between
+    the triangle's vertices.
 
-                peaks_list.append(grid_1d[grid_index])
+    Parameters
+    ----------
+    image_triangles : np.ndarray
+        The (y,x) vertices of the image-plane triangles, of shape [total_triangles, 3, 2].
+    source_triangles : np.ndarray
+        The (y,x) vertices of the triangles ray-traced to the source-plane, of shape [total_triangles, 3, 2].
+    coordinate : (float, float)
+        The (y,x) source-plane coordinate.
+    """
+    cross_products = triangles_cross_products_from(
+        triangles=source_triangles, coordinate=coordinate
+    )
+
+    areas = np.sum(cross_products, axis=1)
+
+    weights = np.full(shape=cross_products.shape, fill_value=1.0 / 3.0)
+
+    is_degenerate = areas == 0.0
+
+    weights[~is_degenerate] = (
+        np.roll(cross_products, shift=-1, axis=1)[~is_degenerate]
+        / areas[~is_degenerate, None]
+    )
 
-    return peaks_list
+    return np.sum(weights[:, :, None] * image_triangles, axis=1)
 
 
 @decorator_util.jit()
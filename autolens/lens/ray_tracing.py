@@ -1,16 +1,474 @@
 from abc import ABC
+from contextlib import contextmanager
+from functools import lru_cache
 import pickle
 import numpy as np
 from os import path
 from astropy import cosmology as cosmo
+from autoarray import decorator_util
 from autoarray.inversion import pixelizations as pix
 from autoarray.inversion import inversions as inv
+from autoarray.structures import arrays
 from autoarray.structures import grids
 from autogalaxy import lensing
 from autogalaxy.galaxy import galaxy as g
 from autogalaxy.plane import plane as pl
 from autogalaxy.util import cosmology_util
 from autogalaxy.util import plane_util
+from autolens import exc
+from autolens.dataset.kernel_fft import KernelFFT
+from autolens.lens import tracer_serialization
+from autolens.lens.deflections_tree import DeflectionsTree
+
+
+@lru_cache(maxsize=256)
+def scaling_factors_of_planes_from(plane_redshifts, cosmology):
+    """
+    Returns the matrix of multi-plane deflection angle scaling factors for a set of plane redshifts, where entry
+    [i, j] is the factor by which the deflection angles of plane j are scaled when tracing to plane i (entries with
+    j >= i are zero).
+
+    Evaluating the scaling factors requires astropy distance integrals, which are expensive relative to ray-tracing
+    itself. The matrix is therefore cached for every (plane_redshifts, cosmology) pair, such that every `Tracer` with
+    the same plane redshifts (e.g. every sample of a model with fixed redshifts) reuses it. The returned array is
+    read-only because it is shared between tracers.
+
+    Parameters
+    ----------
+    plane_redshifts : (float,)
+        The redshifts of the tracer's planes in ascending order, where the last entry is the source-plane redshift.
+    cosmology : astropy.cosmology
+        The cosmology of the ray-tracing calculation.
+    """
+    total_planes = len(plane_redshifts)
+
+    scaling_factors = np.zeros(shape=(total_planes, total_planes))
+
+    for plane_index in range(1, total_planes):
+        for previous_plane_index in range(plane_index):
+            scaling_factors[
+                plane_index, previous_plane_index
+            ] = cosmology_util.scaling_factor_between_redshifts_from(
+                redshift_0=plane_redshifts[previous_plane_index],
+                redshift_1=plane_redshifts[plane_index],
+                redshift_final=plane_redshifts[-1],
+                cosmology=cosmology,
+            )
+
+    scaling_factors.setflags(write=False)
+
+    return scaling_factors
+
+
+@lru_cache(maxsize=256)
+def recursion_factors_of_planes_from(plane_redshifts, cosmology):
+    """
+    Returns the factors d_j of the recursive multi-plane lens equation, which give the traced grid of plane j + 1
+    from the traced grids of planes j and j - 1:
+
+    x_(j+1) = (1 - d_j) * x_(j-1) + d_j * x_j - b_(j,j+1) * a_j
+
+    where d_j = b_(j-1,j+1) / b_(j-1,j) and b are the scaling factors (see `scaling_factors_of_planes_from`). The
+    first and last entries are unused and zero. Like the scaling factors, the factors are cached for every
+    (plane_redshifts, cosmology) pair.
+
+    Parameters
+    ----------
+    plane_redshifts : (float,)
+        The redshifts of the tracer's planes in ascending order, where the last entry is the source-plane redshift.
+    cosmology : astropy.cosmology
+        The cosmology of the ray-tracing calculation.
+    """
+    scaling_factors = scaling_factors_of_planes_from(
+        plane_redshifts=plane_redshifts, cosmology=cosmology
+    )
+
+    total_planes = len(plane_redshifts)
+
+    recursion_factors = np.zeros(shape=total_planes)
+
+    for plane_index in range(1, total_planes - 1):
+        recursion_factors[plane_index] = (
+            scaling_factors[plane_index + 1, plane_index - 1]
+            / scaling_factors[plane_index, plane_index - 1]
+        )
+
+    recursion_factors.setflags(write=False)
+
+    return recursion_factors
+
+
+def sum_of_arrays_from(arrays, shape):
+    """
+    Sum an iterable of arrays by adding each array in-place to the first, avoiding the temporary array Python's `sum`
+    allocates for every addition. The arrays must therefore be newly computed (e.g. not views of other data).
+
+    Parameters
+    ----------
+    arrays : iterable of np.ndarray
+        The arrays that are summed.
+    shape : (int,)
+        The shape of the array of zeros returned if there are no arrays to sum.
+    """
+    summed_array = None
+
+    for array in arrays:
+        if summed_array is None:
+            summed_array = array
+        else:
+            summed_array += array
+
+    if summed_array is None:
+        return np.zeros(shape=shape)
+
+    return summed_array
+
+
+def grid_with_structure_of_grid_from(array, grid):
+    """
+    Returns a view of an ndarray of (y,x) coordinates with the same type and attributes (e.g. its mask) as an input
+    grid, such that the array can be passed to functions decorated with `grid_like_to_structure` in place of the grid.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        The ndarray of (y,x) coordinates, with the same shape as the grid.
+    grid : Grid or GridIrregularGrouped or np.ndarray
+        The grid whose type and attributes the returned view has.
+    """
+    if type(grid) is np.ndarray:
+        return array
+
+    array = array.view(type(grid))
+    array.__array_finalize__(grid)
+
+    return array
+
+
+def summed_profile_quantities_of_grids_from(
+    grids_of_batch,
+    profiles_of_galaxies_of_batch,
+    quantity_from,
+    shape,
+    grids_are_equal=False,
+):
+    """
+    Returns the summed quantity (e.g. the image or deflection angles) of the profiles of the galaxies of every entry
+    of a batch (e.g. the light profiles of the galaxies of one plane of every tracer of a `TracerBatch`) as an ndarray
+    of shape [total_entries, total_pixels, ...], where each entry's profiles are evaluated on its own grid.
+
+    Every profile is evaluated once for the whole batch, on the grids of all the entries it is a profile of stacked
+    into one ndarray of shape [total_entries * total_pixels, 2], such that a profile shared by the entries of a
+    batch (e.g. a light or mass profile which is fixed in a model) is not evaluated once per entry. If the grids of
+    the batch are equal (e.g. the image-plane grid of every tracer), a shared profile is evaluated on one grid.
+
+    The quantities are summed over each galaxy's profiles and then over the galaxies, in the same order as a
+    `Galaxy` and `Plane`, such that the results are identical to theirs.
+
+    Parameters
+    ----------
+    grids_of_batch : np.ndarray
+        The (y,x) grid of every entry of the batch, as an ndarray of shape [total_entries, total_pixels, 2].
+    profiles_of_galaxies_of_batch : [[[object]]]
+        The profiles of every galaxy of every entry of the batch, whose quantities are summed.
+    quantity_from : func
+        The function which returns the quantity of a profile on a grid, e.g. `lambda profile, grid:
+        profile.image_from_grid(grid=grid)`.
+    shape : (int,)
+        The shape of the quantity of one entry (e.g. [total_pixels, 2] for deflection angles).
+    grids_are_equal : bool
+        Whether the grids of every entry of the batch are equal.
+    """
+    total_pixels = grids_of_batch.shape[1]
+
+    profiles = {}
+    entry_indexes_of_profiles = {}
+
+    for entry_index, profiles_of_galaxies in enumerate(profiles_of_galaxies_of_batch):
+        for profiles_of_galaxy in profiles_of_galaxies:
+            for profile in profiles_of_galaxy:
+                profiles[id(profile)] = profile
+                entry_indexes_of_profiles.setdefault(id(profile), []).append(
+                    entry_index
+                )
+
+    quantities_of_profiles = {}
+
+    for profile_id, entry_indexes in entry_indexes_of_profiles.items():
+
+        if grids_are_equal or len(entry_indexes) == 1:
+            quantity = np.asarray(
+                quantity_from(
+                    profiles[profile_id], np.asarray(grids_of_batch[entry_indexes[0]])
+                )
+            )
+            quantities_of_profiles[profile_id] = [quantity] * len(entry_indexes)
+        else:
+            quantity = np.asarray(
+                quantity_from(
+                    profiles[profile_id],
+                    np.asarray(grids_of_batch[entry_indexes]).reshape(-1, 2),
+                )
+            )
+            quantities_of_profiles[profile_id] = [
+                quantity[index * total_pixels : (index + 1) * total_pixels]
+                for index in range(len(entry_indexes))
+            ]
+
+    quantities = np.zeros(shape=(len(profiles_of_galaxies_of_batch),) + tuple(shape))
+    occurrences_of_profiles = {}
+
+    for entry_index, profiles_of_galaxies in enumerate(profiles_of_galaxies_of_batch):
+        for profiles_of_galaxy in profiles_of_galaxies:
+
+            galaxy_quantity = 0
+
+            for profile in profiles_of_galaxy:
+                occurrence = occurrences_of_profiles.get(id(profile), 0)
+                occurrences_of_profiles[id(profile)] = occurrence + 1
+                galaxy_quantity = (
+                    galaxy_quantity + quantities_of_profiles[id(profile)][occurrence]
+                )
+
+            quantities[entry_index] += galaxy_quantity
+
+    return quantities
+
+
+def binned_images_from(images, mask):
+    """
+    Bin up a stack of images computed on a sub-grid (e.g. the image of every galaxy of a tracer) from an ndarray of
+    shape [total_images, total_sub_pixels] to an ndarray of shape [total_images, total_unmasked_pixels], using the
+    same calculation as `Array.in_1d_binned`.
+
+    Parameters
+    ----------
+    images : np.ndarray
+        The images computed on the sub-grid of the mask.
+    mask : Mask2D
+        The mask of the sub-grid the images are computed on.
+    """
+    return np.multiply(
+        mask.sub_fraction,
+        images.reshape(images.shape[0], -1, mask.sub_length).sum(axis=2),
+    )
+
+
+def blurred_images_from_images_and_convolver(
+    images, blurring_images, grid, blurring_grid, convolver
+):
+    """
+    Returns the PSF blurred image of every image of a stack of images and blurring images computed on a sub-grid
+    and blurring sub-grid (e.g. the images of every galaxy of a tracer), as an ndarray of shape
+    [total_images, total_unmasked_pixels].
+
+    The images are binned up together and the whole stack is convolved in one call of a numba convolution which
+    loops over the images (see `convolve_images_into_jit`), without creating an `Array` for each image. The results
+    are identical to calling `Convolver.convolved_image_from_image_and_blurring_image` for each image.
+
+    Parameters
+    ----------
+    images : np.ndarray
+        The images on the sub-grid, as an ndarray of shape [total_images, total_sub_pixels].
+    blurring_images : np.ndarray
+        The images on the blurring sub-grid, as an ndarray of shape [total_images, total_blurring_sub_pixels].
+    grid : Grid
+        The masked (y,x) grid the images are computed on.
+    blurring_grid : Grid
+        The (y,x) grid of masked pixels whose light is blurred into the masked pixels by the PSF.
+    convolver : Convolver
+        The convolver which performs the PSF convolution on the masked grid.
+    """
+    binned_images = binned_images_from(images=images, mask=grid.mask)
+    binned_blurring_images = binned_images_from(
+        images=blurring_images, mask=blurring_grid.mask
+    )
+
+    return convolve_images_into_jit(
+        image_1d_arrays=binned_images,
+        image_frame_1d_indexes=convolver.image_frame_1d_indexes,
+        image_frame_1d_kernels=convolver.image_frame_1d_kernels,
+        image_frame_1d_lengths=convolver.image_frame_1d_lengths,
+        blurring_1d_arrays=binned_blurring_images,
+        blurring_frame_1d_indexes=convolver.blurring_frame_1d_indexes,
+        blurring_frame_1d_kernels=convolver.blurring_frame_1d_kernels,
+        blurring_frame_1d_lengths=convolver.blurring_frame_1d_lengths,
+        out=np.zeros(shape=binned_images.shape),
+    )
+
+
+def convolved_image_from_image_blurring_image_and_convolver(
+    image, blurring_image, convolver, out
+):
+    """
+    Convolve a binned image and blurring image with the PSF of a convolver, writing the blurred image into a
+    preallocated ndarray (e.g. a buffer reused between likelihood evaluations) rather than allocating a new array.
+
+    The convolution is identical to `Convolver.convolved_image_from_image_and_blurring_image`.
+
+    Parameters
+    ----------
+    image : np.ndarray
+        The binned image of the masked pixels, which is blurred by the PSF.
+    blurring_image : np.ndarray
+        The binned image of the pixels outside the mask, whose light is blurred into the masked pixels by the PSF.
+    convolver : Convolver
+        The convolver which performs the PSF convolution on the masked grid.
+    out : np.ndarray
+        The ndarray the blurred image is written to, of the same shape as the image.
+    """
+    return convolve_into_jit(
+        image_1d_array=image,
+        image_frame_1d_indexes=convolver.image_frame_1d_indexes,
+        image_frame_1d_kernels=convolver.image_frame_1d_kernels,
+        image_frame_1d_lengths=convolver.image_frame_1d_lengths,
+        blurring_1d_array=blurring_image,
+        blurring_frame_1d_indexes=convolver.blurring_frame_1d_indexes,
+        blurring_frame_1d_kernels=convolver.blurring_frame_1d_kernels,
+        blurring_frame_1d_lengths=convolver.blurring_frame_1d_lengths,
+        out=out,
+    )
+
+
+@decorator_util.jit()
+def convolve_into_jit(
+    image_1d_array,
+    image_frame_1d_indexes,
+    image_frame_1d_kernels,
+    image_frame_1d_lengths,
+    blurring_1d_array,
+    blurring_frame_1d_indexes,
+    blurring_frame_1d_kernels,
+    blurring_frame_1d_lengths,
+    out,
+):
+
+    for image_1d_index in range(out.shape[0]):
+        out[image_1d_index] = 0.0
+
+    for image_1d_index in range(len(image_1d_array)):
+
+        frame_1d_indexes = image_frame_1d_indexes[image_1d_index]
+        frame_1d_kernel = image_frame_1d_kernels[image_1d_index]
+        frame_1d_length = image_frame_1d_lengths[image_1d_index]
+        image_value = image_1d_array[image_1d_index]
+
+        for kernel_1d_index in range(frame_1d_length):
+
+            vector_index = frame_1d_indexes[kernel_1d_index]
+            kernel_value = frame_1d_kernel[kernel_1d_index]
+            out[vector_index] += image_value * kernel_value
+
+    for blurring_1d_index in range(len(blurring_1d_array)):
+
+        frame_1d_indexes = blurring_frame_1d_indexes[blurring_1d_index]
+        frame_1d_kernel = blurring_frame_1d_kernels[blurring_1d_index]
+        frame_1d_length = blurring_frame_1d_lengths[blurring_1d_index]
+        image_value = blurring_1d_array[blurring_1d_index]
+
+        for kernel_1d_index in range(frame_1d_length):
+
+            vector_index = frame_1d_indexes[kernel_1d_index]
+            kernel_value = frame_1d_kernel[kernel_1d_index]
+            out[vector_index] += image_value * kernel_value
+
+    return out
+
+
+@decorator_util.jit()
+def convolve_images_into_jit(
+    image_1d_arrays,
+    image_frame_1d_indexes,
+    image_frame_1d_kernels,
+    image_frame_1d_lengths,
+    blurring_1d_arrays,
+    blurring_frame_1d_indexes,
+    blurring_frame_1d_kernels,
+    blurring_frame_1d_lengths,
+    out,
+):
+
+    for image_index in range(image_1d_arrays.shape[0]):
+
+        convolve_into_jit(
+            image_1d_array=image_1d_arrays[image_index],
+            image_frame_1d_indexes=image_frame_1d_indexes,
+            image_frame_1d_kernels=image_frame_1d_kernels,
+            image_frame_1d_lengths=image_frame_1d_lengths,
+            blurring_1d_array=blurring_1d_arrays[image_index],
+            blurring_frame_1d_indexes=blurring_frame_1d_indexes,
+            blurring_frame_1d_kernels=blurring_frame_1d_kernels,
+            blurring_frame_1d_lengths=blurring_frame_1d_lengths,
+            out=out[image_index],
+        )
+
+    return out
+
+
+class TraceCache:
+    def __init__(self):
+        """
+        Stores the traced grids of every plane for the grids ray-traced by a tracer within a `trace_cache_scope`,
+        keyed by the identity of the input grid.
+
+        A request for the traced grids up to a plane index limit is served by any cached entry of the same grid that
+        was traced to that plane or beyond.
+
+        The number of requests served from the cache (hits) and requiring ray-tracing (misses) are counted, where
+        every hit saves the deflection angle calculation of every plane below the plane index limit. Tracing a grid
+        and blurring grid together (see `images_of_planes_from_grid_and_blurring_grid`) counts as one miss.
+        """
+        self._traced_grids = {}
+        self.hits = 0
+        self.misses = 0
+
+    def traced_grids_from(self, grid, total_planes):
+        """
+        Returns the cached traced grids of the first `total_planes` planes for a grid, or `None` (counting a miss) if
+        they have not been cached.
+        """
+        cached = self._traced_grids.get(id(grid))
+
+        if cached is not None:
+
+            cached_grid, traced_grids = cached
+
+            if cached_grid is grid and len(traced_grids) >= total_planes:
+                self.hits += 1
+                return traced_grids[:total_planes]
+
+        self.misses += 1
+
+    def has_traced_grids(self, grid):
+        """
+        Whether traced grids of a grid are cached, which is not counted as a hit or miss.
+        """
+        cached = self._traced_grids.get(id(grid))
+
+        return cached is not None and cached[0] is grid
+
+    def add_traced_grids(self, grid, traced_grids):
+        """
+        Cache the traced grids of a grid. A reference to the grid is kept so that its identity cannot be reused by a
+        different grid while it is cached.
+        """
+        cached = self._traced_grids.get(id(grid))
+
+        if cached is not None and cached[0] is grid:
+            if len(cached[1]) > len(traced_grids):
+                return
+
+        self._traced_grids[id(grid)] = (grid, traced_grids)
+
+    def count_miss(self):
+        """
+        Count a miss for grids which are ray-traced without being requested via `traced_grids_from` (e.g. a grid and
+        blurring grid traced together).
+        """
+        self.misses += 1
+
+    def clear(self):
+        self._traced_grids = {}
 
 
 class AbstractTracer(lensing.LensingObject, ABC):
@@ -42,6 +500,27 @@ class AbstractTracer(lensing.LensingObject, ABC):
         self.plane_redshifts = [plane.redshift for plane in planes]
         self.cosmology = cosmology
 
+        # The execution plan of the tracer, which records the planes whose deflection angles, convergence and
+        # potential (mass) or image (light) are computed. Every other plane contributes zeros and is skipped.
+
+        self.plane_indexes_with_mass_profile = tuple(
+            plane_index
+            for plane_index, plane in enumerate(planes)
+            if plane.has_mass_profile
+        )
+        self.plane_indexes_with_light_profile = tuple(
+            plane_index
+            for plane_index, plane in enumerate(planes)
+            if plane.has_light_profile
+        )
+
+        if cosmology is not None and self.all_planes_have_redshifts:
+            self.scaling_factors_of_planes = scaling_factors_of_planes_from(
+                plane_redshifts=tuple(self.plane_redshifts), cosmology=cosmology
+            )
+        else:
+            self.scaling_factors_of_planes = None
+
     @property
     def total_planes(self):
         return len(self.plane_redshifts)
@@ -84,12 +563,7 @@ class AbstractTracer(lensing.LensingObject, ABC):
 
     @property
     def upper_plane_index_with_light_profile(self):
-        return max(
-            [
-                plane_index if plane.has_light_profile else 0
-                for (plane_index, plane) in enumerate(self.planes)
-            ]
-        )
+        return max(self.plane_indexes_with_light_profile, default=0)
 
     @property
     def planes_with_light_profile(self):
@@ -201,44 +675,491 @@ class AbstractTracer(lensing.LensingObject, ABC):
         with open(path.join(file_path, f"{filename}.pickle"), "wb") as f:
             pickle.dump(self, f)
 
+    @classmethod
+    def load_compact(cls, file_path, filename="tracer"):
+        """
+        Load a tracer saved in the compact format by `save_compact`.
+        """
+        return next(
+            cls.generator_from_compact_files(file_paths=[file_path], filename=filename)
+        )
+
+    @classmethod
+    def generator_from_compact_files(cls, file_paths, filename="tracer"):
+        """
+        Returns a generator of the tracers saved in the compact format (see `save_compact`) in every input
+        directory, for example the output directories of many model-fits.
+
+        Every tracer is only read from disk when the generator reaches it, such that a large set of tracers can be
+        iterated over in a memory efficient way, and the tracers share their cosmology object and profile classes.
+
+        Parameters
+        ----------
+        file_paths : [str]
+            The directories containing the "{filename}.json" file of every tracer.
+        filename : str
+            The name of the files of every tracer.
+        """
+        for tracer_kwargs in tracer_serialization.tracer_kwargs_generator_from_files(
+            file_paths=file_paths, filename=filename
+        ):
+            yield cls(**tracer_kwargs)
+
+    def save_compact(self, file_path, filename="tracer"):
+        """
+        Save the tracer in a compact format, which unlike `save` does not pickle the tracer.
+
+        The schema version of the format, the cosmology, the redshift of every plane and galaxy and the parameters of
+        every profile, pixelization, regularization and hyper-galaxy of every galaxy are written to the file
+        "{filename}.json". The hyper images of galaxies are not saved.
+        """
+        tracer_serialization.save_tracer(
+            tracer=self, file_path=file_path, filename=filename
+        )
+
 
 class AbstractTracerLensing(AbstractTracer, ABC):
+    def __init__(self, planes, cosmology, deflections_opening_angle=None):
+        """
+        A tracer which performs lensing calculations (see `AbstractTracer`).
+
+        Parameters
+        ----------
+        planes : [Plane]
+            The planes of the tracer, ordered by redshift.
+        cosmology : astropy.cosmology
+            The cosmology of the ray-tracing calculation.
+        deflections_opening_angle : float or None
+            If input, the deflection angles of planes with multiple mass profiles (e.g. line-of-sight halos) are
+            computed using a `DeflectionsTree` with this opening angle, which approximates the deflection angles of
+            halos far from each (y,x) coordinate by a multipole expansion. If `None`, every plane is summed exactly.
+        """
+        super().__init__(planes=planes, cosmology=cosmology)
+
+        self.deflections_opening_angle = deflections_opening_angle
+
+        self.deflections_trees_of_planes = [
+            DeflectionsTree(
+                mass_profiles=plane.mass_profiles,
+                opening_angle=deflections_opening_angle,
+            )
+            if deflections_opening_angle is not None and len(plane.mass_profiles) > 1
+            else None
+            for plane in planes
+        ]
+
+        if self.scaling_factors_of_planes is not None:
+            self.recursion_factors_of_planes = recursion_factors_of_planes_from(
+                plane_redshifts=tuple(self.plane_redshifts), cosmology=cosmology
+            )
+        else:
+            self.recursion_factors_of_planes = None
+
+        self._traced_grids_workspace = None
+        self._trace_cache = None
+
+    def __getstate__(self):
+        """
+        Scratch buffers and caches used for ray-tracing are not pickled, the buffers are reallocated on the first
+        trace after loading.
+        """
+        state = self.__dict__.copy()
+        state["_traced_grids_workspace"] = None
+        state["_trace_cache"] = None
+        return state
+
+    def tracer_with_galaxies_of_planes_from(self, galaxies_of_planes):
+        """
+        Returns a tracer with the same planes (and their redshifts), cosmology and settings (e.g. the opening angle of
+        its `DeflectionsTree`s) as this tracer, whose planes contain the input galaxies instead.
+
+        Parameters
+        ----------
+        galaxies_of_planes : [[Galaxy]]
+            The galaxies of every plane of the tracer that is returned.
+        """
+        return self.__class__(
+            planes=[
+                pl.Plane(redshift=plane.redshift, galaxies=galaxies)
+                for plane, galaxies in zip(self.planes, galaxies_of_planes)
+            ],
+            cosmology=self.cosmology,
+            deflections_opening_angle=self.deflections_opening_angle,
+        )
+
+    @property
+    def trace_cache(self):
+        """
+        The `TraceCache` of the currently open `trace_cache_scope`, or `None` if no scope is open.
+        """
+        return getattr(self, "_trace_cache", None)
+
+    @contextmanager
+    def trace_cache_scope(self, trace_cache=None):
+        """
+        Open a scope within which the traced grids of every plane are cached, such that every calculation in the
+        scope that traces the same grid (e.g. the image, inversion and blurring grids used by a fit) reuses the
+        traced grids and the deflection angles used to compute them.
+
+        Cached grids are keyed by the identity of the input grid, therefore grids must not be modified in-place
+        within the scope. The cached grids are released when the scope closes, but the yielded `TraceCache` keeps its
+        hit and miss counts. Nested scopes without an input `TraceCache` use the cache of the enclosing scope.
+
+        If a `TraceCache` is input it is used by the scope and its cached grids are not released when the scope
+        closes, such that the owner of the cache (e.g. a fit) can reopen a scope with it for later calculations and
+        release the grids itself via `TraceCache.clear`. This is also the case for a scope nested in a scope with a
+        different cache, where the input cache is used within the nested scope and the cache of the enclosing scope
+        is restored when it closes.
+
+        Example:
+
+            with tracer.trace_cache_scope() as trace_cache:
+                image = tracer.image_from_grid(grid=grid)
+                ...
+
+            print(trace_cache.hits, trace_cache.misses)
+        """
+        enclosing_trace_cache = self.trace_cache
+
+        if trace_cache is None and enclosing_trace_cache is not None:
+            yield enclosing_trace_cache
+            return
+
+        release = trace_cache is None
+
+        if trace_cache is None:
+            trace_cache = TraceCache()
+
+        self._trace_cache = trace_cache
+
+        try:
+            yield trace_cache
+        finally:
+            self._trace_cache = enclosing_trace_cache
+            if release:
+                trace_cache.clear()
+
+    def traced_grids_workspace_from(self, total_pixels):
+        """
+        Returns the preallocated buffers the traced grids of every plane are computed in, which are reused between
+        calls with grids of the same number of (y,x) coordinates.
+
+        The first buffer has shape [total_planes, total_pixels, 2] and holds the traced grid of every plane, the
+        second is a scratch buffer of shape [total_pixels, 2] used to scale deflection angles in-place.
+
+        Parameters
+        ----------
+        total_pixels : int
+            The number of (y,x) coordinates of the grid that is ray-traced.
+        """
+        workspace = getattr(self, "_traced_grids_workspace", None)
+
+        if workspace is None or workspace[0].shape != (
+            self.total_planes,
+            total_pixels,
+            2,
+        ):
+            workspace = (
+                np.zeros(shape=(self.total_planes, total_pixels, 2)),
+                np.zeros(shape=(total_pixels, 2)),
+            )
+            self._traced_grids_workspace = workspace
+
+        return workspace
+
     @grids.grid_like_to_structure_list
     def traced_grids_of_planes_from_grid(self, grid, plane_index_limit=None):
+        """
+        Ray-trace a grid of (y,x) coordinates through every plane of the tracer, returning the traced grid of every
+        plane.
 
-        traced_grids = []
-        traced_deflections = []
+        Ray-tracing uses the recursive form of the multi-plane lens equation, where the traced grid of plane j + 1
+        depends only on the traced grids of planes j and j - 1 and the deflection angles of plane j:
 
-        for (plane_index, plane) in enumerate(self.planes):
+        x_(j+1) = (1 - d_j) * x_(j-1) + d_j * x_j - b_(j,j+1) * a_j
+
+        Here b is the matrix of scaling factors and d the recursion factors (see `recursion_factors_of_planes_from`).
+        Each plane therefore requires O(1) array operations, as opposed to re-summing the scaled deflections of all
+        previous planes. Planes without a mass profile have zero deflection angles, so their deflection angle
+        calculation is skipped. The grids are traced in a workspace that is reused between calls, and are copied out
+        once when returned.
+
+        Parameters
+        ----------
+        grid : Grid or GridIrregularGrouped
+            The image-plane (y,x) coordinates that are ray-traced.
+        plane_index_limit : int or None
+            If input, ray-tracing stops at this plane and only the traced grids up to and including it are returned.
+        """
+        total_planes = (
+            self.total_planes if plane_index_limit is None else plane_index_limit + 1
+        )
+
+        trace_cache = self.trace_cache
+
+        if trace_cache is not None:
+
+            cached_traced_grids = trace_cache.traced_grids_from(
+                grid=grid, total_planes=total_planes
+            )
+
+            if cached_traced_grids is not None:
+                return cached_traced_grids
+
+        traced_grids = [
+            grid_with_structure_of_grid_from(array=traced_grid, grid=grid)
+            for traced_grid in self._traced_grids_of_planes_from(
+                grid=grid, total_planes=total_planes
+            )
+        ]
+
+        if trace_cache is not None:
+            trace_cache.add_traced_grids(grid=grid, traced_grids=traced_grids)
+
+        return traced_grids
+
+    def _traced_grids_of_planes_from(
+        self, grid, total_planes, traced_grids_workspace=None
+    ):
+        """
+        Ray-trace a grid through the first `total_planes` planes (see `traced_grids_of_planes_from_grid`), returning
+        the traced grids as a new ndarray of shape [total_planes, total_pixels, 2].
+
+        If `traced_grids_workspace` is input (see `FitImagingWorkspace.traced_grids_workspace_from`), the grids are
+        traced in its buffers instead of the tracer's and are returned as a view of them rather than copied out.
+        """
+        if traced_grids_workspace is None:
+            traced_grids, scaled_deflections = self.traced_grids_workspace_from(
+                total_pixels=grid.shape[0]
+            )
+        else:
+            traced_grids, scaled_deflections = traced_grids_workspace
+
+        traced_grids[0] = grid
+
+        for plane_index in range(total_planes - 1):
+
+            has_mass_profile = plane_index in self.plane_indexes_with_mass_profile
+
+            if has_mass_profile:
+
+                deflections = self.deflections_of_plane_from_grid(
+                    grid=grid_with_structure_of_grid_from(
+                        array=traced_grids[plane_index], grid=grid
+                    ),
+                    plane_index=plane_index,
+                )
 
-            scaled_grid = grid.copy()
+                np.multiply(
+                    deflections,
+                    self.scaling_factors_of_planes[plane_index + 1, plane_index],
+                    out=scaled_deflections,
+                )
 
-            if plane_index > 0:
-                for previous_plane_index in range(plane_index):
-                    scaling_factor = cosmology_util.scaling_factor_between_redshifts_from(
-                        redshift_0=self.plane_redshifts[previous_plane_index],
-                        redshift_1=plane.redshift,
-                        redshift_final=self.plane_redshifts[-1],
-                        cosmology=self.cosmology,
+            if plane_index == 0:
+                if has_mass_profile:
+                    np.subtract(
+                        traced_grids[0], scaled_deflections, out=traced_grids[1]
                     )
+                else:
+                    traced_grids[1] = traced_grids[0]
+            else:
+                recursion_factor = self.recursion_factors_of_planes[plane_index]
+
+                np.multiply(
+                    traced_grids[plane_index - 1],
+                    1.0 - recursion_factor,
+                    out=traced_grids[plane_index + 1],
+                )
+                if has_mass_profile:
+                    traced_grids[plane_index + 1] -= scaled_deflections
+                np.multiply(
+                    traced_grids[plane_index], recursion_factor, out=scaled_deflections
+                )
+                traced_grids[plane_index + 1] += scaled_deflections
+
+        if traced_grids_workspace is not None:
+            return traced_grids[:total_planes]
+
+        return traced_grids[:total_planes].copy()
+
+    def deflections_of_plane_from_grid(self, grid, plane_index):
+        """
+        Returns the deflection angles of one plane, which uses the plane's `DeflectionsTree` if it has one and
+        otherwise sums the deflection angles of the plane's galaxies exactly.
+
+        Parameters
+        ----------
+        grid : Grid
+            The (y,x) coordinates in the plane the deflection angles are computed on.
+        plane_index : int
+            The index of the plane whose deflection angles are computed.
+        """
+        deflections_tree = self.deflections_trees_of_planes[plane_index]
+
+        if deflections_tree is None:
+            return self.planes[plane_index].deflections_from_grid(grid=grid)
 
-                    scaled_deflections = (
-                        scaling_factor * traced_deflections[previous_plane_index]
+        return deflections_tree.deflections_from_grid(grid=grid)
+
+    def can_trace_grid_and_blurring_grid_together(self, grid, blurring_grid):
+        """
+        Whether a grid and blurring grid can be ray-traced as one concatenated grid (see
+        `images_of_planes_from_grid_and_blurring_grid`).
+
+        This requires both to be a `Grid`, as a `GridIterate` or `GridInterpolate` evaluates functions using
+        properties of the grid itself. Mass profiles with deflection angles preloaded for the grid and blurring grid
+        (e.g. `InputDeflections`) also require them to be traced separately to use their preloads.
+        """
+        if type(grid) is not grids.Grid or type(blurring_grid) is not grids.Grid:
+            return False
+
+        return not any(
+            getattr(mass_profile, "preload_grid", None) is not None
+            or getattr(mass_profile, "preload_blurring_grid", None) is not None
+            for mass_profile in self.mass_profiles
+        )
+
+    def traced_grids_of_planes_from_grid_and_blurring_grid(
+        self, grid, blurring_grid, workspace=None
+    ):
+        """
+        Returns the traced grid of every plane up to the highest plane with a light profile of the grid and blurring
+        grid concatenated into one grid (see `can_trace_grid_and_blurring_grid_together`), such that the images of
+        every plane or galaxy are evaluated on both grids in one calculation.
+
+        Within a `trace_cache_scope` the traced grids of the grid and blurring grid are reused if they are already
+        cached, and otherwise are added to the cache.
+
+        Parameters
+        ----------
+        grid : Grid
+            The masked (y,x) grid which is traced.
+        blurring_grid : Grid
+            The (y,x) grid of masked pixels whose light is blurred into the masked pixels by the PSF.
+        workspace : FitImagingWorkspace or None
+            If input, the workspace of the masked imaging whose grid and blurring grid are traced, whose concatenated
+            grid is used and whose buffers the grids are traced in. The traced grids (and those added to the cache)
+            are then views of the workspace, which are overwritten by the next tracer traced in it.
+        """
+        trace_cache = self.trace_cache
+
+        if (
+            trace_cache is not None
+            and trace_cache.has_traced_grids(grid=grid)
+            and trace_cache.has_traced_grids(grid=blurring_grid)
+        ):
+            plane_index_limit = self.upper_plane_index_with_light_profile
+
+            return [
+                np.concatenate((traced_grid, traced_blurring_grid))
+                for traced_grid, traced_blurring_grid in zip(
+                    self.traced_grids_of_planes_from_grid(
+                        grid=grid, plane_index_limit=plane_index_limit
+                    ),
+                    self.traced_grids_of_planes_from_grid(
+                        grid=blurring_grid, plane_index_limit=plane_index_limit
+                    ),
+                )
+            ]
+
+        total_pixels = grid.shape[0]
+
+        if trace_cache is not None:
+            trace_cache.count_miss()
+
+        total_planes = self.upper_plane_index_with_light_profile + 1
+
+        if workspace is None:
+            traced_grids_of_planes = self._traced_grids_of_planes_from(
+                grid=np.concatenate((grid, blurring_grid)), total_planes=total_planes
+            )
+        else:
+            traced_grids_of_planes = self._traced_grids_of_planes_from(
+                grid=workspace.grid_and_blurring_grid,
+                total_planes=total_planes,
+                traced_grids_workspace=workspace.traced_grids_workspace_from(
+                    total_planes=total_planes
+                ),
+            )
+
+        if trace_cache is not None:
+            trace_cache.add_traced_grids(
+                grid=grid,
+                traced_grids=[
+                    grid_with_structure_of_grid_from(
+                        array=traced_grid[:total_pixels], grid=grid
+                    )
+                    for traced_grid in traced_grids_of_planes
+                ],
+            )
+            trace_cache.add_traced_grids(
+                grid=blurring_grid,
+                traced_grids=[
+                    grid_with_structure_of_grid_from(
+                        array=traced_grid[total_pixels:], grid=blurring_grid
                     )
+                    for traced_grid in traced_grids_of_planes
+                ],
+            )
 
-                    # TODO : Setup as GridInterpolate
+        return traced_grids_of_planes
 
-                    scaled_grid -= scaled_deflections
+    def images_of_planes_from_grid_and_blurring_grid(self, grid, blurring_grid):
+        """
+        Returns the image and blurring image of every plane, which are convolved with a PSF to give the blurred
+        image of every plane.
 
-            traced_grids.append(scaled_grid)
+        Where possible the grid and blurring grid are concatenated into one grid which is traced and used to evaluate
+        the image of every plane once, with the result split back into the image and blurring image. This halves the
+        number of deflection angle and image calculations (and their Python and numba dispatch overhead) compared to
+        evaluating `images_of_planes_from_grid` for each grid.
 
-            if plane_index_limit is not None:
-                if plane_index == plane_index_limit:
-                    return traced_grids
+        Parameters
+        ----------
+        grid : Grid
+            The masked (y,x) grid whose image is convolved.
+        blurring_grid : Grid
+            The (y,x) grid of masked pixels whose light is blurred into the masked pixels by the PSF.
+        """
+        trace_cache = self.trace_cache
+
+        if not self.can_trace_grid_and_blurring_grid_together(
+            grid=grid, blurring_grid=blurring_grid
+        ) or (
+            trace_cache is not None
+            and trace_cache.has_traced_grids(grid=grid)
+            and trace_cache.has_traced_grids(grid=blurring_grid)
+        ):
+            return (
+                self.images_of_planes_from_grid(grid=grid),
+                self.images_of_planes_from_grid(grid=blurring_grid),
+            )
 
-            traced_deflections.append(plane.deflections_from_grid(grid=scaled_grid))
+        total_pixels = grid.shape[0]
 
-        return traced_grids
+        traced_grids_of_planes = self.traced_grids_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
+        )
+
+        images_of_planes = []
+        blurring_images_of_planes = []
+
+        for plane_index, plane in enumerate(self.planes):
+
+            if plane_index in self.plane_indexes_with_light_profile:
+                image = plane.image_from_grid(grid=traced_grids_of_planes[plane_index])
+            else:
+                image = np.zeros(shape=grid.shape[0] + blurring_grid.shape[0])
+
+            images_of_planes.append(
+                grid.structure_from_result(result=image[:total_pixels])
+            )
+            blurring_images_of_planes.append(
+                blurring_grid.structure_from_result(result=image[total_pixels:])
+            )
+
+        return images_of_planes, blurring_images_of_planes
 
     @grids.grid_like_to_structure
     def deflections_between_planes_from_grid(self, grid, plane_i=0, plane_j=-1):
@@ -249,7 +1170,20 @@ class AbstractTracerLensing(AbstractTracer, ABC):
 
     @grids.grid_like_to_structure
     def image_from_grid(self, grid):
-        return sum(self.images_of_planes_from_grid(grid=grid))
+
+        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(
+            grid=grid, plane_index_limit=self.upper_plane_index_with_light_profile
+        )
+
+        return sum_of_arrays_from(
+            arrays=(
+                self.planes[plane_index].image_from_grid(
+                    grid=traced_grids_of_planes[plane_index]
+                )
+                for plane_index in self.plane_indexes_with_light_profile
+            ),
+            shape=grid.shape[0],
+        )
 
     @grids.grid_like_to_structure_list
     def images_of_planes_from_grid(self, grid):
@@ -258,21 +1192,15 @@ class AbstractTracerLensing(AbstractTracer, ABC):
             grid=grid, plane_index_limit=self.upper_plane_index_with_light_profile
         )
 
-        images_of_planes = [
+        return [
             self.planes[plane_index].image_from_grid(
                 grid=traced_grids_of_planes[plane_index]
             )
-            for plane_index in range(len(traced_grids_of_planes))
+            if plane_index in self.plane_indexes_with_light_profile
+            else np.zeros(shape=grid.shape[0])
+            for plane_index in range(self.total_planes)
         ]
 
-        if self.upper_plane_index_with_light_profile < self.total_planes - 1:
-            for plane_index in range(
-                self.upper_plane_index_with_light_profile, self.total_planes - 1
-            ):
-                images_of_planes.append(np.zeros(shape=images_of_planes[0].shape))
-
-        return images_of_planes
-
     def padded_image_from_grid_and_psf_shape(self, grid, psf_shape_2d):
 
         padded_grid = grid.padded_grid_from_kernel_shape(kernel_shape_2d=psf_shape_2d)
@@ -281,11 +1209,23 @@ class AbstractTracerLensing(AbstractTracer, ABC):
 
     @grids.grid_like_to_structure
     def convergence_from_grid(self, grid):
-        return sum([plane.convergence_from_grid(grid=grid) for plane in self.planes])
+        return sum_of_arrays_from(
+            arrays=(
+                self.planes[plane_index].convergence_from_grid(grid=grid)
+                for plane_index in self.plane_indexes_with_mass_profile
+            ),
+            shape=grid.shape[0],
+        )
 
     @grids.grid_like_to_structure
     def potential_from_grid(self, grid):
-        return sum([plane.potential_from_grid(grid=grid) for plane in self.planes])
+        return sum_of_arrays_from(
+            arrays=(
+                self.planes[plane_index].potential_from_grid(grid=grid)
+                for plane_index in self.plane_indexes_with_mass_profile
+            ),
+            shape=grid.shape[0],
+        )
 
     @grids.grid_like_to_structure
     def deflections_from_grid(self, grid):
@@ -293,7 +1233,13 @@ class AbstractTracerLensing(AbstractTracer, ABC):
 
     @grids.grid_like_to_structure
     def deflections_of_planes_summed_from_grid(self, grid):
-        return sum([plane.deflections_from_grid(grid=grid) for plane in self.planes])
+        return sum_of_arrays_from(
+            arrays=(
+                self.planes[plane_index].deflections_from_grid(grid=grid)
+                for plane_index in self.plane_indexes_with_mass_profile
+            ),
+            shape=(grid.shape[0], 2),
+        )
 
     def grid_at_redshift_from_grid_and_redshift(self, grid, redshift):
         """For an input grid of (y,x) arc-second image-plane coordinates, ray-trace the coordinates to any redshift in \
@@ -301,7 +1247,7 @@ class AbstractTracerLensing(AbstractTracer, ABC):
 
         This is performed using multi-plane ray-tracing and the existing redshifts and planes of the tracer. However, \
         any redshift can be input even if a plane does not exist there, including redshifts before the first plane \
-        of the lens system.
+        of the lens system (see `grids_at_redshifts_from_grid_and_redshifts`).
 
         Parameters
         ----------
@@ -310,32 +1256,108 @@ class AbstractTracerLensing(AbstractTracer, ABC):
         redshift : float
             The redshift the image-plane grid is traced to.
         """
+        return self.grids_at_redshifts_from_grid_and_redshifts(
+            grid=grid, redshifts=[redshift]
+        )[0]
 
-        if redshift <= self.plane_redshifts[0]:
-            return grid.copy()
+    @grids.grid_like_to_structure_list
+    def grids_at_redshifts_from_grid_and_redshifts(self, grid, redshifts):
+        """For an input grid of (y,x) arc-second image-plane coordinates, ray-trace the coordinates to every input
+        redshift in the strong lens configuration, which need not correspond to the redshift of a plane.
 
-        plane_index_with_redshift = [
-            plane_index
-            for plane_index, plane in enumerate(self.planes)
-            if plane.redshift == redshift
+        The grid is traced once through the planes up to the highest input redshift, reusing grids already traced
+        within a `trace_cache_scope`. The grid at a redshift z between planes j and j + 1 then requires only the last
+        step of the recursive multi-plane lens equation (see `traced_grids_of_planes_from_grid`):
+
+        x_z = (1 - d_z) * x_(j-1) + d_z * x_j - b_(j,z) * a_j
+
+        where the scaled deflection angles of plane j are recovered from the traced grid of plane j + 1, such that no
+        deflection angles are recomputed. The tracer is not modified.
+
+        Parameters
+        ----------
+        grid : np.ndarray or aa.Grid
+            The image-plane grid which is traced to every redshift.
+        redshifts : [float]
+            The redshifts the image-plane grid is traced to, which cannot exceed the redshift of the final plane.
+        """
+        if max(redshifts) > self.plane_redshifts[-1]:
+            raise exc.RayTracingException(
+                "A grid cannot be traced to a redshift beyond the final plane of the tracer"
+            )
+
+        upper_plane_indexes = [
+            min(np.searchsorted(self.plane_redshifts, redshift), self.total_planes - 1)
+            for redshift in redshifts
         ]
 
-        if plane_index_with_redshift:
-            return self.traced_grids_of_planes_from_grid(grid=grid)[
-                plane_index_with_redshift[0]
-            ]
+        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(
+            grid=grid, plane_index_limit=max(upper_plane_indexes)
+        )
 
-        for plane_index, plane_redshift in enumerate(self.plane_redshifts):
+        grids_at_redshifts = []
 
-            if redshift < plane_redshift:
-                plane_index_insert = plane_index
+        for redshift, upper_plane_index in zip(redshifts, upper_plane_indexes):
 
-        planes = self.planes
-        planes.insert(plane_index_insert, pl.Plane(redshift=redshift, galaxies=[]))
+            if redshift <= self.plane_redshifts[0]:
+                grids_at_redshifts.append(np.asarray(grid).copy())
+            elif redshift == self.plane_redshifts[upper_plane_index]:
+                grids_at_redshifts.append(
+                    np.asarray(traced_grids_of_planes[upper_plane_index])
+                )
+            else:
+                grids_at_redshifts.append(
+                    self.grid_between_planes_from(
+                        traced_grids_of_planes=traced_grids_of_planes,
+                        plane_index=upper_plane_index - 1,
+                        redshift=redshift,
+                    )
+                )
 
-        tracer = Tracer(planes=planes, cosmology=self.cosmology)
+        return grids_at_redshifts
+
+    def grid_between_planes_from(self, traced_grids_of_planes, plane_index, redshift):
+        """
+        Returns the grid at a redshift between the plane `plane_index` and the next plane, using the traced grids of
+        the planes up to and including the next plane (see `grids_at_redshifts_from_grid_and_redshifts`).
+        """
+        scaling_factor = cosmology_util.scaling_factor_between_redshifts_from(
+            redshift_0=self.plane_redshifts[plane_index],
+            redshift_1=redshift,
+            redshift_final=self.plane_redshifts[-1],
+            cosmology=self.cosmology,
+        ) / (self.scaling_factors_of_planes[plane_index + 1, plane_index])
+
+        traced_grid = np.asarray(traced_grids_of_planes[plane_index])
+        traced_grid_next = np.asarray(traced_grids_of_planes[plane_index + 1])
+
+        if plane_index == 0:
+            return traced_grid - scaling_factor * (traced_grid - traced_grid_next)
+
+        traced_grid_previous = np.asarray(traced_grids_of_planes[plane_index - 1])
+
+        recursion_factor = self.recursion_factors_of_planes[plane_index]
+        recursion_factor_at_redshift = (
+            cosmology_util.scaling_factor_between_redshifts_from(
+                redshift_0=self.plane_redshifts[plane_index - 1],
+                redshift_1=redshift,
+                redshift_final=self.plane_redshifts[-1],
+                cosmology=self.cosmology,
+            )
+            / self.scaling_factors_of_planes[plane_index, plane_index - 1]
+        )
 
-        return tracer.traced_grids_of_planes_from_grid(grid=grid)[plane_index_insert]
+        scaled_deflections = (
+            (1.0 - recursion_factor) * traced_grid_previous
+            + recursion_factor * traced_grid
+            - traced_grid_next
+        )
+
+        return (
+            (1.0 - recursion_factor_at_redshift) * traced_grid_previous
+            + recursion_factor_at_redshift * traced_grid
+            - scaling_factor * scaled_deflections
+        )
 
     @property
     def contribution_map(self):
@@ -383,9 +1405,17 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         if not self.has_light_profile:
             return np.zeros(shape=grid.shape_1d)
 
-        image = self.image_from_grid(grid=grid)
-
-        blurring_image = self.image_from_grid(grid=blurring_grid)
+        if self.can_trace_grid_and_blurring_grid_together(
+            grid=grid, blurring_grid=blurring_grid
+        ):
+            images_of_planes, blurring_images_of_planes = self.images_of_planes_from_grid_and_blurring_grid(
+                grid=grid, blurring_grid=blurring_grid
+            )
+            image = sum(images_of_planes)
+            blurring_image = sum(blurring_images_of_planes)
+        else:
+            image = self.image_from_grid(grid=grid)
+            blurring_image = self.image_from_grid(grid=blurring_grid)
 
         return psf.convolved_array_from_array_2d_and_mask(
             array_2d=image.in_2d_binned + blurring_image.in_2d_binned, mask=grid.mask
@@ -403,20 +1433,40 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
+        if not self.can_trace_grid_and_blurring_grid_together(
+            grid=grid, blurring_grid=blurring_grid
+        ):
+
+            traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
+            traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
+                grid=blurring_grid
+            )
+            return [
+                plane.blurred_image_from_grid_and_psf(
+                    grid=traced_grids_of_planes[plane_index],
+                    psf=psf,
+                    blurring_grid=traced_blurring_grids_of_planes[plane_index],
+                )
+                for (plane_index, plane) in enumerate(self.planes)
+            ]
+
+        images_of_planes, blurring_images_of_planes = self.images_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
         )
+
         return [
-            plane.blurred_image_from_grid_and_psf(
-                grid=traced_grids_of_planes[plane_index],
-                psf=psf,
-                blurring_grid=traced_blurring_grids_of_planes[plane_index],
+            psf.convolved_array_from_array_2d_and_mask(
+                array_2d=image.in_2d_binned + blurring_image.in_2d_binned,
+                mask=grid.mask,
+            )
+            for image, blurring_image in zip(
+                images_of_planes, blurring_images_of_planes
             )
-            for (plane_index, plane) in enumerate(self.planes)
         ]
 
-    def blurred_image_from_grid_and_convolver(self, grid, convolver, blurring_grid):
+    def blurred_image_from_grid_and_convolver(
+        self, grid, convolver, blurring_grid, out=None, workspace=None
+    ):
         """Extract the 1D image and 1D blurring image of every plane and blur each with the \
         PSF using a convolver (see imaging.convolution).
 
@@ -426,19 +1476,111 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         ----------
         convolver : hyper_galaxies.imaging.convolution.ConvolverImage
             Class which performs the PSF convolution of a masked image in 1D.
+        out : np.ndarray or None
+            If input, a preallocated ndarray of shape [total_unmasked_pixels] the blurred image is written to and
+            returned as, instead of a new `Array`.
+        workspace : FitImagingWorkspace or None
+            If input with `out`, the workspace of the masked imaging whose grid and blurring grid are input, whose
+            buffers the grids are traced in and the images are summed and binned in (see
+            `binned_image_and_blurring_image_from_grid_and_blurring_grid`).
         """
 
         if not self.has_light_profile:
+            if out is not None:
+                out.fill(0.0)
+                return out
             return np.zeros(shape=grid.shape_1d)
 
-        image = self.image_from_grid(grid=grid)
+        if self.can_trace_grid_and_blurring_grid_together(
+            grid=grid, blurring_grid=blurring_grid
+        ):
+            if out is not None and workspace is not None:
+                (
+                    image,
+                    blurring_image,
+                ) = self.binned_image_and_blurring_image_from_grid_and_blurring_grid(
+                    grid=grid, blurring_grid=blurring_grid, workspace=workspace
+                )
+
+                return convolved_image_from_image_blurring_image_and_convolver(
+                    image=image,
+                    blurring_image=blurring_image,
+                    convolver=convolver,
+                    out=out,
+                )
+
+            images_of_planes, blurring_images_of_planes = self.images_of_planes_from_grid_and_blurring_grid(
+                grid=grid, blurring_grid=blurring_grid
+            )
+            image = sum(images_of_planes)
+            blurring_image = sum(blurring_images_of_planes)
+        else:
+            image = self.image_from_grid(grid=grid)
+            blurring_image = self.image_from_grid(grid=blurring_grid)
 
-        blurring_image = self.image_from_grid(grid=blurring_grid)
+        if out is not None:
+            return convolved_image_from_image_blurring_image_and_convolver(
+                image=image.in_1d_binned,
+                blurring_image=blurring_image.in_1d_binned,
+                convolver=convolver,
+                out=out,
+            )
 
         return convolver.convolved_image_from_image_and_blurring_image(
             image=image, blurring_image=blurring_image
         )
 
+    def binned_image_and_blurring_image_from_grid_and_blurring_grid(
+        self, grid, blurring_grid, workspace
+    ):
+        """
+        Returns the binned image and blurring image of the tracer, computed in the buffers of the workspace of a
+        masked imaging dataset rather than new arrays (see `images_of_planes_from_grid_and_blurring_grid`).
+
+        The grid and blurring grid are traced together in the workspace's traced grid buffers, the images of every
+        plane are summed in its image buffer in the same order as `sum(images_of_planes)` and the summed image is
+        binned in its binned image and blurring image buffers in the same way as `Array.in_1d_binned`, such that the
+        results are identical. The images of every plane are still computed by their light profiles as new arrays.
+
+        Parameters
+        ----------
+        grid : Grid
+            The masked (y,x) grid of the workspace's masked imaging.
+        blurring_grid : Grid
+            The (y,x) grid of masked pixels whose light is blurred into the masked pixels by the PSF.
+        workspace : FitImagingWorkspace
+            The workspace of the masked imaging, whose buffers are returned.
+        """
+        traced_grids_of_planes = self.traced_grids_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid, workspace=workspace
+        )
+
+        image = workspace.image
+        image.fill(0.0)
+
+        for plane_index in self.plane_indexes_with_light_profile:
+            np.add(
+                image,
+                self.planes[plane_index].image_from_grid(
+                    grid=traced_grids_of_planes[plane_index]
+                ),
+                out=image,
+            )
+
+        total_pixels = grid.shape[0]
+
+        binned_images = []
+
+        for sub_image, binned_image, mask in (
+            (image[:total_pixels], workspace.binned_image, grid.mask),
+            (image[total_pixels:], workspace.binned_blurring_image, blurring_grid.mask),
+        ):
+            np.sum(sub_image.reshape(-1, mask.sub_length), axis=1, out=binned_image)
+            np.multiply(mask.sub_fraction, binned_image, out=binned_image)
+            binned_images.append(binned_image)
+
+        return binned_images[0], binned_images[1]
+
     def blurred_images_of_planes_from_grid_and_convolver(
         self, grid, convolver, blurring_grid
     ):
@@ -453,23 +1595,43 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
+        if not self.can_trace_grid_and_blurring_grid_together(
+            grid=grid, blurring_grid=blurring_grid
+        ):
+
+            traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
+            traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
+                grid=blurring_grid
+            )
+
+            return [
+                plane.blurred_image_from_grid_and_convolver(
+                    grid=traced_grids_of_planes[plane_index],
+                    convolver=convolver,
+                    blurring_grid=traced_blurring_grids_of_planes[plane_index],
+                )
+                for (plane_index, plane) in enumerate(self.planes)
+            ]
+
+        images_of_planes, blurring_images_of_planes = self.images_of_planes_from_grid_and_blurring_grid(
+            grid=grid, blurring_grid=blurring_grid
         )
 
         return [
-            plane.blurred_image_from_grid_and_convolver(
-                grid=traced_grids_of_planes[plane_index],
-                convolver=convolver,
-                blurring_grid=traced_blurring_grids_of_planes[plane_index],
+            convolver.convolved_image_from_image_and_blurring_image(
+                image=image, blurring_image=blurring_image
+            )
+            for image, blurring_image in zip(
+                images_of_planes, blurring_images_of_planes
             )
-            for (plane_index, plane) in enumerate(self.planes)
         ]
 
-    def unmasked_blurred_image_from_grid_and_psf(self, grid, psf):
+    def unmasked_blurred_image_from_grid_and_psf(self, grid, psf, padded_grid=None):
 
-        padded_grid = grid.padded_grid_from_kernel_shape(kernel_shape_2d=psf.shape_2d)
+        if padded_grid is None:
+            padded_grid = grid.padded_grid_from_kernel_shape(
+                kernel_shape_2d=psf.shape_2d
+            )
 
         padded_image = self.image_from_grid(grid=padded_grid)
 
@@ -477,9 +1639,14 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             padded_array=padded_image, psf=psf, image_shape=grid.mask.shape
         )
 
-    def unmasked_blurred_image_of_planes_from_grid_and_psf(self, grid, psf):
+    def unmasked_blurred_image_of_planes_from_grid_and_psf(
+        self, grid, psf, padded_grid=None
+    ):
 
-        padded_grid = grid.padded_grid_from_kernel_shape(kernel_shape_2d=psf.shape_2d)
+        if padded_grid is None:
+            padded_grid = grid.padded_grid_from_kernel_shape(
+                kernel_shape_2d=psf.shape_2d
+            )
 
         traced_padded_grids = self.traced_grids_of_planes_from_grid(grid=padded_grid)
 
@@ -497,36 +1664,75 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         return unmasked_blurred_images_of_planes
 
     def unmasked_blurred_image_of_planes_and_galaxies_from_grid_and_psf(
-        self, grid, psf
+        self, grid, psf, psf_fft=None, padded_grid=None
     ):
+        """
+        Returns the unmasked PSF blurred image of every galaxy of every plane, as a list of lists of the galaxies
+        in each plane.
+
+        The padded images of all galaxies of all planes are stacked and convolved with the PSF in one pass (see
+        `KernelFFT`), as opposed to convolving the image of every galaxy separately.
 
-        unmasked_blurred_images_of_planes_and_galaxies = []
+        Parameters
+        ----------
+        grid : Grid
+            The masked (y,x) grid whose padded grid the images are evaluated on.
+        psf : Kernel
+            The PSF the images are convolved with.
+        psf_fft : KernelFFT
+            The `KernelFFT` of the PSF, which caches the FFT of the PSF (e.g. the `psf_fft` of a `MaskedImaging`).
+            If not input it is created for this calculation.
+        padded_grid : Grid
+            The padded grid of the grid for the PSF's shape, which is computed if not input. Inputting the same padded
+            grid to the unmasked blurred image methods within a `trace_cache_scope` traces it once.
+        """
+        if psf_fft is None:
+            psf_fft = KernelFFT(kernel=psf)
 
-        padded_grid = grid.padded_grid_from_kernel_shape(kernel_shape_2d=psf.shape_2d)
+        if padded_grid is None:
+            padded_grid = grid.padded_grid_from_kernel_shape(
+                kernel_shape_2d=psf.shape_2d
+            )
 
         traced_padded_grids = self.traced_grids_of_planes_from_grid(grid=padded_grid)
 
-        for plane, traced_padded_grid in zip(self.planes, traced_padded_grids):
-            padded_image_1d_of_galaxies = plane.images_of_galaxies_from_grid(
+        padded_images_2d = [
+            padded_image_of_galaxy.in_2d_binned
+            for plane, traced_padded_grid in zip(self.planes, traced_padded_grids)
+            for padded_image_of_galaxy in plane.images_of_galaxies_from_grid(
                 grid=traced_padded_grid
             )
+        ]
 
-            unmasked_blurred_array_2d_of_galaxies = list(
-                map(
-                    lambda padded_image_1d_of_galaxy: padded_grid.mask.unmasked_blurred_array_from_padded_array_psf_and_image_shape(
-                        padded_array=padded_image_1d_of_galaxy,
-                        psf=psf,
-                        image_shape=grid.mask.shape,
-                    ),
-                    padded_image_1d_of_galaxies,
-                )
-            )
+        if not padded_images_2d:
+            return [[] for plane in self.planes]
+
+        blurred_images_2d = psf_fft.convolved_arrays_2d_from_arrays_2d(
+            arrays_2d=padded_images_2d
+        )
 
-            unmasked_blurred_images_of_planes_and_galaxies.append(
-                unmasked_blurred_array_2d_of_galaxies
+        mask = padded_grid.mask
+
+        pad_size_0 = (mask.shape[0] - grid.mask.shape[0]) // 2
+        pad_size_1 = (mask.shape[1] - grid.mask.shape[1]) // 2
+
+        unmasked_blurred_images = iter(
+            arrays.Array.manual(
+                array=blurred_image_2d[
+                    pad_size_0 : mask.shape[0] - pad_size_0,
+                    pad_size_1 : mask.shape[1] - pad_size_1,
+                ],
+                pixel_scales=mask.pixel_scales,
+                sub_size=1,
+                origin=mask.origin,
             )
+            for blurred_image_2d in blurred_images_2d
+        )
 
-        return unmasked_blurred_images_of_planes_and_galaxies
+        return [
+            [next(unmasked_blurred_images) for galaxy in plane.galaxies]
+            for plane in self.planes
+        ]
 
     def profile_visibilities_from_grid_and_transformer(self, grid, transformer):
 
@@ -588,7 +1794,8 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
                 traced_sparse_grids_of_planes.append(None)
             else:
                 traced_sparse_grids = self.traced_grids_of_planes_from_grid(
-                    grid=sparse_image_plane_grids_of_planes[plane_index]
+                    grid=sparse_image_plane_grids_of_planes[plane_index],
+                    plane_index_limit=plane_index,
                 )
                 traced_sparse_grids_of_planes.append(traced_sparse_grids[plane_index])
 
@@ -701,28 +1908,76 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
     ) -> {g.Galaxy: np.ndarray}:
         """
         A dictionary associating galaxies with their corresponding model images
+
+        Where possible the grid and blurring grid are traced together once (see
+        `traced_grids_of_planes_from_grid_and_blurring_grid`), the images of all galaxies of all planes are stacked
+        and binned together and then blurred with the convolver, as opposed to computing the image and blurring image
+        of every galaxy separately. Galaxies without light profiles are given images of zeros.
         """
 
-        galaxy_blurred_image_dict = dict()
+        if not self.can_trace_grid_and_blurring_grid_together(
+            grid=grid, blurring_grid=blurring_grid
+        ):
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
+            galaxy_blurred_image_dict = dict()
 
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
-        )
+            traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
 
-        for (plane_index, plane) in enumerate(self.planes):
-            blurred_images_of_galaxies = plane.blurred_images_of_galaxies_from_grid_and_convolver(
-                grid=traced_grids_of_planes[plane_index],
-                convolver=convolver,
-                blurring_grid=traced_blurring_grids_of_planes[plane_index],
+            traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
+                grid=blurring_grid
             )
-            for (galaxy_index, galaxy) in enumerate(plane.galaxies):
-                galaxy_blurred_image_dict[galaxy] = blurred_images_of_galaxies[
-                    galaxy_index
-                ]
 
-        return galaxy_blurred_image_dict
+            for (plane_index, plane) in enumerate(self.planes):
+                blurred_images_of_galaxies = plane.blurred_images_of_galaxies_from_grid_and_convolver(
+                    grid=traced_grids_of_planes[plane_index],
+                    convolver=convolver,
+                    blurring_grid=traced_blurring_grids_of_planes[plane_index],
+                )
+                for (galaxy_index, galaxy) in enumerate(plane.galaxies):
+                    galaxy_blurred_image_dict[galaxy] = blurred_images_of_galaxies[
+                        galaxy_index
+                    ]
+
+            return galaxy_blurred_image_dict
+
+        galaxies = self.galaxies
+
+        total_pixels = grid.shape[0]
+
+        images = np.zeros(shape=(len(galaxies), total_pixels + blurring_grid.shape[0]))
+
+        if self.has_light_profile:
+
+            traced_grids_of_planes = self.traced_grids_of_planes_from_grid_and_blurring_grid(
+                grid=grid, blurring_grid=blurring_grid
+            )
+
+            galaxy_index = 0
+
+            for plane_index, plane in enumerate(self.planes):
+                for galaxy in plane.galaxies:
+
+                    if galaxy.has_light_profile:
+                        images[galaxy_index] = galaxy.image_from_grid(
+                            grid=traced_grids_of_planes[plane_index]
+                        )
+
+                    galaxy_index += 1
+
+        blurred_images = blurred_images_from_images_and_convolver(
+            images=images[:, :total_pixels],
+            blurring_images=images[:, total_pixels:],
+            grid=grid,
+            blurring_grid=blurring_grid,
+            convolver=convolver,
+        )
+
+        return {
+            galaxy: arrays.Array(
+                array=blurred_image, mask=convolver.mask.mask_sub_1, store_in_1d=True
+            )
+            for galaxy, blurred_image in zip(galaxies, blurred_images)
+        }
 
     def galaxy_profile_visibilities_dict_from_grid_and_transformer(
         self, grid, transformer
@@ -754,7 +2009,9 @@ class Tracer(AbstractTracerData):
         return self.planes[1].galaxies[0].light_profiles[0].flux
 
     @classmethod
-    def from_galaxies(cls, galaxies, cosmology=cosmo.Planck15):
+    def from_galaxies(
+        cls, galaxies, cosmology=cosmo.Planck15, deflections_opening_angle=None
+    ):
 
         plane_redshifts = plane_util.ordered_plane_redshifts_from(galaxies=galaxies)
 
@@ -767,7 +2024,11 @@ class Tracer(AbstractTracerData):
         for plane_index in range(0, len(plane_redshifts)):
             planes.append(pl.Plane(galaxies=galaxies_in_planes[plane_index]))
 
-        return Tracer(planes=planes, cosmology=cosmology)
+        return Tracer(
+            planes=planes,
+            cosmology=cosmology,
+            deflections_opening_angle=deflections_opening_angle,
+        )
 
     @classmethod
     def sliced_tracer_from_lens_line_of_sight_and_source_galaxies(
@@ -777,6 +2038,7 @@ class Tracer(AbstractTracerData):
         source_galaxies,
         planes_between_lenses,
         cosmology=cosmo.Planck15,
+        deflections_opening_angle=None,
     ):
 
         """Ray-tracer for a lens system with any number of planes.
@@ -804,6 +2066,9 @@ class Tracer(AbstractTracerData):
             source-plane borders.
         cosmology : astropy.cosmology
             The cosmology of the ray-tracing calculation.
+        deflections_opening_angle : float or None
+            If input, the deflection angles of planes with many line-of-sight galaxies are computed using a
+            `DeflectionsTree` with this opening angle (see `AbstractTracerLensing`).
         """
 
         lens_redshifts = plane_util.ordered_plane_redshifts_from(galaxies=lens_galaxies)
@@ -832,4 +2097,273 @@ class Tracer(AbstractTracerData):
                 )
             )
 
-        return Tracer(planes=planes, cosmology=cosmology)
+        return Tracer(
+            planes=planes,
+            cosmology=cosmology,
+            deflections_opening_angle=deflections_opening_angle,
+        )
+
+
+class TracerBatch:
+    def __init__(self, tracers):
+        """
+        A batch of tracers which share the same model structure (the same plane redshifts and cosmology), for example
+        the models proposed by a non-linear search in one iteration.
+
+        The batch ray-traces a grid through every tracer at once, storing the traced grids of all tracers in one
+        ndarray of shape [total_tracers, total_planes, total_pixels, 2]. The multi-plane lens equation is therefore
+        evaluated once per plane for the whole batch (as opposed to once per plane per tracer). The deflection angles
+        and images of a profile are evaluated once per plane on the traced grids of every tracer it is a profile of,
+        stacked into one grid (see `summed_profile_quantities_of_grids_from`), such that profiles shared by the tracers
+        (e.g. those fixed in a model) are evaluated once for the batch. Profiles with different parameters in every
+        tracer are still evaluated once per tracer, as each profile evaluates its own parameters.
+
+        Parameters
+        ----------
+        tracers : [Tracer]
+            The tracers in the batch, which must all have the same plane redshifts and cosmology.
+        """
+        if len(tracers) == 0:
+            raise exc.RayTracingException("A TracerBatch requires at least one tracer")
+
+        for tracer in tracers[1:]:
+            if (
+                tracer.plane_redshifts != tracers[0].plane_redshifts
+                or tracer.cosmology != tracers[0].cosmology
+            ):
+                raise exc.RayTracingException(
+                    "Every tracer of a TracerBatch must have the same plane redshifts and cosmology"
+                )
+
+        self.tracers = tracers
+
+    @classmethod
+    def from_galaxies_list(cls, galaxies_list, cosmology=cosmo.Planck15):
+        return TracerBatch(
+            tracers=[
+                Tracer.from_galaxies(galaxies=galaxies, cosmology=cosmology)
+                for galaxies in galaxies_list
+            ]
+        )
+
+    def __len__(self):
+        return len(self.tracers)
+
+    @property
+    def total_planes(self):
+        return self.tracers[0].total_planes
+
+    @property
+    def upper_plane_index_with_light_profile(self):
+        return max(
+            tracer.upper_plane_index_with_light_profile for tracer in self.tracers
+        )
+
+    def can_stack_profiles_of_grid(self, grid):
+        """
+        Whether the profiles of the batch can be evaluated on the traced grids of its tracers stacked into one
+        ndarray (see `summed_profile_quantities_of_grids_from`).
+
+        This requires the grid to be a `Grid` or ndarray, as a `GridIterate` or `GridInterpolate` evaluates functions
+        using properties of the grid itself, and no tracer to have mass profiles with preloaded deflection angles.
+        """
+        if type(grid) is not grids.Grid and type(grid) is not np.ndarray:
+            return False
+
+        return not any(
+            getattr(mass_profile, "preload_grid", None) is not None
+            or getattr(mass_profile, "preload_blurring_grid", None) is not None
+            for tracer in self.tracers
+            for mass_profile in tracer.mass_profiles
+        )
+
+    def traced_grids_of_planes_from_grid(self, grid, plane_index_limit=None):
+        """
+        Ray-trace a grid through every tracer of the batch, returning the traced grids as an ndarray of shape
+        [total_tracers, total_planes, total_pixels, 2].
+
+        Parameters
+        ----------
+        grid : Grid
+            The image-plane (y,x) grid which is ray-traced through every tracer.
+        plane_index_limit : int or None
+            If input, the grid is only traced up to (and including) this plane.
+        """
+        total_planes = (
+            self.total_planes if plane_index_limit is None else plane_index_limit + 1
+        )
+
+        tracer = self.tracers[0]
+
+        traced_grids = np.zeros(
+            shape=(len(self.tracers), total_planes, grid.shape[0], 2)
+        )
+        scaled_deflections = np.zeros(shape=(len(self.tracers), grid.shape[0], 2))
+
+        traced_grids[:, 0] = grid
+
+        stack_profiles = self.can_stack_profiles_of_grid(grid=grid)
+
+        for plane_index in range(total_planes - 1):
+
+            if stack_profiles:
+                scaled_deflections[:] = summed_profile_quantities_of_grids_from(
+                    grids_of_batch=traced_grids[:, plane_index],
+                    profiles_of_galaxies_of_batch=[
+                        [
+                            galaxy.mass_profiles
+                            for galaxy in tracer_of_batch.planes[plane_index].galaxies
+                        ]
+                        if tracer_of_batch.deflections_trees_of_planes[plane_index]
+                        is None
+                        else []
+                        for tracer_of_batch in self.tracers
+                    ],
+                    quantity_from=lambda profile, grid: profile.deflections_from_grid(
+                        grid=grid
+                    ),
+                    shape=(grid.shape[0], 2),
+                    grids_are_equal=plane_index == 0,
+                )
+
+            for tracer_index, tracer_of_batch in enumerate(self.tracers):
+
+                if plane_index not in tracer_of_batch.plane_indexes_with_mass_profile:
+                    scaled_deflections[tracer_index] = 0.0
+                    continue
+
+                if (
+                    stack_profiles
+                    and tracer_of_batch.deflections_trees_of_planes[plane_index] is None
+                ):
+                    continue
+
+                scaled_deflections[
+                    tracer_index
+                ] = tracer_of_batch.deflections_of_plane_from_grid(
+                    grid=grid_with_structure_of_grid_from(
+                        array=traced_grids[tracer_index, plane_index], grid=grid
+                    ),
+                    plane_index=plane_index,
+                )
+
+            scaled_deflections *= tracer.scaling_factors_of_planes[
+                plane_index + 1, plane_index
+            ]
+
+            if plane_index == 0:
+                np.subtract(
+                    traced_grids[:, 0], scaled_deflections, out=traced_grids[:, 1]
+                )
+            else:
+                recursion_factor = tracer.recursion_factors_of_planes[plane_index]
+
+                np.multiply(
+                    traced_grids[:, plane_index - 1],
+                    1.0 - recursion_factor,
+                    out=traced_grids[:, plane_index + 1],
+                )
+                traced_grids[:, plane_index + 1] -= scaled_deflections
+                np.multiply(
+                    traced_grids[:, plane_index],
+                    recursion_factor,
+                    out=scaled_deflections,
+                )
+                traced_grids[:, plane_index + 1] += scaled_deflections
+
+        return traced_grids
+
+    def images_from_grid(self, grid):
+        """
+        Returns the image of every tracer of the batch as an ndarray of shape [total_tracers, total_pixels], which is
+        evaluated on the sub-grid of the input grid (e.g. it is not binned up).
+
+        Parameters
+        ----------
+        grid : Grid
+            The image-plane (y,x) grid which is ray-traced through every tracer.
+        """
+        traced_grids = self.traced_grids_of_planes_from_grid(
+            grid=grid, plane_index_limit=self.upper_plane_index_with_light_profile
+        )
+
+        if self.can_stack_profiles_of_grid(grid=grid):
+
+            images = np.zeros(shape=(len(self.tracers), grid.shape[0]))
+
+            for plane_index in range(traced_grids.shape[1]):
+                images += summed_profile_quantities_of_grids_from(
+                    grids_of_batch=traced_grids[:, plane_index],
+                    profiles_of_galaxies_of_batch=[
+                        [
+                            galaxy.light_profiles
+                            for galaxy in tracer.planes[plane_index].galaxies
+                        ]
+                        for tracer in self.tracers
+                    ],
+                    quantity_from=lambda profile, grid: profile.image_from_grid(
+                        grid=grid
+                    ),
+                    shape=(grid.shape[0],),
+                    grids_are_equal=plane_index == 0,
+                )
+
+            return images
+
+        images = np.zeros(shape=(len(self.tracers), grid.shape[0]))
+
+        for tracer_index, tracer in enumerate(self.tracers):
+            for plane_index in tracer.plane_indexes_with_light_profile:
+                images[tracer_index] += tracer.planes[plane_index].image_from_grid(
+                    grid=grid_with_structure_of_grid_from(
+                        array=traced_grids[tracer_index, plane_index], grid=grid
+                    )
+                )
+
+        return images
+
+    def blurred_images_from_grid_and_convolver(self, grid, convolver, blurring_grid):
+        """
+        Returns the PSF blurred image of every tracer of the batch as an ndarray of shape
+        [total_tracers, total_unmasked_pixels], which are binned up from the sub-grid (see
+        `Tracer.blurred_image_from_grid_and_convolver`).
+
+        The grid and blurring grid are concatenated and traced together through every tracer, unless a tracer
+        requires them to be traced separately (see `Tracer.can_trace_grid_and_blurring_grid_together`) in which case
+        each tracer computes its blurred image itself.
+
+        Parameters
+        ----------
+        grid : Grid
+            The masked (y,x) grid whose image is convolved.
+        convolver : Convolver
+            The convolver which performs the PSF convolution on the masked grid.
+        blurring_grid : Grid
+            The (y,x) grid of masked pixels whose light is blurred into the masked pixels by the PSF.
+        """
+        if not all(
+            tracer.can_trace_grid_and_blurring_grid_together(
+                grid=grid, blurring_grid=blurring_grid
+            )
+            for tracer in self.tracers
+        ):
+            return np.stack(
+                [
+                    tracer.blurred_image_from_grid_and_convolver(
+                        grid=grid, convolver=convolver, blurring_grid=blurring_grid
+                    )
+                    for tracer in self.tracers
+                ]
+            )
+
+        total_pixels = grid.shape[0]
+
+        images = self.images_from_grid(grid=np.concatenate((grid, blurring_grid)))
+
+        return blurred_images_from_images_and_convolver(
+            images=images[:, :total_pixels],
+            blurring_images=images[:, total_pixels:],
+            grid=grid,
+            blurring_grid=blurring_grid,
+            convolver=convolver,
+        )
@@ -17,6 +17,7 @@ class SettingsLens:
         stochastic_likelihood_resamples=None,
         stochastic_samples: int = 250,
         stochastic_histogram_bins: int = 10,
+        use_constant_image_cache: bool = False,
     ):
 
         self.positions_threshold = positions_threshold
@@ -27,6 +28,7 @@ class SettingsLens:
         self.stochastic_likelihood_resamples = stochastic_likelihood_resamples
         self.stochastic_samples = stochastic_samples
         self.stochastic_histogram_bins = stochastic_histogram_bins
+        self.use_constant_image_cache = use_constant_image_cache
 
         self.einstein_radius_estimate = None
         self.einstein_radius_count = None
@@ -0,0 +1,423 @@
+import inspect
+import json
+import numpy as np
+from os import path
+from astropy import cosmology as cosmo, units
+from autoarray.inversion import pixelizations as pix, regularization as reg
+from autogalaxy.galaxy import galaxy as g
+from autogalaxy.plane import plane as pl
+from autogalaxy.profiles import light_profiles as lp, mass_profiles as mp
+from autolens import exc
+
+# The version of the compact tracer format, which is incremented whenever the layout of the .json file changes, such
+# that files written by older versions can still be read.
+
+SCHEMA_VERSION = 1
+
+# Galaxy attributes which are not part of the galaxy's model and are therefore not serialized.
+
+GALAXY_ATTRIBUTES_NOT_SERIALIZED = (
+    "id",
+    "redshift",
+    "hyper_model_image",
+    "hyper_galaxy_image",
+)
+
+# The base classes of the objects of a galaxy which can be loaded from a .json file, where only these classes and
+# their subclasses are instantiated such that a file cannot set up an arbitrary object.
+
+SERIALIZABLE_BASE_CLASSES = (
+    lp.LightProfile,
+    mp.MassProfile,
+    pix.Pixelization,
+    reg.Regularization,
+    g.HyperGalaxy,
+    g.Galaxy,
+)
+
+
+def constructor_parameters_from(cls):
+    """
+    Returns the names of the parameters of a class's constructor, which every object that is serialized must store
+    as attributes of the same name.
+    """
+    return [
+        name
+        for name, parameter in inspect.signature(cls.__init__).parameters.items()
+        if name != "self"
+        and parameter.kind
+        not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    ]
+
+
+def serializable_class_from(obj):
+    """
+    Returns the class an object (e.g. a light or mass profile) is serialized as, which is the first class of its
+    method resolution order whose constructor parameters are all attributes of the object.
+
+    Profiles which are set up via a different parameterization (e.g. a `SphericalNFWMCRLudlow`, whose constructor
+    takes a mass and concentration) are therefore serialized as the profile they are converted to (e.g. a
+    `SphericalNFW`), which gives identical lensing calculations.
+    """
+    for cls in type(obj).__mro__:
+
+        if cls is object:
+            break
+
+        if all(
+            hasattr(obj, parameter) for parameter in constructor_parameters_from(cls)
+        ):
+            return cls
+
+    raise exc.RayTracingException(
+        f"The object {obj} cannot be serialized, as its constructor parameters are not attributes of it"
+    )
+
+
+def class_path_from(cls):
+    """
+    Returns the path of a class (e.g. "autogalaxy.profiles.light_profiles.EllipticalSersic") it is serialized as.
+    """
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def serializable_classes_from(base_classes=SERIALIZABLE_BASE_CLASSES):
+    """
+    Returns a dictionary mapping the class path of every class that can be loaded from a .json file to the class,
+    which are the base classes and all of their (imported) subclasses.
+    """
+    classes = {}
+
+    base_classes = list(base_classes)
+
+    while base_classes:
+
+        cls = base_classes.pop()
+
+        if class_path_from(cls=cls) not in classes:
+            classes[class_path_from(cls=cls)] = cls
+            base_classes.extend(cls.__subclasses__())
+
+    return classes
+
+
+def object_dict_from(obj, parameters):
+    """
+    Returns the .json dictionary of an object of a galaxy (e.g. a light or mass profile).
+
+    Every numerical constructor parameter of the object is flattened and appended to the list of the tracer's
+    parameters, with the dictionary storing the index, shape and type of the parameter in this list. Parameters which
+    are not numerical (e.g. None) are stored in the dictionary.
+
+    Parameters
+    ----------
+    obj : object
+        The object (e.g. a light profile, mass profile or pixelization) which is serialized.
+    parameters : [float]
+        The numerical parameters of the tracer's objects serialized so far, which this object's parameters are
+        appended to.
+    """
+    cls = serializable_class_from(obj=obj)
+
+    obj_dict = {
+        "class": class_path_from(cls=cls),
+        "parameters": {},
+        "constants": {},
+    }
+
+    for parameter in constructor_parameters_from(cls):
+
+        value = getattr(obj, parameter)
+
+        if value is None or isinstance(value, (bool, str)):
+            obj_dict["constants"][parameter] = value
+            continue
+
+        array = np.asarray(value)
+
+        if array.dtype.kind not in "iuf":
+            raise exc.RayTracingException(
+                f"The parameter {parameter} of {obj} cannot be serialized"
+            )
+
+        if isinstance(value, tuple):
+            parameter_type = "tuple"
+        elif isinstance(value, np.ndarray):
+            parameter_type = "array"
+        else:
+            parameter_type = "scalar"
+
+        obj_dict["parameters"][parameter] = {
+            "index": len(parameters),
+            "shape": list(array.shape),
+            "type": parameter_type,
+            "integer": bool(array.dtype.kind in "iu"),
+        }
+
+        parameters.extend(array.ravel().tolist())
+
+    return obj_dict
+
+
+def object_from_dict(obj_dict, parameters, classes):
+    """
+    Returns an object (e.g. a light or mass profile) from its .json dictionary and the tracer's parameters (see
+    `object_dict_from`).
+
+    Parameters
+    ----------
+    obj_dict : dict
+        The .json dictionary of the object.
+    parameters : np.ndarray
+        The numerical parameters of all objects of the tracer the object belongs to.
+    classes : dict
+        A dictionary mapping class paths to their classes, which is shared between the tracers of a batch such that
+        every class is looked up once.
+
+    Only light profiles, mass profiles, pixelizations, regularizations and (hyper) galaxies are loaded (see
+    `SERIALIZABLE_BASE_CLASSES`), any other class path raises a `RayTracingException` without being imported.
+    """
+    class_path = obj_dict["class"]
+
+    if class_path not in classes:
+
+        cls = serializable_classes_from().get(class_path)
+
+        if cls is None:
+            raise exc.RayTracingException(
+                f"The class {class_path} cannot be loaded, only light profiles, mass profiles, pixelizations, "
+                f"regularizations and galaxies are supported"
+            )
+
+        classes[class_path] = cls
+
+    kwargs = dict(obj_dict["constants"])
+
+    for parameter, parameter_dict in obj_dict["parameters"].items():
+
+        shape = parameter_dict["shape"]
+        index = parameter_dict["index"]
+
+        array = parameters[index : index + int(np.prod(shape))].reshape(shape)
+
+        if parameter_dict["integer"]:
+            array = array.astype("int")
+
+        if parameter_dict["type"] == "tuple":
+            kwargs[parameter] = tuple(array.tolist())
+        elif parameter_dict["type"] == "array":
+            kwargs[parameter] = array
+        else:
+            kwargs[parameter] = array.item()
+
+    return classes[class_path](**kwargs)
+
+
+def flat_lambda_cdm_dict_from(cosmology):
+    """
+    Returns the .json dictionary of the name and parameters of a `FlatLambdaCDM` cosmology.
+    """
+    return {
+        "name": cosmology.name,
+        "H0": cosmology.H0.value,
+        "Om0": cosmology.Om0,
+        "Tcmb0": cosmology.Tcmb0.value,
+        "Neff": cosmology.Neff,
+        "m_nu": None if cosmology.m_nu is None else cosmology.m_nu.value.tolist(),
+        "Ob0": cosmology.Ob0,
+    }
+
+
+def cosmology_dict_from(cosmology):
+    """
+    Returns the .json dictionary of a cosmology, which is the name of an astropy realization (e.g. Planck15) or the
+    parameters of a `FlatLambdaCDM` cosmology.
+
+    A cosmology is only stored by name if it is the realization of that name or has identical parameters, as a
+    modified copy of a realization (e.g. via `Planck15.clone(H0=...)`) keeps its name.
+    """
+    if cosmology.name in cosmo.parameters.available:
+
+        realization = getattr(cosmo, cosmology.name)
+
+        if cosmology is realization or (
+            type(cosmology) is cosmo.FlatLambdaCDM
+            and type(realization) is cosmo.FlatLambdaCDM
+            and flat_lambda_cdm_dict_from(cosmology=cosmology)
+            == flat_lambda_cdm_dict_from(cosmology=realization)
+        ):
+            return {"name": cosmology.name}
+
+    if type(cosmology) is cosmo.FlatLambdaCDM:
+        return flat_lambda_cdm_dict_from(cosmology=cosmology)
+
+    raise exc.RayTracingException(
+        f"The cosmology {cosmology} cannot be serialized, only astropy realizations and FlatLambdaCDM cosmologies are "
+        f"supported"
+    )
+
+
+def cosmology_from_dict(cosmology_dict, cosmologies):
+    """
+    Returns the cosmology of its .json dictionary (see `cosmology_dict_from`), where identical cosmologies are
+    shared between the tracers of a batch via the `cosmologies` dictionary.
+    """
+    cosmology_key = json.dumps(cosmology_dict, sort_keys=True)
+
+    if cosmology_key not in cosmologies:
+
+        if len(cosmology_dict) == 1:
+            cosmologies[cosmology_key] = getattr(cosmo, cosmology_dict["name"])
+        else:
+            cosmology_kwargs = dict(cosmology_dict)
+
+            if cosmology_kwargs["m_nu"] is not None:
+                cosmology_kwargs["m_nu"] = units.Quantity(
+                    cosmology_kwargs["m_nu"], units.eV
+                )
+
+            cosmologies[cosmology_key] = cosmo.FlatLambdaCDM(**cosmology_kwargs)
+
+    return cosmologies[cosmology_key]
+
+
+def tracer_dict_from(tracer):
+    """
+    Returns the .json dictionary of a tracer, which stores the schema version, the cosmology, the redshift of every
+    plane and the profiles, pixelizations, regularizations and hyper-galaxies of every galaxy, whose numerical
+    parameters are stored in one flat list.
+
+    The hyper images of galaxies are not serialized.
+
+    Parameters
+    ----------
+    tracer : AbstractTracer
+        The tracer which is serialized.
+    """
+    tracer_dict = {
+        "schema_version": SCHEMA_VERSION,
+        "cosmology": cosmology_dict_from(cosmology=tracer.cosmology),
+        "planes": [],
+    }
+
+    if hasattr(tracer, "deflections_opening_angle"):
+        tracer_dict["deflections_opening_angle"] = tracer.deflections_opening_angle
+
+    parameters = []
+
+    for plane in tracer.planes:
+
+        plane_dict = {"redshift": plane.redshift, "galaxies": []}
+
+        for galaxy in plane.galaxies:
+
+            galaxy_dict = {"redshift": galaxy.redshift, "objects": {}}
+
+            for name, value in galaxy.__dict__.items():
+
+                if name in GALAXY_ATTRIBUTES_NOT_SERIALIZED or value is None:
+                    continue
+
+                galaxy_dict["objects"][name] = object_dict_from(
+                    obj=value, parameters=parameters
+                )
+
+            plane_dict["galaxies"].append(galaxy_dict)
+
+        tracer_dict["planes"].append(plane_dict)
+
+    tracer_dict["parameters"] = parameters
+
+    return tracer_dict
+
+
+def tracer_kwargs_from_dict(tracer_dict, classes, cosmologies):
+    """
+    Returns the keyword arguments (planes, cosmology, etc.) which set up a tracer from its .json dictionary (see
+    `tracer_dict_from`).
+
+    Parameters
+    ----------
+    tracer_dict : dict
+        The .json dictionary of the tracer.
+    classes : dict
+        The classes imported by previously loaded tracers (see `object_from_dict`).
+    cosmologies : dict
+        The cosmologies of previously loaded tracers (see `cosmology_from_dict`).
+    """
+    if tracer_dict["schema_version"] > SCHEMA_VERSION:
+        raise exc.RayTracingException(
+            f"The tracer was serialized with schema version {tracer_dict['schema_version']}, which is newer than "
+            f"the schema version {SCHEMA_VERSION} supported by this version of PyAutoLens"
+        )
+
+    parameters = np.asarray(tracer_dict["parameters"], dtype="float")
+
+    planes = []
+
+    for plane_dict in tracer_dict["planes"]:
+
+        galaxies = [
+            g.Galaxy(
+                redshift=galaxy_dict["redshift"],
+                **{
+                    name: object_from_dict(
+                        obj_dict=obj_dict, parameters=parameters, classes=classes
+                    )
+                    for name, obj_dict in galaxy_dict["objects"].items()
+                },
+            )
+            for galaxy_dict in plane_dict["galaxies"]
+        ]
+
+        planes.append(pl.Plane(redshift=plane_dict["redshift"], galaxies=galaxies))
+
+    tracer_kwargs = {
+        "planes": planes,
+        "cosmology": cosmology_from_dict(
+            cosmology_dict=tracer_dict["cosmology"], cosmologies=cosmologies
+        ),
+    }
+
+    if "deflections_opening_angle" in tracer_dict:
+        tracer_kwargs["deflections_opening_angle"] = tracer_dict[
+            "deflections_opening_angle"
+        ]
+
+    return tracer_kwargs
+
+
+def save_tracer(tracer, file_path, filename="tracer"):
+    """
+    Save a tracer in the compact format, as the file "{filename}.json".
+    """
+    with open(path.join(file_path, f"{filename}.json"), "w") as f:
+        json.dump(tracer_dict_from(tracer=tracer), f)
+
+
+def tracer_kwargs_generator_from_files(file_paths, filename="tracer"):
+    """
+    Returns a generator of the keyword arguments which set up the tracers saved in the compact format in every
+    input directory, where every tracer is only read from disk when the generator reaches it.
+
+    The classes and cosmologies of the tracers are shared between them, such that loading a batch of tracers
+    imports every class once and every tracer with the same cosmology uses the same cosmology object.
+
+    Parameters
+    ----------
+    file_paths : [str]
+        The directories containing the "{filename}.json" file of every tracer.
+    filename : str
+        The name of the files of every tracer.
+    """
+    classes = {}
+    cosmologies = {}
+
+    for file_path in file_paths:
+
+        with open(path.join(file_path, f"{filename}.json"), "r") as f:
+            tracer_dict = json.load(f)
+
+        yield tracer_kwargs_from_dict(
+            tracer_dict=tracer_dict, classes=classes, cosmologies=cosmologies
+        )
@@ -143,9 +143,11 @@ class MockResults(af.ResultsCollection):
 
 
 class MockPositionsSolver:
-    def __init__(self, model_positions):
+    def __init__(self, model_positions, magnifications=None, parities=None):
 
         self.model_positions = model_positions
+        self.magnifications = magnifications
+        self.parities = parities
 
-    def solve_from_tracer(self, tracer):
-        return self.model_positions
+    def solve_from_tracer(self, tracer, positions=None):
+        return self.model_positions, self.magnifications, self.parities
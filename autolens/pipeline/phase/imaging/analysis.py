@@ -5,6 +5,7 @@ from autoarray.exc import PixelizationException, InversionException, GridExcepti
 from autofit.exc import FitException
 from autogalaxy.pipeline.phase.dataset import analysis as ag_analysis
 from autolens.fit import fit
+from autolens.lens import ray_tracing
 from autolens.pipeline import visualizer as vis
 from autolens.pipeline.phase.dataset import analysis as analysis_dataset
 from autogalaxy.pipeline.phase.imaging.analysis import Attributes as AgAttributes
@@ -23,6 +24,16 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             results=results,
         )
 
+        self.workspace = fit.FitImagingWorkspace(masked_imaging=masked_imaging)
+
+        self.fit_likelihood = fit.FitImagingLikelihood(
+            masked_imaging=masked_imaging,
+            settings_pixelization=settings.settings_pixelization,
+            settings_inversion=settings.settings_inversion,
+            workspace=self.workspace,
+            use_constant_image_cache=settings.settings_lens.use_constant_image_cache,
+        )
+
     @property
     def masked_imaging(self):
         return self.masked_dataset
@@ -53,6 +64,21 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             tracer=tracer, grid=self.masked_dataset.grid
         )
 
+        return self.log_likelihood_function_for_tracer(instance=instance, tracer=tracer)
+
+    def log_likelihood_function_for_tracer(self, instance, tracer):
+        """
+        Determine the fit of the tracer of a model instance to the masked_imaging, where the tracer has already been
+        set up from the instance (with its hyper images associated) and passed the position and Einstein radius
+        checks of the `log_likelihood_function`.
+
+        Parameters
+        ----------
+        instance
+            A model instance with attributes
+        tracer : ray_tracing.Tracer
+            The tracer of the instance.
+        """
         hyper_image_sky = self.hyper_image_sky_for_instance(instance=instance)
 
         hyper_background_noise = self.hyper_background_noise_for_instance(
@@ -62,11 +88,11 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
         if self.settings.settings_lens.stochastic_likelihood_resamples is None:
 
             try:
-                return self.masked_imaging_fit_for_tracer(
+                return self.fit_likelihood.figure_of_merit_from_tracer(
                     tracer=tracer,
                     hyper_image_sky=hyper_image_sky,
                     hyper_background_noise=hyper_background_noise,
-                ).figure_of_merit
+                )
             except (
                 PixelizationException,
                 InversionException,
@@ -109,6 +135,132 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
 
             return np.mean(figures_of_merit)
 
+    def log_likelihood_function_batch(
+        self, instances, resample_figure_of_merit=-np.inf
+    ):
+        """
+        Determine the fit of many lens galaxy and source galaxy models to the masked_imaging, for example every model
+        proposed by a non-linear search in one iteration.
+
+        Instances whose tracers share the same plane redshifts are fitted together using a `TracerBatch`, which
+        ray-traces the masked grid (and blurring grid) through every tracer at once, evaluating the profiles shared by
+        the tracers once for the batch, and computes the log likelihoods of the blurred images together. Instances which require the full `FitImaging` (e.g. those with a
+        pixelization, hyper galaxies or hyper noise components) are fitted individually via the
+        `log_likelihood_function_for_tracer`, as are the instances of a batch where ray-tracing one of its tracers
+        fails.
+
+        Parameters
+        ----------
+        instances : [ModelInstance]
+            The model instances which are fitted.
+        resample_figure_of_merit : float
+            The figure of merit given to an instance whose fit raises a `FitException`, mirroring the value the
+            non-linear search uses for an individual fit.
+
+        Returns
+        -------
+        figures_of_merit : np.ndarray
+            The figure of merit of every instance's fit to the masked_imaging.
+        """
+
+        figures_of_merit = np.full(
+            fill_value=resample_figure_of_merit, shape=len(instances)
+        )
+
+        batches = {}
+
+        for instance_index, instance in enumerate(instances):
+
+            self.associate_hyper_images(instance=instance)
+            tracer = self.tracer_for_instance(instance=instance)
+
+            try:
+                self.settings.settings_lens.check_positions_trace_within_threshold_via_tracer(
+                    tracer=tracer, positions=self.masked_dataset.positions
+                )
+                self.settings.settings_lens.check_einstein_radius_with_threshold_via_tracer(
+                    tracer=tracer, grid=self.masked_dataset.grid
+                )
+            except FitException:
+                continue
+
+            if self.can_fit_instance_in_batch(instance=instance, tracer=tracer):
+
+                batches.setdefault(tuple(tracer.plane_redshifts), []).append(
+                    (instance_index, instance, tracer)
+                )
+
+                continue
+
+            try:
+                figures_of_merit[
+                    instance_index
+                ] = self.log_likelihood_function_for_tracer(
+                    instance=instance, tracer=tracer
+                )
+            except FitException:
+                pass
+
+        for batch in batches.values():
+
+            instance_indexes, _, tracers = zip(*batch)
+
+            try:
+                model_images = ray_tracing.TracerBatch(
+                    tracers=list(tracers)
+                ).blurred_images_from_grid_and_convolver(
+                    grid=self.masked_imaging.grid,
+                    convolver=self.masked_imaging.convolver,
+                    blurring_grid=self.masked_imaging.blurring_grid,
+                )
+            except (GridException, OverflowError):
+
+                # The tracer of one instance failed, so every instance of the batch is fitted individually such that
+                # only the failing instances are given the resample figure of merit.
+
+                for instance_index, instance, tracer in batch:
+                    try:
+                        figures_of_merit[
+                            instance_index
+                        ] = self.log_likelihood_function_for_tracer(
+                            instance=instance, tracer=tracer
+                        )
+                    except FitException:
+                        pass
+
+                continue
+
+            chi_squareds = np.sum(
+                np.square(
+                    (self.masked_imaging.image - model_images)
+                    / self.masked_imaging.noise_map
+                ),
+                axis=1,
+            )
+
+            figures_of_merit[list(instance_indexes)] = -0.5 * (
+                chi_squareds + self.fit_likelihood.noise_normalization
+            )
+
+        return figures_of_merit
+
+    def can_fit_instance_in_batch(self, instance, tracer):
+        """
+        Whether an instance (and its tracer) can be fitted by `log_likelihood_function_batch` using a `TracerBatch`,
+        which requires its figure of merit to be the log likelihood of its blurred profile image alone.
+        """
+
+        if self.settings.settings_lens.stochastic_likelihood_resamples is not None:
+            return False
+
+        if (
+            self.hyper_image_sky_for_instance(instance=instance) is not None
+            or self.hyper_background_noise_for_instance(instance=instance) is not None
+        ):
+            return False
+
+        return not tracer.has_pixelization and not tracer.has_hyper_galaxy
+
     def masked_imaging_fit_for_tracer(
         self, tracer, hyper_image_sky, hyper_background_noise, use_hyper_scalings=True
     ):
@@ -62,7 +62,9 @@ class Analysis(ag_analysis.Analysis):
         log_likelihood_positions = fit_positions.log_likelihood
 
         if self.fluxes is not None:
-            fit_fluxes = self.fit_fluxes_for_tracer(tracer=tracer)
+            fit_fluxes = self.fit_fluxes_for_tracer(
+                tracer=tracer, magnifications=fit_positions.model_magnifications
+            )
             log_likelihood_fluxes = fit_fluxes.log_likelihood
         else:
             log_likelihood_fluxes = 0.0
@@ -78,13 +80,14 @@ class Analysis(ag_analysis.Analysis):
             tracer=tracer,
         )
 
-    def fit_fluxes_for_tracer(self, tracer):
+    def fit_fluxes_for_tracer(self, tracer, magnifications=None):
 
         return fit_point_source.FitFluxes(
             fluxes=self.fluxes,
             noise_map=self.noise_map,
             positions=self.positions,
             tracer=tracer,
+            magnifications=magnifications,
         )
 
     def visualize(self, paths, instance, during_analysis):
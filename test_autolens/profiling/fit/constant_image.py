@@ -0,0 +1,81 @@
+"""
+Profile the figure of merit of a `FitImagingLikelihood` with and without the constant image cache, for a lens galaxy
+whose bulge, disk and envelope are fixed instances (as in the source and mass pipelines of SLaM) and whose mass and
+source are free, as the lens model of every evaluation of a non-linear search changes.
+"""
+import time
+
+import numpy as np
+import autolens as al
+
+repeats = 30
+
+grid = al.Grid.uniform(shape_2d=(200, 200), pixel_scales=0.03, sub_size=2)
+
+psf = al.Kernel.from_gaussian(shape_2d=(21, 21), sigma=0.05, pixel_scales=0.03)
+
+bulge = al.lp.EllipticalSersic(
+    intensity=0.5, effective_radius=0.3, sersic_index=4.0, elliptical_comps=(0.1, 0.0)
+)
+disk = al.lp.EllipticalExponential(
+    intensity=0.2, effective_radius=1.0, elliptical_comps=(0.2, 0.1)
+)
+envelope = al.lp.EllipticalSersic(
+    intensity=0.05, effective_radius=2.0, sersic_index=1.5, elliptical_comps=(0.0, 0.1)
+)
+
+
+def tracer_from(einstein_radius):
+
+    return al.Tracer.from_galaxies(
+        galaxies=[
+            al.Galaxy(
+                redshift=0.5,
+                bulge=bulge,
+                disk=disk,
+                envelope=envelope,
+                mass=al.mp.EllipticalIsothermal(
+                    einstein_radius=einstein_radius, elliptical_comps=(0.1, 0.0)
+                ),
+            ),
+            al.Galaxy(
+                redshift=1.0,
+                light=al.lp.EllipticalSersic(intensity=0.1, effective_radius=0.2),
+            ),
+        ]
+    )
+
+
+imaging = al.SimulatorImaging(
+    exposure_time=300.0, psf=psf, background_sky_level=0.1, add_poisson_noise=True
+).from_tracer_and_grid(tracer=tracer_from(einstein_radius=1.0), grid=grid)
+
+mask = al.Mask2D.circular(
+    shape_2d=imaging.shape_2d, pixel_scales=imaging.pixel_scales, sub_size=2, radius=2.5
+)
+
+masked_imaging = al.MaskedImaging(imaging=imaging, mask=mask)
+
+einstein_radii = np.linspace(0.9, 1.1, repeats)
+
+for use_constant_image_cache in [False, True]:
+
+    fit_likelihood = al.FitImagingLikelihood(
+        masked_imaging=masked_imaging, use_constant_image_cache=use_constant_image_cache
+    )
+
+    fit_likelihood.figure_of_merit_from_tracer(tracer=tracer_from(einstein_radius=0.8))
+
+    start = time.time()
+    figures_of_merit = [
+        fit_likelihood.figure_of_merit_from_tracer(
+            tracer=tracer_from(einstein_radius=einstein_radius)
+        )
+        for einstein_radius in einstein_radii
+    ]
+    time_per_evaluation = (time.time() - start) / repeats
+
+    print(
+        f"Constant Image Cache = {use_constant_image_cache} : {time_per_evaluation:.5f}s, "
+        f"Figure of merit of last evaluation = {figures_of_merit[-1]}"
+    )
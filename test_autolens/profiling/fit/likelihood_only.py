@@ -0,0 +1,59 @@
+"""
+Profile the figure of merit of fits of a tracer to masked imaging computed by a `FitImaging` and by a
+`FitImagingLikelihood`, which a non-linear search uses to avoid creating the structures of the full fit.
+"""
+import time
+
+import autolens as al
+
+repeats = 100
+
+grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=1)
+
+psf = al.Kernel.from_gaussian(shape_2d=(11, 11), sigma=0.1, pixel_scales=0.05)
+
+tracer = al.Tracer.from_galaxies(
+    galaxies=[
+        al.Galaxy(
+            redshift=0.5,
+            light=al.lp.EllipticalSersic(intensity=0.1, effective_radius=0.5),
+            mass=al.mp.EllipticalIsothermal(einstein_radius=1.0),
+        ),
+        al.Galaxy(
+            redshift=1.0,
+            light=al.lp.EllipticalSersic(intensity=0.1, effective_radius=0.2),
+        ),
+    ]
+)
+
+imaging = al.SimulatorImaging(
+    exposure_time=300.0, psf=psf, background_sky_level=0.1, add_poisson_noise=True
+).from_tracer_and_grid(tracer=tracer, grid=grid)
+
+mask = al.Mask2D.circular(
+    shape_2d=imaging.shape_2d, pixel_scales=imaging.pixel_scales, sub_size=1, radius=2.0
+)
+
+masked_imaging = al.MaskedImaging(imaging=imaging, mask=mask)
+
+start = time.time()
+for i in range(repeats):
+    figure_of_merit = al.FitImaging(
+        masked_imaging=masked_imaging, tracer=tracer
+    ).figure_of_merit
+time_fit = (time.time() - start) / repeats
+
+fit_likelihood = al.FitImagingLikelihood(masked_imaging=masked_imaging)
+
+start = time.time()
+for i in range(repeats):
+    figure_of_merit_likelihood = fit_likelihood.figure_of_merit_from_tracer(
+        tracer=tracer
+    )
+time_fit_likelihood = (time.time() - start) / repeats
+
+print(f"FitImaging : {time_fit:.5f}s, Figure of merit = {figure_of_merit}")
+print(
+    f"FitImagingLikelihood : {time_fit_likelihood:.5f}s, "
+    f"Figure of merit = {figure_of_merit_likelihood}"
+)
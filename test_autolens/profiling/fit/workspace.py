@@ -0,0 +1,96 @@
+"""
+Profile the time and memory of a likelihood evaluation at 0.03" resolution, comparing a `FitImaging` (which allocates
+new arrays the size of the mask for every fit) to a `FitImagingLikelihood` computed in the preallocated buffers of a
+`FitImagingWorkspace`.
+
+Each is run in its own process, so that the peak resident set size (RSS) of each is reported separately alongside the
+peak memory allocated during one evaluation (measured using tracemalloc).
+"""
+import multiprocessing
+import resource
+import time
+import tracemalloc
+
+import autolens as al
+
+repeats = 50
+
+
+def masked_imaging_and_tracer_from():
+
+    grid = al.Grid.uniform(shape_2d=(200, 200), pixel_scales=0.03, sub_size=1)
+
+    psf = al.Kernel.from_gaussian(shape_2d=(21, 21), sigma=0.05, pixel_scales=0.03)
+
+    tracer = al.Tracer.from_galaxies(
+        galaxies=[
+            al.Galaxy(
+                redshift=0.5,
+                light=al.lp.EllipticalSersic(intensity=0.1, effective_radius=0.5),
+                mass=al.mp.EllipticalIsothermal(einstein_radius=1.0),
+            ),
+            al.Galaxy(
+                redshift=1.0,
+                light=al.lp.EllipticalSersic(intensity=0.1, effective_radius=0.2),
+            ),
+        ]
+    )
+
+    imaging = al.SimulatorImaging(
+        exposure_time=300.0, psf=psf, background_sky_level=0.1, add_poisson_noise=True
+    ).from_tracer_and_grid(tracer=tracer, grid=grid)
+
+    mask = al.Mask2D.circular(
+        shape_2d=imaging.shape_2d,
+        pixel_scales=imaging.pixel_scales,
+        sub_size=1,
+        radius=2.5,
+    )
+
+    return al.MaskedImaging(imaging=imaging, mask=mask), tracer
+
+
+def profile(use_workspace, queue):
+
+    masked_imaging, tracer = masked_imaging_and_tracer_from()
+
+    if use_workspace:
+        fit_likelihood = al.FitImagingLikelihood(masked_imaging=masked_imaging)
+        func = lambda: fit_likelihood.figure_of_merit_from_tracer(tracer=tracer)
+    else:
+        func = lambda: al.FitImaging(
+            masked_imaging=masked_imaging, tracer=tracer
+        ).figure_of_merit
+
+    figure_of_merit = func()
+
+    start = time.time()
+    for i in range(repeats):
+        func()
+    time_per_evaluation = (time.time() - start) / repeats
+
+    tracemalloc.start()
+    func()
+    peak_allocated = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    queue.put((figure_of_merit, time_per_evaluation, peak_allocated, peak_rss))
+
+
+if __name__ == "__main__":
+
+    for use_workspace, name in [(False, "FitImaging"), (True, "FitImagingWorkspace")]:
+
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=profile, args=(use_workspace, queue))
+        process.start()
+        figure_of_merit, time_per_evaluation, peak_allocated, peak_rss = queue.get()
+        process.join()
+
+        print(
+            f"{name} : Time = {time_per_evaluation:.5f}s, "
+            f"Peak Allocated Per Evaluation = {peak_allocated / 1e6:.2f} MB, "
+            f"Peak RSS = {peak_rss / 1e3:.1f} MB, Figure of merit = {figure_of_merit}"
+        )
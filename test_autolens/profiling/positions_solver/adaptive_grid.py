@@ -0,0 +1,63 @@
+"""
+Profile the number of deflection angle calculations used to find the peak pixels of the initial grid of the
+`PositionsSolver`, comparing ray-tracing every pixel of the initial grid to the adaptive initial grid for different
+numbers of levels.
+
+The number of (y,x) coordinates whose deflection angles are computed is counted by wrapping the tracer, as this is
+what dominates the run time for tracers with expensive mass profiles.
+"""
+import time
+
+import autolens as al
+
+
+class CountingTracer:
+    def __init__(self, tracer):
+        self.tracer = tracer
+        self.total_deflections = 0
+
+    def __getattr__(self, item):
+        return getattr(self.tracer, item)
+
+    def deflections_from_grid(self, grid):
+        self.total_deflections += grid.shape[0]
+        return self.tracer.deflections_from_grid(grid=grid)
+
+
+grid = al.Grid.uniform(shape_2d=(200, 200), pixel_scales=0.025, sub_size=1)
+
+tracer = al.Tracer.from_galaxies(
+    galaxies=[
+        al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+        ),
+        al.Galaxy(redshift=1.0, light=al.lp.EllipticalLightProfile(centre=(0.0, 0.02))),
+    ]
+)
+
+for adaptive_grid_levels in (None, 2, 3, 4, 5):
+
+    solver = al.PositionsSolverNewton(
+        grid=grid,
+        pixel_scale_precision=1.0e-6,
+        adaptive_grid_levels=adaptive_grid_levels,
+    )
+
+    # Compile the numba functions before timing.
+    solver.solve_from_tracer(tracer=tracer)
+
+    counting_tracer = CountingTracer(tracer=tracer)
+
+    start = time.time()
+    positions = solver.solve_from_tracer(tracer=counting_tracer)[0]
+    time_solve = time.time() - start
+
+    print(
+        f"Adaptive Grid Levels = {adaptive_grid_levels} : Positions = {len(positions)}, "
+        f"Deflections = {counting_tracer.total_deflections}, Time = {time_solve:.3f}s"
+    )
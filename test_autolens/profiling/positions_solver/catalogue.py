@@ -0,0 +1,63 @@
+"""
+Profile the throughput of solving for the multiple images of a catalogue of (tracer, source-plane coordinate) pairs
+with `solve_catalogue`, for different numbers of processes and chunk sizes.
+
+The tracers are a generator, such that the catalogue is never held in memory, and the results are streamed to a
+line-delimited .json file in a temporary directory.
+"""
+import os
+import tempfile
+
+import numpy as np
+
+import autolens as al
+
+total_pairs = 200
+
+grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=1)
+
+random_state = np.random.RandomState(seed=1)
+
+einstein_radii = random_state.uniform(low=0.8, high=1.2, size=total_pairs)
+elliptical_comps = random_state.uniform(low=-0.2, high=0.2, size=(total_pairs, 2))
+source_plane_coordinates = random_state.uniform(
+    low=-0.1, high=0.1, size=(total_pairs, 2)
+)
+
+
+def tracer_generator():
+    for einstein_radius, comps in zip(einstein_radii, elliptical_comps):
+        yield al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.EllipticalIsothermal(
+                        einstein_radius=einstein_radius,
+                        elliptical_comps=(comps[0], comps[1]),
+                    ),
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+        )
+
+
+solver = al.PositionsSolverNewton(grid=grid, pixel_scale_precision=1.0e-6)
+
+file_path = os.path.join(tempfile.mkdtemp(), "catalogue.json")
+
+for processes, chunk_size in [(1, 10), (2, 10), (4, 10), (4, 50)]:
+
+    total_solves, throughput = solver.solve_catalogue(
+        lensing_objs=tracer_generator(),
+        source_plane_coordinates=map(tuple, source_plane_coordinates),
+        file_path=file_path,
+        processes=processes,
+        chunk_size=chunk_size,
+    )
+
+    print(
+        f"Processes = {processes}, Chunk Size = {chunk_size} : "
+        f"Solves = {total_solves}, Throughput = {throughput:.1f} solves / s"
+    )
+
+print(f"CPUs available = {os.cpu_count()}")
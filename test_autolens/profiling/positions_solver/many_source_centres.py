@@ -0,0 +1,54 @@
+"""
+Profile solving for the multiple image positions of every light profile centre of a tracer with many point sources
+using `solve_from_tracer`, which ray-traces the initial grid to the source-plane once and shares it between the
+centres, compared to calling `solve` separately for every centre.
+"""
+import time
+
+import numpy as np
+
+import autolens as al
+
+grid = al.Grid.uniform(shape_2d=(200, 200), pixel_scales=0.025, sub_size=1)
+
+centres = np.random.RandomState(seed=1).uniform(low=-0.2, high=0.2, size=(8, 2))
+
+tracer = al.Tracer.from_galaxies(
+    galaxies=[
+        al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+        ),
+        *[
+            al.Galaxy(
+                redshift=1.0,
+                light=al.lp.EllipticalLightProfile(centre=(centre[0], centre[1])),
+            )
+            for centre in centres
+        ],
+    ]
+)
+
+solver = al.PositionsSolver(grid=grid, pixel_scale_precision=0.001)
+
+# Compile the numba functions before timing.
+solver.solve_from_tracer(tracer=tracer)
+
+repeats = 3
+
+start = time.time()
+for i in range(repeats):
+    for centre in tracer.light_profile_centres:
+        solver.solve(lensing_obj=tracer, source_plane_coordinate=centre)
+print(f"Solve each centre separately = {(time.time() - start) / repeats:.3f}s")
+
+start = time.time()
+for i in range(repeats):
+    solver.solve_from_tracer(tracer=tracer)
+print(
+    f"Solve from tracer (shared traced initial grid) = {(time.time() - start) / repeats:.3f}s"
+)
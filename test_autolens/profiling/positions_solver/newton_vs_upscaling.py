@@ -0,0 +1,84 @@
+"""
+Profile solving for the multiple image positions of a multi-plane tracer to a high precision, comparing the iterative
+upscaling of the `PositionsSolver` to the Newton iterations of the `PositionsSolverNewton`.
+
+The number of (y,x) coordinates whose deflection angles are computed is counted by wrapping the tracer, as this is
+what dominates the run time for tracers with expensive mass profiles.
+"""
+import time
+
+import numpy as np
+
+import autolens as al
+
+
+class CountingTracer:
+    def __init__(self, tracer):
+        self.tracer = tracer
+        self.total_deflections = 0
+
+    def __getattr__(self, item):
+        return getattr(self.tracer, item)
+
+    def deflections_from_grid(self, grid):
+        self.total_deflections += grid.shape[0]
+        return self.tracer.deflections_from_grid(grid=grid)
+
+
+grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=1)
+
+tracer = al.Tracer.from_galaxies(
+    galaxies=[
+        al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+            shear=al.mp.ExternalShear(elliptical_comps=(0.01, 0.02)),
+        ),
+        al.Galaxy(
+            redshift=1.0,
+            mass=al.mp.SphericalIsothermal(centre=(0.05, 0.0), einstein_radius=0.2),
+        ),
+        al.Galaxy(redshift=2.0),
+    ]
+)
+
+source_plane_coordinate = (0.0, 0.02)
+
+for pixel_scale_precision in (1.0e-3, 1.0e-4, 1.0e-5):
+
+    for solver in (
+        al.PositionsSolver(
+            grid=grid,
+            pixel_scale_precision=pixel_scale_precision,
+            distance_from_source_centre=0.01,
+        ),
+        al.PositionsSolverNewton(
+            grid=grid, pixel_scale_precision=pixel_scale_precision
+        ),
+    ):
+
+        counting_tracer = CountingTracer(tracer=tracer)
+
+        start = time.time()
+        positions = solver.solve(
+            lensing_obj=counting_tracer, source_plane_coordinate=source_plane_coordinate
+        )
+        time_solve = time.time() - start
+
+        traced_positions = tracer.traced_grids_of_planes_from_grid(grid=positions)[-1]
+        source_plane_error = np.max(
+            np.abs(np.asarray(traced_positions) - source_plane_coordinate)
+        )
+
+        iterations = getattr(solver, "iterations", "-")
+
+        print(
+            f"Precision = {pixel_scale_precision} : {solver.__class__.__name__} : "
+            f"Positions = {len(positions)}, Deflections = {counting_tracer.total_deflections}, "
+            f"Iterations = {iterations}, Max Source-Plane Error = {source_plane_error:.2e}, "
+            f"Time = {time_solve:.3f}s"
+        )
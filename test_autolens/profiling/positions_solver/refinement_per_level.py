@@ -0,0 +1,79 @@
+"""
+Profile solving for the multiple image positions of a tracer, whose deflection angles are computed at every
+resolution level of the `PositionsSolver`'s refinement.
+
+The "before" timings refine every candidate coordinate separately, computing the deflection angles of its upscaled
+grid and finding its peaks one coordinate at a time. The "after" timings refine all coordinates of a resolution level
+together, via one stacked grid, one deflection angle calculation and one vectorized peak detection.
+"""
+import time
+
+import numpy as np
+
+import autolens as al
+from autolens.lens import positions_solver as pos
+
+repeats = 10
+
+grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=1)
+
+tracer = al.Tracer.from_galaxies(
+    galaxies=[
+        al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+            shear=al.mp.ExternalShear(elliptical_comps=(0.01, 0.02)),
+        ),
+        al.Galaxy(redshift=1.0),
+    ]
+)
+
+solver = al.PositionsSolver(grid=grid, pixel_scale_precision=0.001)
+
+coordinates = solver.grid_peaks_from(
+    lensing_obj=tracer, grid=solver.grid, source_plane_coordinate=(0.0, 0.0)
+)
+
+start = time.time()
+for i in range(repeats):
+    refined_coordinates = []
+    for coordinate in coordinates:
+        grid_upscaled = solver.grid_buffed_and_upscaled_around_coordinate_from(
+            coordinate=coordinate,
+            pixel_scales=(0.05, 0.05),
+            buffer=4,
+            upscale_factor=solver.upscale_factor,
+        )
+        refined_coordinates += list(
+            solver.grid_peaks_from(
+                lensing_obj=tracer,
+                grid=grid_upscaled,
+                source_plane_coordinate=(0.0, 0.0),
+            )
+        )
+time_before = (time.time() - start) / repeats
+
+start = time.time()
+for i in range(repeats):
+    refined_coordinates_stacked = solver.refined_coordinates_from_coordinates(
+        coordinates=coordinates,
+        pixel_scale=0.05,
+        lensing_obj=tracer,
+        source_plane_coordinate=(0.0, 0.0),
+    )
+time_after = (time.time() - start) / repeats
+
+assert (refined_coordinates_stacked == np.asarray(refined_coordinates)).all()
+
+print(
+    f"Candidates = {len(coordinates)} : One Level = {time_before:.4f}s -> {time_after:.4f}s"
+)
+
+start = time.time()
+for i in range(repeats):
+    solver.solve(lensing_obj=tracer, source_plane_coordinate=(0.0, 0.0))
+print(f"Solve = {(time.time() - start) / repeats:.4f}s")
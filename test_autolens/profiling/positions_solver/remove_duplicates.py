@@ -0,0 +1,91 @@
+"""
+Profile removing the duplicate candidate positions of the `PositionsSolver` for tens of thousands of candidates.
+
+The "before" timings use the previous implementation, which computes the separation of every pair of coordinates in
+an N x N matrix and is therefore only run for the smaller numbers of candidates. The "after" timings use the spatial
+hash of `grid_remove_duplicates`.
+"""
+import time
+
+import numpy as np
+from autoarray import decorator_util
+
+from autolens.lens import positions_solver as pos
+
+
+@decorator_util.jit()
+def grid_remove_duplicates_pairs(grid):
+
+    tolerance = 1e-8
+
+    grid_no_duplicates = []
+
+    separations = np.zeros((grid.shape[0], grid.shape[0]))
+
+    for i in range(grid.shape[0]):
+        for j in range(grid.shape[0]):
+            separations[i, j] = np.sqrt(
+                np.square(grid[i, 0] - grid[j, 0]) + np.square(grid[i, 1] - grid[j, 1])
+            )
+            separations[i, i] = tolerance * 2
+
+    for i in range(grid.shape[0]):
+
+        is_duplicate = False
+
+        for j in range(grid.shape[0]):
+
+            if separations[i, j] < tolerance:
+
+                is_duplicate = True
+                separations[i, j] = tolerance * 2
+                separations[j, i] = tolerance * 2
+
+        if not is_duplicate:
+            grid_no_duplicates.append((grid[i, 0], grid[i, 1]))
+
+    return grid_no_duplicates
+
+
+def candidates_from(total_candidates):
+    """
+    Candidate positions as produced by refinement, where a quarter of the candidates duplicate another candidate.
+    """
+    grid = np.random.uniform(low=-3.0, high=3.0, size=(total_candidates, 2))
+    duplicates = np.random.randint(
+        low=0, high=total_candidates, size=total_candidates // 4
+    )
+    grid[: total_candidates // 4] = grid[duplicates] + 1.0e-9
+    np.random.shuffle(grid)
+    return grid
+
+
+np.random.seed(1)
+
+pos.grid_remove_duplicates(grid=candidates_from(total_candidates=10))
+grid_remove_duplicates_pairs(grid=candidates_from(total_candidates=10))
+
+for total_candidates in (1000, 5000, 10000, 50000, 100000):
+
+    grid = candidates_from(total_candidates=total_candidates)
+
+    start = time.time()
+    grid_no_duplicates = pos.grid_remove_duplicates(grid=grid)
+    time_after = time.time() - start
+
+    if total_candidates <= 10000:
+
+        start = time.time()
+        grid_no_duplicates_pairs = grid_remove_duplicates_pairs(grid=grid)
+        time_before = f"{time.time() - start:.4f}s"
+
+        assert grid_no_duplicates == grid_no_duplicates_pairs
+
+    else:
+
+        time_before = "skipped (N x N memory)"
+
+    print(
+        f"Candidates = {total_candidates} : Retained = {len(grid_no_duplicates)}, "
+        f"Remove Duplicates = {time_before} -> {time_after:.4f}s"
+    )
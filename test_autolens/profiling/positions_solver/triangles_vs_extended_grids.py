@@ -0,0 +1,85 @@
+"""
+Profile solving for the multiple image positions of a multi-plane tracer as the initial grid is extended, comparing
+the iterative upscaling of the `PositionsSolver`, the Newton iterations of the `PositionsSolverNewton` and the
+triangle mapping of the `PositionsSolverTriangles`.
+
+The number of (y,x) coordinates whose deflection angles are computed is counted by wrapping the tracer.
+"""
+import time
+
+import numpy as np
+
+import autolens as al
+
+
+class CountingTracer:
+    def __init__(self, tracer):
+        self.tracer = tracer
+        self.total_deflections = 0
+
+    def __getattr__(self, item):
+        return getattr(self.tracer, item)
+
+    def deflections_from_grid(self, grid):
+        self.total_deflections += grid.shape[0]
+        return self.tracer.deflections_from_grid(grid=grid)
+
+
+tracer = al.Tracer.from_galaxies(
+    galaxies=[
+        al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+            shear=al.mp.ExternalShear(elliptical_comps=(0.01, 0.02)),
+        ),
+        al.Galaxy(
+            redshift=1.0,
+            mass=al.mp.SphericalIsothermal(centre=(0.05, 0.0), einstein_radius=0.2),
+        ),
+        al.Galaxy(redshift=2.0),
+    ]
+)
+
+source_plane_coordinate = (0.0, 0.02)
+pixel_scale_precision = 1.0e-4
+
+for shape_2d in [(100, 100), (200, 200), (400, 400)]:
+
+    grid = al.Grid.uniform(shape_2d=shape_2d, pixel_scales=0.05, sub_size=1)
+
+    for solver in (
+        al.PositionsSolver(
+            grid=grid,
+            pixel_scale_precision=pixel_scale_precision,
+            distance_from_source_centre=0.01,
+        ),
+        al.PositionsSolverNewton(
+            grid=grid, pixel_scale_precision=pixel_scale_precision
+        ),
+        al.PositionsSolverTriangles(
+            grid=grid, pixel_scale_precision=pixel_scale_precision
+        ),
+    ):
+
+        counting_tracer = CountingTracer(tracer=tracer)
+
+        start = time.time()
+        positions = solver.solve(
+            lensing_obj=counting_tracer, source_plane_coordinate=source_plane_coordinate
+        )
+        time_solve = time.time() - start
+
+        traced_positions = tracer.traced_grids_of_planes_from_grid(grid=positions)[-1]
+        source_plane_error = np.max(
+            np.abs(np.asarray(traced_positions) - source_plane_coordinate)
+        )
+
+        print(
+            f"Grid = {shape_2d} : {solver.__class__.__name__} : Positions = {len(positions)}, "
+            f"Deflections = {counting_tracer.total_deflections}, "
+            f"Max Source-Plane Error = {source_plane_error:.2e}, Time = {time_solve:.3f}s"
+        )
@@ -0,0 +1,88 @@
+"""
+Profile solving for the multiple image positions of a sequence of slightly different tracers, as happens for the
+successive samples of a non-linear search fitting point-source data, comparing a cold solve on the full initial grid
+to a warm-started solve seeded by the previous solution and the observed positions.
+
+The number of (y,x) coordinates whose deflection angles are computed is counted by wrapping the tracer, as this is
+what dominates the run time for tracers with expensive mass profiles.
+"""
+import time
+
+import numpy as np
+
+import autolens as al
+
+
+class CountingTracer:
+    def __init__(self, tracer):
+        self.tracer = tracer
+        self.total_deflections = 0
+
+    def __getattr__(self, item):
+        return getattr(self.tracer, item)
+
+    def deflections_from_grid(self, grid):
+        self.total_deflections += grid.shape[0]
+        return self.tracer.deflections_from_grid(grid=grid)
+
+
+def tracer_from(einstein_radius):
+    return al.Tracer.from_galaxies(
+        galaxies=[
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.EllipticalIsothermal(
+                    centre=(0.001, 0.001),
+                    einstein_radius=einstein_radius,
+                    elliptical_comps=(0.0, 0.111111),
+                ),
+            ),
+            al.Galaxy(
+                redshift=1.0, light=al.lp.EllipticalLightProfile(centre=(0.0, 0.02))
+            ),
+        ]
+    )
+
+
+grid = al.Grid.uniform(shape_2d=(200, 200), pixel_scales=0.025, sub_size=1)
+
+positions = al.PositionsSolverNewton(
+    grid=grid, pixel_scale_precision=1.0e-6
+).solve_from_tracer(tracer=tracer_from(einstein_radius=1.0))[0]
+
+einstein_radii = 1.0 + 0.01 * np.random.RandomState(seed=1).standard_normal(50)
+
+for solver_class in (al.PositionsSolver, al.PositionsSolverNewton):
+
+    for use_warm_start in (False, True):
+
+        solver = solver_class(
+            grid=grid, pixel_scale_precision=1.0e-4, use_warm_start=use_warm_start
+        )
+
+        total_deflections = 0
+        total_images = 0
+
+        start = time.time()
+
+        for einstein_radius in einstein_radii:
+
+            counting_tracer = CountingTracer(
+                tracer=tracer_from(einstein_radius=einstein_radius)
+            )
+
+            model_positions = solver.solve_from_tracer(
+                tracer=counting_tracer, positions=positions
+            )[0]
+
+            total_deflections += counting_tracer.total_deflections
+            total_images += len(model_positions)
+
+        time_solve = time.time() - start
+
+        print(
+            f"{solver_class.__name__} : Warm Start = {use_warm_start} : "
+            f"Mean Images = {total_images / len(einstein_radii):.2f}, "
+            f"Mean Deflections = {total_deflections / len(einstein_radii):.0f}, "
+            f"Time = {time_solve:.3f}s"
+        )
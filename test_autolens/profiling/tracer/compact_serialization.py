@@ -0,0 +1,71 @@
+"""
+Profile saving and loading many `Tracer` objects, comparing pickling (`save` / `load`) to the compact JSON
+format (`save_compact` / `generator_from_compact_files`), for example to load the tracers of a large output directory
+for a population study.
+"""
+import os
+import shutil
+import time
+from os import path
+
+import autolens as al
+
+total_tracers = 1000
+
+profiling_path = path.join(path.dirname(path.realpath(__file__)), "files", "tracers")
+
+if path.exists(profiling_path):
+    shutil.rmtree(profiling_path)
+
+tracer = al.Tracer.from_galaxies(
+    galaxies=[
+        al.Galaxy(
+            redshift=0.5,
+            light=al.lp.EllipticalSersic(intensity=0.1, effective_radius=0.5),
+            mass=al.mp.EllipticalIsothermal(einstein_radius=1.0),
+            shear=al.mp.ExternalShear(elliptical_comps=(0.01, 0.02)),
+        ),
+        al.Galaxy(
+            redshift=1.0,
+            light=al.lp.EllipticalSersic(intensity=0.1, effective_radius=0.2),
+        ),
+    ]
+)
+
+file_paths = [
+    path.join(profiling_path, f"tracer_{index}") for index in range(total_tracers)
+]
+
+for file_path in file_paths:
+    os.makedirs(file_path)
+
+start = time.time()
+for file_path in file_paths:
+    tracer.save(file_path=file_path)
+time_save = time.time() - start
+
+start = time.time()
+for file_path in file_paths:
+    tracer.save_compact(file_path=file_path)
+time_save_compact = time.time() - start
+
+start = time.time()
+for file_path in file_paths:
+    al.Tracer.load(file_path=file_path)
+time_load = time.time() - start
+
+start = time.time()
+for loaded_tracer in al.Tracer.generator_from_compact_files(file_paths=file_paths):
+    pass
+time_load_compact = time.time() - start
+
+size = path.getsize(path.join(file_paths[0], "tracer.pickle"))
+size_compact = path.getsize(path.join(file_paths[0], "tracer.json"))
+
+print(f"Pickle : Save = {time_save:.3f}s, Load = {time_load:.3f}s, Size = {size} bytes")
+print(
+    f"Compact : Save = {time_save_compact:.3f}s, Load = {time_load_compact:.3f}s, "
+    f"Size = {size_compact} bytes"
+)
+
+shutil.rmtree(profiling_path)
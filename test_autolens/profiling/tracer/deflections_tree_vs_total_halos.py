@@ -0,0 +1,52 @@
+"""
+Profile the deflection angles of a plane of line-of-sight halos computed by a direct sum over every halo and by a
+`DeflectionsTree`, as a function of the number of halos.
+"""
+import time
+
+import numpy as np
+import autolens as al
+
+repeats = 3
+
+grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=2)
+
+np.random.seed(1)
+
+for total_halos in [10, 100, 300, 1000]:
+
+    mass_profiles = [
+        al.mp.SphericalTruncatedNFW(
+            centre=tuple(np.random.uniform(-5.0, 5.0, 2)),
+            kappa_s=0.02,
+            scale_radius=0.1,
+            truncation_radius=0.3,
+        )
+        for _ in range(total_halos)
+    ]
+
+    start = time.time()
+    for i in range(repeats):
+        deflections_exact = sum(
+            mass_profile.deflections_from_grid(grid=grid)
+            for mass_profile in mass_profiles
+        )
+    time_exact = (time.time() - start) / repeats
+
+    for opening_angle in [0.3, 0.5, 0.8]:
+
+        tree = al.DeflectionsTree(
+            mass_profiles=mass_profiles, opening_angle=opening_angle
+        )
+
+        start = time.time()
+        for i in range(repeats):
+            deflections = tree.deflections_from_grid(grid=grid)
+        time_tree = (time.time() - start) / repeats
+
+        maximum_error = np.max(np.abs(deflections - deflections_exact))
+
+        print(
+            f"Halos = {total_halos}, Opening Angle = {opening_angle} : Direct = {time_exact:.4f}s, "
+            f"Tree = {time_tree:.4f}s, Max Error = {maximum_error:.2e}"
+        )
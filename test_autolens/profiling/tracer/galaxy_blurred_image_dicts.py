@@ -0,0 +1,103 @@
+"""
+Profile the blurred image of every galaxy of a tracer, which is computed for the hyper-galaxy images at the end of
+every phase and in visualization.
+
+The "before" timings convolve the image of every galaxy separately, via each plane's per-galaxy methods. The "after"
+timings stack the images of all galaxies and convolve them in one pass, using the cached FFT of the PSF for the
+unmasked images.
+"""
+import time
+
+import autolens as al
+
+repeats = 10
+
+psf = al.Kernel.from_gaussian(shape_2d=(21, 21), sigma=0.1, pixel_scales=0.05)
+
+mask = al.Mask2D.circular(
+    shape_2d=(100, 100), pixel_scales=0.05, sub_size=2, radius=2.0
+)
+
+imaging = al.Imaging(
+    image=al.Array.ones(shape_2d=(100, 100), pixel_scales=0.05),
+    noise_map=al.Array.ones(shape_2d=(100, 100), pixel_scales=0.05),
+    psf=psf,
+)
+
+masked_imaging = al.MaskedImaging(imaging=imaging, mask=mask)
+
+for total_galaxies in (2, 4, 8):
+
+    galaxies = [
+        al.Galaxy(
+            redshift=0.5,
+            light=al.lp.EllipticalSersic(intensity=0.1, effective_radius=0.5),
+            mass=al.mp.EllipticalIsothermal(einstein_radius=1.0),
+        )
+    ]
+
+    for galaxy_index in range(total_galaxies - 1):
+        galaxies.append(
+            al.Galaxy(
+                redshift=1.0,
+                light=al.lp.EllipticalSersic(
+                    centre=(0.1 * galaxy_index, 0.0),
+                    intensity=0.1,
+                    effective_radius=0.2,
+                ),
+            )
+        )
+
+    tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+    start = time.time()
+    for i in range(repeats):
+        traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+            grid=masked_imaging.grid
+        )
+        traced_blurring_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+            grid=masked_imaging.blurring_grid
+        )
+        for plane_index, plane in enumerate(tracer.planes):
+            plane.blurred_images_of_galaxies_from_grid_and_convolver(
+                grid=traced_grids_of_planes[plane_index],
+                convolver=masked_imaging.convolver,
+                blurring_grid=traced_blurring_grids_of_planes[plane_index],
+            )
+    time_dict_before = (time.time() - start) / repeats
+
+    start = time.time()
+    for i in range(repeats):
+        tracer.galaxy_blurred_image_dict_from_grid_and_convolver(
+            grid=masked_imaging.grid,
+            convolver=masked_imaging.convolver,
+            blurring_grid=masked_imaging.blurring_grid,
+        )
+    time_dict_after = (time.time() - start) / repeats
+
+    start = time.time()
+    for i in range(repeats):
+        padded_grid = masked_imaging.grid.padded_grid_from_kernel_shape(
+            kernel_shape_2d=psf.shape_2d
+        )
+        traced_padded_grids = tracer.traced_grids_of_planes_from_grid(grid=padded_grid)
+        for plane, traced_padded_grid in zip(tracer.planes, traced_padded_grids):
+            for padded_image in plane.images_of_galaxies_from_grid(
+                grid=traced_padded_grid
+            ):
+                padded_grid.mask.unmasked_blurred_array_from_padded_array_psf_and_image_shape(
+                    padded_array=padded_image, psf=psf, image_shape=mask.shape
+                )
+    time_unmasked_before = (time.time() - start) / repeats
+
+    start = time.time()
+    for i in range(repeats):
+        tracer.unmasked_blurred_image_of_planes_and_galaxies_from_grid_and_psf(
+            grid=masked_imaging.grid, psf=psf, psf_fft=masked_imaging.psf_fft
+        )
+    time_unmasked_after = (time.time() - start) / repeats
+
+    print(
+        f"Galaxies = {total_galaxies} : Blurred Image Dict = {time_dict_before:.4f}s -> {time_dict_after:.4f}s, "
+        f"Unmasked Blurred Images = {time_unmasked_before:.4f}s -> {time_unmasked_after:.4f}s"
+    )
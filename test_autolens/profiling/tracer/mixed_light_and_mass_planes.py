@@ -0,0 +1,76 @@
+"""
+Profile a `Tracer` whose planes alternate between light-only galaxies (e.g. foreground galaxies at their own
+redshift) and mass-only galaxies.
+
+The tracer's execution plan records which planes have mass and light profiles, such that deflection angles,
+convergence and potential are only computed for planes with mass and images for planes with light. The "before"
+timings reproduce evaluating every plane by marking every plane as having both mass and light.
+"""
+import time
+
+import numpy as np
+import autolens as al
+
+repeats = 10
+
+grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=2)
+
+for total_planes in range(3, 9):
+
+    redshifts = np.linspace(0.2, 2.0, total_planes)
+
+    galaxies = []
+
+    for plane_index, redshift in enumerate(redshifts[:-1]):
+
+        if plane_index % 2 == 0:
+            galaxies.append(
+                al.Galaxy(
+                    redshift=redshift,
+                    mass=al.mp.SphericalIsothermal(
+                        centre=(0.1, 0.1), einstein_radius=0.2
+                    ),
+                )
+            )
+        else:
+            galaxies.append(
+                al.Galaxy(
+                    redshift=redshift,
+                    light=al.lp.EllipticalSersic(intensity=0.1, effective_radius=0.5),
+                )
+            )
+
+    galaxies.append(
+        al.Galaxy(
+            redshift=redshifts[-1],
+            light=al.lp.EllipticalSersic(intensity=0.1, effective_radius=0.5),
+        )
+    )
+
+    tracer_every_plane = al.Tracer.from_galaxies(galaxies=galaxies)
+    tracer_every_plane.plane_indexes_with_mass_profile = tuple(range(total_planes))
+    tracer_every_plane.plane_indexes_with_light_profile = tuple(range(total_planes))
+
+    tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+    for label, tracer_profiled in [("Before", tracer_every_plane), ("After", tracer)]:
+
+        start = time.time()
+        for i in range(repeats):
+            tracer_profiled.traced_grids_of_planes_from_grid(grid=grid)
+        time_traced_grids = (time.time() - start) / repeats
+
+        start = time.time()
+        for i in range(repeats):
+            tracer_profiled.image_from_grid(grid=grid)
+        time_image = (time.time() - start) / repeats
+
+        start = time.time()
+        for i in range(repeats):
+            tracer_profiled.convergence_from_grid(grid=grid)
+        time_convergence = (time.time() - start) / repeats
+
+        print(
+            f"Planes = {total_planes} ({label}) : Traced Grids = {time_traced_grids:.5f}s, "
+            f"Image = {time_image:.5f}s, Convergence = {time_convergence:.5f}s"
+        )
@@ -0,0 +1,54 @@
+"""
+Profile `Tracer.traced_grids_of_planes_from_grid` as a function of the number of planes.
+
+The multi-plane scaling factors are cached per (plane redshifts, cosmology). The "before" timings clear this cache
+before every trace, reproducing the cost of evaluating the astropy distance integrals on every call, whereas the
+"after" timings reuse the cached matrix as every sample of a fixed-redshift model does.
+"""
+import time
+
+import numpy as np
+import autolens as al
+from autolens.lens import ray_tracing
+
+repeats = 10
+
+grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=2)
+
+for total_planes in range(2, 8):
+
+    redshifts = np.linspace(0.2, 2.0, total_planes)
+
+    galaxies = [
+        al.Galaxy(
+            redshift=redshift,
+            mass=al.mp.SphericalIsothermal(centre=(0.1, 0.1), einstein_radius=0.2),
+        )
+        for redshift in redshifts[:-1]
+    ]
+
+    galaxies.append(
+        al.Galaxy(
+            redshift=redshifts[-1],
+            light=al.lp.EllipticalSersic(intensity=0.1, effective_radius=0.5),
+        )
+    )
+
+    start = time.time()
+    for i in range(repeats):
+        ray_tracing.scaling_factors_of_planes_from.cache_clear()
+        tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+        tracer.traced_grids_of_planes_from_grid(grid=grid)
+    time_before = (time.time() - start) / repeats
+
+    tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+    start = time.time()
+    for i in range(repeats):
+        tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+        tracer.traced_grids_of_planes_from_grid(grid=grid)
+    time_after = (time.time() - start) / repeats
+
+    print(
+        f"Planes = {total_planes} : Uncached = {time_before:.5f}s, Cached = {time_after:.5f}s"
+    )
@@ -1,5 +1,6 @@
 import autolens as al
 import numpy as np
+import pytest
 
 
 class TestMaskedImaging:
@@ -44,6 +45,43 @@ class TestMaskedImaging:
         assert (masked_imaging_7x7.blurring_grid.in_1d == blurring_grid_7x7).all()
         assert (masked_imaging_7x7.blurring_grid == blurring_grid).all()
 
+    def test__psf_fft__convolves_arrays_same_as_psf_and_caches_psf_fft(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        psf = al.Kernel.manual_2d(
+            array=np.arange(25.0).reshape(5, 5), pixel_scales=1.0, renormalize=True
+        )
+
+        imaging = al.Imaging(
+            image=imaging_7x7.image, noise_map=imaging_7x7.noise_map, psf=psf
+        )
+
+        masked_imaging_7x7 = al.MaskedImaging(imaging=imaging, mask=sub_mask_7x7)
+
+        assert masked_imaging_7x7.psf_fft.use_fft_for_shape(shape_2d=(11, 11))
+
+        arrays_2d = np.random.RandomState(1).uniform(size=(3, 11, 11))
+
+        convolved_arrays_2d = masked_imaging_7x7.psf_fft.convolved_arrays_2d_from_arrays_2d(
+            arrays_2d=arrays_2d
+        )
+
+        for array_2d, convolved_array_2d in zip(arrays_2d, convolved_arrays_2d):
+
+            array = al.Array.manual_2d(array=array_2d, pixel_scales=1.0)
+
+            assert convolved_array_2d == pytest.approx(
+                masked_imaging_7x7.psf.convolved_array_from_array(array=array).in_2d,
+                1.0e-8,
+            )
+
+        masked_imaging_7x7.psf_fft.convolved_arrays_2d_from_arrays_2d(
+            arrays_2d=arrays_2d
+        )
+
+        assert len(masked_imaging_7x7.psf_fft.kernel_ffts) == 1
+
 
 class TestSimulatorImaging:
     def test__from_tracer_and_grid__same_as_tracer_image(self):
@@ -1,6 +1,7 @@
 import autolens as al
 import numpy as np
 import pytest
+from astropy import cosmology as cosmo
 from autoarray.inversion import inversions
 from autogalaxy.mock.mock import MockLightProfile
 
@@ -1640,6 +1641,634 @@ class TestFitImaging:
             assert fit.subtracted_images_of_planes[0].in_1d[0] == -4.0
             assert fit.subtracted_images_of_planes[1].in_1d[0] == -0.0
 
+        def test__trace_cache__inversion_grid_reuses_traced_image_grid(
+            self, masked_imaging_7x7
+        ):
+
+            galaxy_light = al.Galaxy(
+                redshift=0.5,
+                light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+
+            galaxy_pix = al.Galaxy(
+                redshift=1.0,
+                light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                pixelization=al.pix.VoronoiMagnification(shape=(3, 3)),
+                regularization=al.reg.Constant(coefficient=1.0),
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[galaxy_light, galaxy_pix])
+
+            fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+            assert masked_imaging_7x7.grid_inversion is masked_imaging_7x7.grid
+            assert fit.trace_cache.hits == 1
+            assert fit.trace_cache.misses == 2
+            assert tracer.trace_cache is None
+
+        def test__cached_products__computed_once_using_fit_trace_cache_and_released(
+            self, masked_imaging_7x7
+        ):
+
+            galaxy_light = al.Galaxy(
+                redshift=0.5,
+                light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+
+            galaxy_source = al.Galaxy(
+                redshift=1.0, light_profile=al.lp.EllipticalSersic(intensity=2.0)
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[galaxy_light, galaxy_source])
+
+            fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+            assert fit.trace_cache.misses == 1
+
+            model_images_of_planes = fit.model_images_of_planes
+
+            assert fit.model_images_of_planes is model_images_of_planes
+            assert fit.subtracted_images_of_planes is fit.subtracted_images_of_planes
+            assert fit.galaxy_model_image_dict is fit.galaxy_model_image_dict
+
+            assert fit.trace_cache.misses == 1
+
+            unmasked_blurred_image = fit.unmasked_blurred_image
+            fit.unmasked_blurred_image_of_planes
+            fit.unmasked_blurred_image_of_planes_and_galaxies
+
+            assert fit.unmasked_blurred_image is unmasked_blurred_image
+            assert fit.trace_cache.misses == 2
+            assert tracer.trace_cache is None
+
+            fit.release_cache()
+
+            assert not fit.trace_cache.has_traced_grids(grid=fit.grid)
+            assert fit.model_images_of_planes is not model_images_of_planes
+            assert (fit.model_images_of_planes[1] == model_images_of_planes[1]).all()
+            assert (fit.unmasked_blurred_image == unmasked_blurred_image).all()
+
+
+class TestFitImagingLikelihood:
+    def test__workspace__buffers_sized_to_masked_imaging_and_reused(
+        self, masked_imaging_7x7
+    ):
+
+        workspace = al.FitImagingWorkspace(masked_imaging=masked_imaging_7x7)
+
+        assert workspace.blurred_image.shape == (9,)
+        assert workspace.chi_squared_map.dtype == np.float64
+        assert workspace.grid_and_blurring_grid.shape == (25, 2)
+        assert workspace.image.shape == (25,)
+        assert workspace.binned_blurring_image.shape == (16,)
+        assert workspace.traced_grids.shape == (0, 25, 2)
+        assert workspace.nbytes == (5 * 9 + 50 + 25 + 9 + 16 + 50) * 8
+
+        galaxy_light = al.Galaxy(
+            redshift=0.5,
+            light_profile=al.lp.EllipticalSersic(intensity=1.0),
+            hyper_galaxy=al.HyperGalaxy(
+                contribution_factor=1.0, noise_factor=1.0, noise_power=1.0
+            ),
+            hyper_model_image=al.Array.ones(shape_2d=(3, 3), pixel_scales=1.0),
+            hyper_galaxy_image=al.Array.ones(shape_2d=(3, 3), pixel_scales=1.0),
+            hyper_minimum_value=0.0,
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[galaxy_light])
+
+        fit_likelihood = al.FitImagingLikelihood(
+            masked_imaging=masked_imaging_7x7, workspace=workspace
+        )
+
+        assert fit_likelihood.workspace is workspace
+
+        blurred_image = workspace.blurred_image
+
+        figure_of_merit = fit_likelihood.figure_of_merit_from_tracer(tracer=tracer)
+
+        fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+        assert figure_of_merit == fit.figure_of_merit
+        assert workspace.blurred_image is blurred_image
+        assert (workspace.blurred_image == fit.blurred_image.in_1d).all()
+        assert (workspace.noise_map == fit.noise_map.in_1d).all()
+        assert (workspace.chi_squared_map == fit.chi_squared_map.in_1d).all()
+
+        assert workspace.traced_grids.shape == (1, 25, 2)
+        assert (workspace.traced_grids[0] == workspace.grid_and_blurring_grid).all()
+        assert (
+            workspace.binned_image
+            == tracer.image_from_grid(grid=masked_imaging_7x7.grid).in_1d_binned
+        ).all()
+
+    def test__hyper_noise_map_from_noise_map_tracer_and_hyper_background_noise__out_buffer_used(
+        self, masked_imaging_7x7
+    ):
+
+        from autolens.fit import fit as fit_module
+
+        hyper_background_noise = al.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        galaxy_light = al.Galaxy(
+            redshift=0.5,
+            light_profile=al.lp.EllipticalSersic(intensity=1.0),
+            hyper_galaxy=al.HyperGalaxy(
+                contribution_factor=1.0, noise_factor=1.0e8, noise_power=1.0
+            ),
+            hyper_model_image=al.Array.ones(shape_2d=(3, 3), pixel_scales=1.0),
+            hyper_galaxy_image=al.Array.ones(shape_2d=(3, 3), pixel_scales=1.0),
+            hyper_minimum_value=0.0,
+        )
+
+        for tracer in [
+            al.Tracer.from_galaxies(galaxies=[galaxy_light]),
+            al.Tracer.from_galaxies(galaxies=[al.Galaxy(redshift=0.5)]),
+        ]:
+
+            for background_noise in [None, hyper_background_noise]:
+
+                noise_map = fit_module.hyper_noise_map_from_noise_map_tracer_and_hyper_background_noise(
+                    noise_map=masked_imaging_7x7.noise_map,
+                    tracer=tracer,
+                    hyper_background_noise=background_noise,
+                )
+
+                out = np.zeros(shape=9)
+
+                noise_map_out = fit_module.hyper_noise_map_from_noise_map_tracer_and_hyper_background_noise(
+                    noise_map=masked_imaging_7x7.noise_map,
+                    tracer=tracer,
+                    hyper_background_noise=background_noise,
+                    out=out,
+                )
+
+                assert noise_map_out is out
+                assert (out == noise_map.in_1d).all()
+
+    def test__hyper_noise_map__reused_while_hyper_parameters_unchanged(
+        self, masked_imaging_7x7, monkeypatch
+    ):
+
+        from autolens.fit import fit as fit_module
+
+        hyper_noise_map_func = (
+            fit_module.hyper_noise_map_from_noise_map_tracer_and_hyper_background_noise
+        )
+
+        calls = []
+
+        def hyper_noise_map_counted(**kwargs):
+            if kwargs.get("out") is not None:
+                calls.append(kwargs)
+            return hyper_noise_map_func(**kwargs)
+
+        monkeypatch.setattr(
+            fit_module,
+            "hyper_noise_map_from_noise_map_tracer_and_hyper_background_noise",
+            hyper_noise_map_counted,
+        )
+
+        hyper_model_image = al.Array.ones(shape_2d=(3, 3), pixel_scales=1.0)
+        hyper_galaxy_image = al.Array.ones(shape_2d=(3, 3), pixel_scales=1.0)
+
+        def tracer_from(noise_factor):
+
+            return al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                        hyper_galaxy=al.HyperGalaxy(
+                            contribution_factor=1.0,
+                            noise_factor=noise_factor,
+                            noise_power=1.0,
+                        ),
+                        hyper_model_image=hyper_model_image,
+                        hyper_galaxy_image=hyper_galaxy_image,
+                        hyper_minimum_value=0.0,
+                    )
+                ]
+            )
+
+        fit_likelihood = al.FitImagingLikelihood(
+            masked_imaging=masked_imaging_7x7, hyper_noise_limit=1.0e8
+        )
+
+        hyper_background_noise = al.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        for noise_factor, noise_scale, total_calls in [
+            (1.0, 1.0, 1),
+            (1.0, 1.0, 1),
+            (2.0, 1.0, 2),
+            (2.0, 2.0, 3),
+            (2.0, 2.0, 3),
+        ]:
+
+            tracer = tracer_from(noise_factor=noise_factor)
+            hyper_background_noise = al.hyper_data.HyperBackgroundNoise(
+                noise_scale=noise_scale
+            )
+
+            figure_of_merit = fit_likelihood.figure_of_merit_from_tracer(
+                tracer=tracer, hyper_background_noise=hyper_background_noise
+            )
+
+            fit = al.FitImaging(
+                masked_imaging=masked_imaging_7x7,
+                tracer=tracer,
+                hyper_background_noise=hyper_background_noise,
+            )
+
+            assert figure_of_merit == fit.figure_of_merit
+            assert len(calls) == total_calls
+            assert calls[-1]["hyper_noise_limit"] == 1.0e8
+
+    def test__constant_image_cache__fixed_light_profiles_images_reused(
+        self, masked_imaging_7x7
+    ):
+
+        lens_light = al.lp.EllipticalSersic(intensity=1.0)
+        source_light = al.lp.EllipticalSersic(intensity=2.0)
+
+        def tracer_from(einstein_radius):
+
+            return al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        light_profile=lens_light,
+                        mass_profile=al.mp.SphericalIsothermal(
+                            einstein_radius=einstein_radius
+                        ),
+                    ),
+                    al.Galaxy(redshift=1.0, light_profile=source_light),
+                ]
+            )
+
+        fit_likelihood = al.FitImagingLikelihood(
+            masked_imaging=masked_imaging_7x7, use_constant_image_cache=True
+        )
+
+        for einstein_radius in [1.0, 1.1, 1.2]:
+
+            tracer = tracer_from(einstein_radius=einstein_radius)
+
+            figure_of_merit = fit_likelihood.figure_of_merit_from_tracer(tracer=tracer)
+
+            fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+            assert figure_of_merit == fit.figure_of_merit
+
+        # The source light is behind the free mass profile, so only the lens light is constant.
+
+        assert len(fit_likelihood.light_profile_image_caches) == 1
+
+        plane_index, image_cache = fit_likelihood.light_profile_image_caches[0]
+
+        assert plane_index == 0
+        assert image_cache.light_profile is lens_light
+        assert image_cache.image is not None
+
+        tracer = tracer_from(einstein_radius=1.3)
+
+        figure_of_merit = fit_likelihood.figure_of_merit_from_tracer(tracer=tracer)
+
+        fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+        assert figure_of_merit == fit.figure_of_merit
+        assert fit_likelihood.light_profile_image_caches == [(0, image_cache)]
+
+        # With a fixed mass profile the source light behind it is also constant.
+
+        mass = al.mp.SphericalIsothermal(einstein_radius=1.0)
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(redshift=0.5, light_profile=lens_light, mass_profile=mass),
+                al.Galaxy(redshift=1.0, light_profile=source_light),
+            ]
+        )
+
+        fit_likelihood.figure_of_merit_from_tracer(tracer=tracer)
+        figure_of_merit = fit_likelihood.figure_of_merit_from_tracer(tracer=tracer)
+
+        fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+        assert [
+            (plane_index, image_cache.light_profile)
+            for plane_index, image_cache in fit_likelihood.light_profile_image_caches
+        ] == [(0, lens_light), (1, source_light)]
+        assert fit_likelihood.light_profile_image_caches[0][1] is image_cache
+        assert figure_of_merit == fit.figure_of_merit
+
+        # Once all light profile images are cached the tracer is reused for a tracer with the same galaxy attributes.
+
+        tracer_with_constant_images = fit_likelihood.tracer_with_constant_images
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(redshift=0.5, light_profile=lens_light, mass_profile=mass),
+                al.Galaxy(redshift=1.0, light_profile=source_light),
+            ]
+        )
+
+        figure_of_merit = fit_likelihood.figure_of_merit_from_tracer(tracer=tracer)
+
+        assert figure_of_merit == fit.figure_of_merit
+        assert fit_likelihood.tracer_with_constant_images is tracer_with_constant_images
+
+    def test__constant_image_cache__plane_redshifts_change__images_not_reused(
+        self, masked_imaging_7x7
+    ):
+
+        lens_light = al.lp.EllipticalSersic(intensity=1.0)
+        source_light = al.lp.EllipticalSersic(intensity=2.0)
+        mass = al.mp.SphericalIsothermal(einstein_radius=1.0)
+
+        fit_likelihood = al.FitImagingLikelihood(
+            masked_imaging=masked_imaging_7x7, use_constant_image_cache=True
+        )
+
+        # The source galaxy has a free redshift, which changes its traced grid even though its profiles are fixed.
+
+        for source_redshift in [1.0, 1.0, 2.0, 2.0]:
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5, light_profile=lens_light, mass_profile=mass
+                    ),
+                    al.Galaxy(redshift=source_redshift, light_profile=source_light),
+                ]
+            )
+
+            figure_of_merit = fit_likelihood.figure_of_merit_from_tracer(tracer=tracer)
+
+            fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+            assert figure_of_merit == fit.figure_of_merit
+
+        # A galaxy moving to a different plane of the same plane redshifts is also not reused.
+
+        galaxy_light = al.Galaxy(redshift=1.0, light_profile=source_light)
+
+        for light_redshift in [1.0, 1.0, 2.0]:
+
+            galaxy_light.redshift = light_redshift
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5, light_profile=lens_light, mass_profile=mass
+                    ),
+                    al.Galaxy(redshift=1.0, mass_profile=mass),
+                    al.Galaxy(redshift=2.0),
+                    galaxy_light,
+                ]
+            )
+
+            figure_of_merit = fit_likelihood.figure_of_merit_from_tracer(tracer=tracer)
+
+            fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+            assert tracer.plane_redshifts == [0.5, 1.0, 2.0]
+            assert figure_of_merit == fit.figure_of_merit
+
+        assert [
+            (plane_index, image_cache.light_profile)
+            for plane_index, image_cache in fit_likelihood.light_profile_image_caches
+        ] == [(0, lens_light)]
+
+    def test__constant_image_cache__tracer_settings_kept(self, masked_imaging_7x7):
+
+        lens_light = al.lp.EllipticalSersic(intensity=1.0)
+        source_light = al.lp.EllipticalSersic(intensity=2.0)
+        mass = al.mp.SphericalIsothermal(einstein_radius=1.0)
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(redshift=0.5, light_profile=lens_light, mass_profile=mass),
+                al.Galaxy(redshift=1.0, light_profile=source_light),
+            ],
+            cosmology=cosmo.FlatLambdaCDM(H0=70.0, Om0=0.3),
+            deflections_opening_angle=0.5,
+        )
+
+        fit_likelihood = al.FitImagingLikelihood(
+            masked_imaging=masked_imaging_7x7, use_constant_image_cache=True
+        )
+
+        fit_likelihood.figure_of_merit_from_tracer(tracer=tracer)
+        figure_of_merit = fit_likelihood.figure_of_merit_from_tracer(tracer=tracer)
+
+        fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+        assert figure_of_merit == fit.figure_of_merit
+
+        tracer_with_constant_images = fit_likelihood.tracer_with_constant_images
+
+        assert tracer_with_constant_images is not tracer
+        assert tracer_with_constant_images.plane_redshifts == [0.5, 1.0]
+        assert tracer_with_constant_images.cosmology is tracer.cosmology
+        assert tracer_with_constant_images.deflections_opening_angle == 0.5
+
+    def test__light_profile_image_cache__only_traced_grid_of_workspace_cached(
+        self, masked_imaging_7x7
+    ):
+
+        from autolens.fit import fit as fit_module
+
+        light_profile = al.lp.EllipticalSersic(intensity=1.0)
+
+        workspace = al.FitImagingWorkspace(masked_imaging=masked_imaging_7x7)
+        traced_grids, _ = workspace.traced_grids_workspace_from(total_planes=2)
+        traced_grids[:] = workspace.grid_and_blurring_grid
+
+        image_cache = fit_module.LightProfileImageCache(
+            light_profile=light_profile, workspace=workspace, plane_index=1
+        )
+
+        # A grid of the same number of (y,x) coordinates which is not the traced grid of the plane is not cached.
+
+        for grid in [workspace.grid_and_blurring_grid, traced_grids[0]]:
+            image_cache.image_from_grid(grid=grid)
+            assert image_cache.image is None
+
+        image = image_cache.image_from_grid(grid=traced_grids[:2][1])
+
+        assert image_cache.image_from_grid(grid=traced_grids[1]) is image
+        assert (
+            image == light_profile.image_from_grid(grid=workspace.grid_and_blurring_grid)
+        ).all()
+
+        image_radial_minimum = image_cache.image_from_grid(
+            grid=traced_grids[1], grid_radial_minimum=0.5
+        )
+
+        assert image_radial_minimum is not image
+        assert (
+            image_radial_minimum
+            == light_profile.image_from_grid(
+                grid=traced_grids[1], grid_radial_minimum=0.5
+            )
+        ).all()
+
+    def test__galaxy_with_light_profiles_replaced_from(self, masked_imaging_7x7):
+
+        from autolens.fit import fit as fit_module
+
+        light_0 = al.lp.EllipticalSersic(intensity=1.0)
+        light_1 = al.lp.EllipticalSersic(intensity=2.0)
+        mass = al.mp.SphericalIsothermal(einstein_radius=1.0)
+
+        galaxy = al.Galaxy(
+            redshift=0.5, light_0=light_0, light_1=light_1, mass_profile=mass
+        )
+
+        image_cache = fit_module.LightProfileImageCache(
+            light_profile=light_0,
+            workspace=al.FitImagingWorkspace(masked_imaging=masked_imaging_7x7),
+            plane_index=0,
+        )
+
+        galaxy_replaced = fit_module.galaxy_with_light_profiles_replaced_from(
+            galaxy=galaxy, light_profile_image_caches=[image_cache]
+        )
+
+        assert galaxy_replaced.light_profiles == [image_cache, light_1]
+        assert galaxy_replaced.mass_profiles == [mass]
+        assert galaxy_replaced.redshift == 0.5
+        assert galaxy.light_profiles == [light_0, light_1]
+
+        assert (
+            fit_module.galaxy_with_light_profiles_replaced_from(
+                galaxy=galaxy, light_profile_image_caches=[]
+            )
+            is galaxy
+        )
+
+    def test__profiles_only__figure_of_merit_identical_to_fit_imaging(
+        self, masked_imaging_7x7
+    ):
+
+        galaxy_light = al.Galaxy(
+            redshift=0.5,
+            light_profile=al.lp.EllipticalSersic(intensity=1.0),
+            mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+        )
+
+        galaxy_source = al.Galaxy(
+            redshift=1.0, light_profile=al.lp.EllipticalSersic(intensity=2.0)
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[galaxy_light, galaxy_source])
+
+        fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+        fit_likelihood = al.FitImagingLikelihood(masked_imaging=masked_imaging_7x7)
+
+        assert (
+            fit_likelihood.figure_of_merit_from_tracer(tracer=tracer)
+            == fit.figure_of_merit
+        )
+        assert (
+            fit_likelihood.figure_of_merit_from_tracer(tracer=tracer)
+            == fit.log_likelihood
+        )
+
+    def test__hyper_methods__figure_of_merit_identical_to_fit_imaging(
+        self, masked_imaging_7x7
+    ):
+
+        hyper_image_sky = al.hyper_data.HyperImageSky(sky_scale=1.0)
+        hyper_background_noise = al.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        galaxy_light = al.Galaxy(
+            redshift=0.5,
+            light_profile=al.lp.EllipticalSersic(intensity=1.0),
+            hyper_galaxy=al.HyperGalaxy(
+                contribution_factor=1.0, noise_factor=1.0, noise_power=1.0
+            ),
+            hyper_model_image=al.Array.ones(shape_2d=(3, 3), pixel_scales=1.0),
+            hyper_galaxy_image=al.Array.ones(shape_2d=(3, 3), pixel_scales=1.0),
+            hyper_minimum_value=0.0,
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[galaxy_light])
+
+        fit_likelihood = al.FitImagingLikelihood(masked_imaging=masked_imaging_7x7)
+
+        for use_hyper_scaling in [True, False]:
+
+            fit = al.FitImaging(
+                masked_imaging=masked_imaging_7x7,
+                tracer=tracer,
+                hyper_image_sky=hyper_image_sky,
+                hyper_background_noise=hyper_background_noise,
+                use_hyper_scaling=use_hyper_scaling,
+            )
+
+            assert (
+                fit_likelihood.figure_of_merit_from_tracer(
+                    tracer=tracer,
+                    hyper_image_sky=hyper_image_sky,
+                    hyper_background_noise=hyper_background_noise,
+                    use_hyper_scaling=use_hyper_scaling,
+                )
+                == fit.figure_of_merit
+            )
+
+    def test__profiles_and_inversion__figure_of_merit_identical_to_fit_imaging(
+        self, masked_imaging_7x7
+    ):
+
+        hyper_image_sky = al.hyper_data.HyperImageSky(sky_scale=1.0)
+        hyper_background_noise = al.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        galaxy_light = al.Galaxy(
+            redshift=0.5, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        galaxy_pix = al.Galaxy(
+            redshift=1.0,
+            pixelization=al.pix.Rectangular(shape=(3, 3)),
+            regularization=al.reg.Constant(coefficient=1.0),
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[galaxy_light, galaxy_pix])
+
+        fit_likelihood = al.FitImagingLikelihood(masked_imaging=masked_imaging_7x7)
+
+        fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+        assert (
+            fit_likelihood.figure_of_merit_from_tracer(tracer=tracer)
+            == fit.figure_of_merit
+        )
+        assert (
+            fit_likelihood.figure_of_merit_from_tracer(tracer=tracer)
+            == fit.log_evidence
+        )
+
+        fit = al.FitImaging(
+            masked_imaging=masked_imaging_7x7,
+            tracer=tracer,
+            hyper_image_sky=hyper_image_sky,
+            hyper_background_noise=hyper_background_noise,
+        )
+
+        assert (
+            fit_likelihood.figure_of_merit_from_tracer(
+                tracer=tracer,
+                hyper_image_sky=hyper_image_sky,
+                hyper_background_noise=hyper_background_noise,
+            )
+            == fit.figure_of_merit
+        )
+
 
 class TestFitInterferometer:
     class TestFitProperties:
@@ -1698,6 +2327,42 @@ class TestFitInterferometer:
 
             assert fit.total_inversions == 3
 
+        def test__cached_products__computed_once_and_released(
+            self, masked_interferometer_7
+        ):
+
+            galaxy_light = al.Galaxy(
+                redshift=0.5,
+                light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+
+            galaxy_source = al.Galaxy(
+                redshift=1.0, light_profile=al.lp.EllipticalSersic(intensity=2.0)
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[galaxy_light, galaxy_source])
+
+            fit = al.FitInterferometer(
+                masked_interferometer=masked_interferometer_7, tracer=tracer
+            )
+
+            model_visibilities_of_planes = fit.model_visibilities_of_planes
+
+            assert fit.model_visibilities_of_planes is model_visibilities_of_planes
+            assert fit.galaxy_model_image_dict is fit.galaxy_model_image_dict
+            assert (
+                fit.galaxy_model_visibilities_dict
+                is fit.galaxy_model_visibilities_dict
+            )
+
+            fit.release_cache()
+
+            assert fit.model_visibilities_of_planes is not model_visibilities_of_planes
+            assert (
+                fit.model_visibilities_of_planes[1] == model_visibilities_of_planes[1]
+            ).all()
+
     class TestLikelihood:
         def test__1x2_image__1x2_visibilities__simple_fourier_transform(self):
             # The image plane image generated by the galaxy is [1.0, 1.0]
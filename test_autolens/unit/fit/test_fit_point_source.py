@@ -178,6 +178,116 @@ class TestFitPositionsImage:
         assert fit.chi_squared == pytest.approx(42.0, 1.0e-4)
         assert fit.noise_normalization == pytest.approx(4.12733, 1.0e-4)
         assert fit.log_likelihood == pytest.approx(-23.06366, 1.0e-4)
+        assert fit.model_magnifications is None
+
+    def test__model_magnifications_of_solver_paired_to_positions(self):
+
+        tracer = MockTracerPositions(positions=None)
+
+        positions = al.GridIrregularGrouped([[(0.0, 0.0), (3.0, 4.0)], [(3.0, 3.0)]])
+
+        noise_map = al.ValuesIrregularGrouped([[0.5, 1.0], [1.0]])
+
+        model_positions = al.GridIrregularGrouped(
+            [[(3.0, 4.5), (0.5, 0.0), (9.0, 9.0)], [(3.0, 3.0)]]
+        )
+
+        magnifications = al.ValuesIrregularGrouped([[2.0, -3.0, 4.0], [5.0]])
+
+        positions_solver = mock.MockPositionsSolver(
+            model_positions=model_positions, magnifications=magnifications
+        )
+
+        fit = al.FitPositionsImage(
+            positions=positions,
+            noise_map=noise_map,
+            tracer=tracer,
+            positions_solver=positions_solver,
+        )
+
+        assert fit.model_positions.in_grouped_list == [
+            [(0.5, 0.0), (3.0, 4.5)],
+            [(3.0, 3.0)],
+        ]
+        assert fit.model_magnifications.in_grouped_list == [[-3.0, 2.0], [5.0]]
+
+    def test__model_magnifications__tracer_magnifications_at_model_positions(self):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                al.Galaxy(
+                    redshift=1.0,
+                    light=al.lp.PointSourceFlux(centre=(0.0, 0.3), flux=2.0),
+                ),
+            ]
+        )
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05)
+
+        solver = al.PositionsSolver(grid=grid, pixel_scale_precision=0.01)
+
+        positions = al.GridIrregularGrouped(grid=[[(0.0, -0.7), (0.0, 1.3)]])
+
+        fit = al.FitPositionsImage(
+            positions=positions,
+            noise_map=al.ValuesIrregularGrouped([[1.0, 1.0]]),
+            tracer=tracer,
+            positions_solver=solver,
+        )
+
+        # The solver's magnifications are computed with a buffer of its final pixel scale, 0.05 / 2 ** 3.
+
+        magnifications = tracer.magnification_irregular_from_grid(
+            grid=fit.model_positions, buffer=0.00625
+        )
+
+        assert list(fit.model_magnifications) == pytest.approx(
+            list(magnifications), 1.0e-4
+        )
+        assert list(fit.model_magnifications) == pytest.approx(
+            [-2.29935, 4.36821], 1.0e-4
+        )
+
+        fit_fluxes = al.FitFluxes(
+            fluxes=al.ValuesIrregularGrouped([[1.0, 1.0]]),
+            noise_map=al.ValuesIrregularGrouped([[1.0, 1.0]]),
+            positions=positions,
+            tracer=tracer,
+            magnifications=fit.model_magnifications,
+        )
+
+        assert list(fit_fluxes.magnifications) == pytest.approx(
+            list(np.abs(magnifications)), 1.0e-4
+        )
+        assert list(fit_fluxes.model_fluxes) == pytest.approx(
+            [2.0 * 2.29935, 2.0 * 4.36821], 1.0e-4
+        )
+
+
+class TestFitFluxes:
+    def test__magnifications_input__used_instead_of_tracer_magnifications(self):
+
+        fluxes = al.ValuesIrregularGrouped([[1.0, 2.0]])
+
+        noise_map = al.ValuesIrregularGrouped([[3.0, 1.0]])
+
+        positions = al.GridIrregularGrouped([[(0.0, 0.0), (3.0, 4.0)]])
+
+        tracer = MockTracerPositions(magnification=None, flux_hack=2.0)
+
+        fit = al.FitFluxes(
+            fluxes=fluxes,
+            noise_map=noise_map,
+            positions=positions,
+            tracer=tracer,
+            magnifications=al.ValuesIrregularGrouped([[2.0, -2.0]]),
+        )
+
+        assert list(fit.magnifications) == [2.0, 2.0]
+        assert list(fit.model_fluxes) == [4.0, 4.0]
 
     def test__more_model_positions_than_data_positions__pairs_closest_positions(self):
 
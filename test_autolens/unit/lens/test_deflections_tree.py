@@ -0,0 +1,117 @@
+import autolens as al
+import numpy as np
+import pytest
+from autolens.lens import deflections_tree
+
+
+class TestTotalMassAndExtent:
+    def test__point_mass_and_truncated_nfw__matches_far_field_deflections(self):
+
+        point_mass = al.mp.PointMass(einstein_radius=2.0)
+
+        total_mass, extent = deflections_tree.total_mass_and_extent_from(
+            mass_profile=point_mass
+        )
+
+        assert total_mass == pytest.approx(4.0 * np.pi, 1.0e-8)
+        assert extent == 0.0
+
+        truncated_nfw = al.mp.SphericalTruncatedNFW(
+            kappa_s=0.1, scale_radius=0.5, truncation_radius=1.5
+        )
+
+        total_mass, extent = deflections_tree.total_mass_and_extent_from(
+            mass_profile=truncated_nfw
+        )
+
+        deflections = truncated_nfw.deflections_from_grid(grid=np.array([[0.0, 1.0e3]]))
+
+        assert total_mass == pytest.approx(np.pi * 1.0e3 * deflections[0, 1], 1.0e-4)
+        assert extent == 1.5
+
+        assert deflections_tree.total_mass_and_extent_from(
+            mass_profile=al.mp.SphericalIsothermal()
+        ) == (None, None)
+
+
+class TestDeflectionsTree:
+    def test__many_halos__approximates_direct_sum(self):
+
+        np.random.seed(1)
+
+        mass_profiles = [
+            al.mp.SphericalTruncatedNFW(
+                centre=tuple(np.random.uniform(-3.0, 3.0, 2)),
+                kappa_s=0.02,
+                scale_radius=0.1,
+                truncation_radius=0.3,
+            )
+            for _ in range(100)
+        ]
+        mass_profiles.append(al.mp.SphericalIsothermal(einstein_radius=1.0))
+
+        grid = al.Grid.uniform(shape_2d=(30, 30), pixel_scales=0.2)
+
+        deflections_exact = sum(
+            mass_profile.deflections_from_grid(grid=grid)
+            for mass_profile in mass_profiles
+        )
+
+        tree = al.DeflectionsTree(mass_profiles=mass_profiles, opening_angle=0.5)
+
+        assert tree.exact_mass_profile_indexes == [100]
+        assert len(tree.root.children) > 0
+
+        deflections = tree.deflections_from_grid(grid=grid)
+
+        assert deflections == pytest.approx(np.asarray(deflections_exact), abs=1.0e-3)
+
+        tree = al.DeflectionsTree(mass_profiles=mass_profiles, opening_angle=0.0)
+
+        deflections = tree.deflections_from_grid(grid=grid)
+
+        assert deflections == pytest.approx(np.asarray(deflections_exact), 1.0e-8)
+
+    def test__tracer_with_deflections_opening_angle__traced_grids_approximate_exact_tracer(
+        self,
+    ):
+
+        np.random.seed(2)
+
+        line_of_sight_galaxies = [
+            al.Galaxy(
+                redshift=0.3,
+                mass=al.mp.SphericalTruncatedNFW(
+                    centre=tuple(np.random.uniform(-3.0, 3.0, 2)),
+                    kappa_s=0.02,
+                    scale_radius=0.1,
+                    truncation_radius=0.3,
+                ),
+            )
+            for _ in range(30)
+        ]
+
+        galaxies = line_of_sight_galaxies + [
+            al.Galaxy(redshift=0.5, mass=al.mp.SphericalIsothermal()),
+            al.Galaxy(redshift=1.0, light=al.lp.SphericalSersic()),
+        ]
+
+        tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+        tracer_tree = al.Tracer.from_galaxies(
+            galaxies=galaxies, deflections_opening_angle=0.5
+        )
+
+        assert tracer.deflections_trees_of_planes == [None, None, None]
+        assert isinstance(
+            tracer_tree.deflections_trees_of_planes[0], al.DeflectionsTree
+        )
+        assert tracer_tree.deflections_trees_of_planes[1:] == [None, None]
+
+        grid = al.Grid.uniform(shape_2d=(10, 10), pixel_scales=0.3)
+
+        traced_grids = tracer.traced_grids_of_planes_from_grid(grid=grid)
+        traced_grids_tree = tracer_tree.traced_grids_of_planes_from_grid(grid=grid)
+
+        assert traced_grids_tree[2] == pytest.approx(
+            np.asarray(traced_grids[2]), abs=1.0e-3
+        )
@@ -1,7 +1,9 @@
+from os import path
 from autoarray.structures import grids
 import autolens as al
 from autolens.lens import positions_solver as pos
 
+import json
 import numpy as np
 
 import pytest
@@ -111,6 +113,52 @@ class TestAbstractPositionsSolver:
         assert positions.in_grouped_list == [[(1.0, 0.0), (0.1, 0.0)]]
         assert positions.pixel_scales == (0.01, 0.01)
 
+    def test__magnifications_and_parities__same_as_lensing_object__stored_for_solution(
+        self,
+    ):
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        grid = grids.GridIrregularGroupedUniform(
+            grid=[(1.5, 0.0), (0.5, 0.0), (0.0, -0.9)], pixel_scales=0.01
+        )
+
+        solver = pos.AbstractPositionsSolver(magnification_threshold=0.0)
+
+        magnifications, parities = solver.magnifications_and_parities_from(
+            lensing_obj=sis, grid=grid, buffer=0.01
+        )
+
+        assert magnifications == pytest.approx(
+            np.asarray(sis.magnification_irregular_from_grid(grid=grid, buffer=0.01)),
+            1.0e-8,
+        )
+        assert list(parities) == [1, -1, -1]
+
+        solver = pos.AbstractPositionsSolver(magnification_threshold=2.5)
+
+        positions = solver.grid_with_points_below_magnification_threshold_removed(
+            lensing_obj=sis, grid=grid
+        )
+
+        assert positions.in_grouped_list == [[(1.5, 0.0), (0.0, -0.9)]]
+        assert solver.magnifications == pytest.approx(magnifications[[0, 2]], 1.0e-8)
+        assert list(solver.parities) == [1, -1]
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=1)
+
+        solver = pos.PositionsSolverNewton(grid=grid, pixel_scale_precision=1.0e-6)
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert solver.magnifications == pytest.approx(
+            np.asarray(
+                sis.magnification_irregular_from_grid(grid=positions, buffer=1.0e-6)
+            ),
+            1.0e-4,
+        )
+        assert list(solver.parities) == [-1, 1]
+
 
 class TestPositionSolver:
     def test__positions_found_for_simple_mass_profiles(self):
@@ -160,6 +208,62 @@ class TestPositionSolver:
             (-1.028125, -0.003125), 1.0e-4
         )
 
+    def test__refined_coordinates_of_stacked_grids_same_as_each_coordinate_separately(
+        self,
+    ):
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=1)
+
+        sie = al.mp.EllipticalIsothermal(
+            centre=(0.001, 0.001), einstein_radius=1.0, elliptical_comps=(0.0, 0.111111)
+        )
+
+        solver = pos.PositionsSolver(grid=grid, pixel_scale_precision=0.01)
+
+        coordinates = solver.grid_peaks_from(
+            lensing_obj=sie, grid=solver.grid, source_plane_coordinate=(0.0, 0.0)
+        )
+
+        refined_coordinates = solver.refined_coordinates_from_coordinates(
+            coordinates=coordinates,
+            pixel_scale=0.05,
+            lensing_obj=sie,
+            source_plane_coordinate=(0.0, 0.0),
+        )
+
+        refined_coordinates_of_each_coordinate = []
+
+        for coordinate in coordinates:
+
+            grid_upscaled = solver.grid_buffed_and_upscaled_around_coordinate_from(
+                coordinate=coordinate,
+                pixel_scales=(0.05, 0.05),
+                buffer=4,
+                upscale_factor=solver.upscale_factor,
+            )
+
+            refined_coordinates_of_each_coordinate += list(
+                solver.grid_peaks_from(
+                    lensing_obj=sie,
+                    grid=grid_upscaled,
+                    source_plane_coordinate=(0.0, 0.0),
+                )
+            )
+
+        assert len(coordinates) > 1
+        assert (
+            refined_coordinates == np.asarray(refined_coordinates_of_each_coordinate)
+        ).all()
+
+        refined_coordinates = solver.refined_coordinates_from_coordinates(
+            coordinates=[],
+            pixel_scale=0.05,
+            lensing_obj=sie,
+            source_plane_coordinate=(0.0, 0.0),
+        )
+
+        assert refined_coordinates.shape == (0, 2)
+
     def test__same_as_above_using_solver_for_tracer_method(self):
 
         grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=1)
@@ -181,7 +285,7 @@ class TestPositionSolver:
 
         solver = pos.PositionsSolver(grid=grid, pixel_scale_precision=0.01)
 
-        coordinates = solver.solve_from_tracer(tracer=tracer)
+        coordinates = solver.solve_from_tracer(tracer=tracer)[0]
 
         assert coordinates.in_grouped_list[0][0] == pytest.approx(
             (1.028125, -0.003125), 1.0e-4
@@ -225,7 +329,7 @@ class TestPositionSolver:
             lensing_obj=tracer, source_plane_coordinate=(0.1, 0.1)
         )
 
-        positions = solver.solve_from_tracer(tracer=tracer)
+        positions = solver.solve_from_tracer(tracer=tracer)[0]
 
         assert position_manual_0.in_grouped_list[0] == positions.in_grouped_list[0]
         assert position_manual_1.in_grouped_list[0] == positions.in_grouped_list[1]
@@ -242,11 +346,430 @@ class TestPositionSolver:
 
         solver = pos.PositionsSolver(grid=grid, pixel_scale_precision=0.01)
 
-        positions = solver.solve_from_tracer(tracer=tracer)
+        positions = solver.solve_from_tracer(tracer=tracer)[0]
 
         assert position_manual_0.in_grouped_list[0] == positions.in_grouped_list[0]
         assert position_manual_1.in_grouped_list[0] == positions.in_grouped_list[1]
 
+    def test__solver_for_tracer_method__initial_grid_traced_once_for_all_centres(self,):
+
+        grid = al.Grid.uniform(shape_2d=(50, 50), pixel_scales=0.05, sub_size=1)
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.0, 0.0), einstein_radius=1.0, elliptical_comps=(0.0, 0.055555)
+            ),
+        )
+
+        g1 = al.Galaxy(
+            redshift=1.0,
+            light_0=al.lp.EllipticalLightProfile(centre=(0.0, 0.0)),
+            light_1=al.lp.EllipticalLightProfile(centre=(0.1, 0.1)),
+            light_2=al.lp.EllipticalLightProfile(centre=(-0.1, 0.05)),
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+        grid_sizes = []
+
+        class MockTracer:
+            def __getattr__(self, item):
+                return getattr(tracer, item)
+
+            def deflections_from_grid(self, grid):
+                grid_sizes.append(grid.shape[0])
+                return tracer.deflections_from_grid(grid=grid)
+
+        solver = pos.PositionsSolver(grid=grid, pixel_scale_precision=0.01)
+
+        positions = solver.solve_from_tracer(tracer=MockTracer())[0]
+
+        assert grid_sizes.count(grid.shape[0]) == 1
+
+        for index, centre in enumerate(tracer.light_profile_centres):
+
+            position_manual = solver.solve(
+                lensing_obj=tracer, source_plane_coordinate=centre
+            )
+
+            assert (
+                position_manual.in_grouped_list[0] == positions.in_grouped_list[index]
+            )
+
+    def test__adaptive_grid__same_peaks_and_positions_as_full_initial_grid(self):
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=1)
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+        )
+
+        g1 = al.Galaxy(
+            redshift=1.0, light=al.lp.EllipticalLightProfile(centre=(0.0, 0.02))
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+        solver = pos.PositionsSolver(grid=grid, pixel_scale_precision=0.01)
+
+        solver_adaptive = pos.PositionsSolver(
+            grid=grid, pixel_scale_precision=0.01, adaptive_grid_levels=3
+        )
+
+        grid_peaks = solver.grid_peaks_from(
+            lensing_obj=tracer, grid=grid, source_plane_coordinate=(0.0, 0.02)
+        )
+
+        grid_peaks_adaptive = solver_adaptive.grid_peaks_adaptive_from(
+            lensing_obj=tracer, source_plane_coordinate=(0.0, 0.02)
+        )
+
+        assert np.array(sorted(grid_peaks.in_1d_list)) == pytest.approx(
+            np.array(sorted(grid_peaks_adaptive.in_1d_list)), abs=1.0e-8
+        )
+
+        adaptive_grid = solver_adaptive.adaptive_grid_from(
+            lensing_obj=tracer, source_plane_coordinate=(0.0, 0.02)
+        )
+
+        assert adaptive_grid.shape[0] < 0.1 * grid.shape[0]
+
+        positions = solver.solve_from_tracer(tracer=tracer)[0]
+        positions_adaptive = solver_adaptive.solve_from_tracer(tracer=tracer)[0]
+
+        assert np.asarray(positions) == pytest.approx(
+            np.asarray(positions_adaptive), abs=1.0e-8
+        )
+
+    def test__warm_start__seeded_solve_same_as_full_grid__falls_back_if_image_missing(
+        self,
+    ):
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=1)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = pos.PositionsSolver(grid=grid, pixel_scale_precision=0.001)
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        positions_warm = solver.solve(
+            lensing_obj=sis,
+            source_plane_coordinate=(0.0, 0.11),
+            seed_coordinates=np.array([[0.01, -0.9], [-0.01, 1.12]]),
+            total_images=2,
+        )
+
+        distances = np.sqrt(
+            np.sum(
+                np.square(
+                    np.asarray(positions)[:, None, :]
+                    - np.asarray(positions_warm)[None, :, :]
+                ),
+                axis=2,
+            )
+        )
+
+        assert np.max(np.min(distances, axis=0)) < 0.002
+        assert np.max(np.min(distances, axis=1)) < 0.002
+
+        positions_warm = solver.solve(
+            lensing_obj=sis,
+            source_plane_coordinate=(0.0, 0.11),
+            seed_coordinates=np.array([[-0.01, 1.12]]),
+            total_images=2,
+        )
+
+        assert positions_warm.in_grouped_list[0] == positions.in_grouped_list[0]
+
+    def test__warm_start__solve_from_tracer_seeded_by_previous_solution_and_observed_positions(
+        self,
+    ):
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=1)
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+        )
+
+        g1 = al.Galaxy(
+            redshift=1.0, light=al.lp.EllipticalLightProfile(centre=(0.0, 0.0))
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+        solver = pos.PositionsSolverNewton(grid=grid, pixel_scale_precision=1.0e-6)
+
+        positions = solver.solve_from_tracer(tracer=tracer)[0]
+
+        solver_warm = pos.PositionsSolverNewton(
+            grid=grid, pixel_scale_precision=1.0e-6, use_warm_start=True
+        )
+
+        positions_warm = solver_warm.solve_from_tracer(
+            tracer=tracer, positions=positions
+        )[0]
+
+        assert len(solver_warm.warm_start_solutions) == 1
+        assert np.asarray(positions_warm) == pytest.approx(
+            np.asarray(positions), abs=1.0e-6
+        )
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.01,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+        positions = solver.solve_from_tracer(tracer=tracer)[0]
+        positions_warm = solver_warm.solve_from_tracer(tracer=tracer)[0]
+
+        assert np.asarray(positions_warm) == pytest.approx(
+            np.asarray(positions), abs=1.0e-6
+        )
+        assert np.asarray(solver_warm.warm_start_solutions[0]) == pytest.approx(
+            np.asarray(positions), abs=1.0e-6
+        )
+
+    def test__solve_catalogue__serial_and_process_pool_results_identical_to_solve(
+        self, tmp_path
+    ):
+
+        grid = al.Grid.uniform(shape_2d=(50, 50), pixel_scales=0.1, sub_size=1)
+
+        lensing_objs = [
+            al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0),
+            al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+            al.mp.SphericalIsothermal(centre=(0.1, 0.0), einstein_radius=1.2),
+        ]
+
+        source_plane_coordinates = [(0.0, 0.11), (0.0, 0.02), (0.05, 0.1)]
+
+        solver = pos.PositionsSolver(grid=grid, pixel_scale_precision=0.01)
+
+        file_path = path.join(tmp_path, "catalogue.json")
+
+        for processes, chunk_size in [(1, 2), (2, 1)]:
+
+            total_solves, throughput = solver.solve_catalogue(
+                lensing_objs=iter(lensing_objs),
+                source_plane_coordinates=iter(source_plane_coordinates),
+                file_path=file_path,
+                processes=processes,
+                chunk_size=chunk_size,
+            )
+
+            assert total_solves == 3
+            assert throughput > 0.0
+
+            with open(file_path) as f:
+                entries = [json.loads(line) for line in f]
+
+            for index, (lensing_obj, source_plane_coordinate) in enumerate(
+                zip(lensing_objs, source_plane_coordinates)
+            ):
+
+                positions = solver.solve(
+                    lensing_obj=lensing_obj,
+                    source_plane_coordinate=source_plane_coordinate,
+                )
+
+                assert entries[index]["index"] == index
+                assert entries[index]["source_plane_coordinate"] == list(
+                    source_plane_coordinate
+                )
+                assert entries[index]["positions"] == np.asarray(positions).tolist()
+                assert entries[index]["magnifications"] == list(solver.magnifications)
+                assert entries[index]["parities"] == list(solver.parities)
+
+
+class TestPositionsSolverNewton:
+    def test__positions_found_for_simple_mass_profile_to_precision(self):
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = al.PositionsSolverNewton(grid=grid, pixel_scale_precision=1.0e-6)
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert positions.in_grouped_list[0][0] == pytest.approx(
+            (0.0, -0.89), abs=1.0e-6
+        )
+        assert positions.in_grouped_list[0][1] == pytest.approx((0.0, 1.11), abs=1.0e-6)
+        assert 1 <= solver.iterations <= 6
+
+    def test__multi_plane_tracer__positions_trace_to_source_plane_coordinate(self):
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=1)
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+        )
+
+        g1 = al.Galaxy(
+            redshift=1.0,
+            mass=al.mp.SphericalIsothermal(centre=(0.05, 0.0), einstein_radius=0.2),
+        )
+
+        g2 = al.Galaxy(redshift=2.0)
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, g1, g2])
+
+        solver = al.PositionsSolverNewton(grid=grid, pixel_scale_precision=1.0e-6)
+
+        positions = solver.solve(
+            lensing_obj=tracer, source_plane_coordinate=(0.0, 0.02)
+        )
+
+        assert len(positions.in_grouped_list[0]) == 4
+        assert solver.iterations <= 10
+
+        traced_positions = tracer.traced_grids_of_planes_from_grid(grid=positions)[-1]
+
+        assert np.asarray(traced_positions) == pytest.approx(
+            np.array([[0.0, 0.02]] * 4), abs=1.0e-8
+        )
+
+        positions_upscaled = pos.PositionsSolver(
+            grid=grid, pixel_scale_precision=0.001
+        ).solve(lensing_obj=tracer, source_plane_coordinate=(0.0, 0.02))
+
+        for position in positions.in_grouped_list[0]:
+
+            distances = np.sqrt(
+                np.sum(np.square(np.asarray(positions_upscaled) - position), axis=1)
+            )
+
+            assert np.min(distances) < 0.005
+
+
+class TestPositionsSolverTriangles:
+    def test__positions_found_for_simple_mass_profiles_to_precision(self):
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = al.PositionsSolverTriangles(grid=grid, pixel_scale_precision=1.0e-6)
+
+        assert solver.total_subdivisions == 16
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert len(positions.in_grouped_list[0]) == 2
+        assert positions.in_grouped_list[0][0] == pytest.approx(
+            (0.0, -0.89), abs=1.0e-6
+        )
+        assert positions.in_grouped_list[0][1] == pytest.approx((0.0, 1.11), abs=1.0e-6)
+
+    def test__singular_centre_gives_no_image__cored_centre_gives_central_image(self):
+
+        grid = al.Grid.uniform(shape_2d=(101, 101), pixel_scales=0.05)
+
+        solver = al.PositionsSolverTriangles(grid=grid, pixel_scale_precision=1.0e-6)
+
+        sie = al.mp.EllipticalIsothermal(
+            centre=(0.0, 0.0), einstein_radius=1.0, elliptical_comps=(0.0, 0.111111)
+        )
+
+        positions = solver.solve(lensing_obj=sie, source_plane_coordinate=(0.0, 0.05))
+
+        assert len(positions.in_grouped_list[0]) == 4
+        assert np.min(np.sqrt(np.sum(np.square(positions), axis=1))) > 0.5
+
+        cored_sis = al.mp.SphericalCoredIsothermal(
+            centre=(0.0, 0.0), einstein_radius=1.0, core_radius=0.1
+        )
+
+        positions = solver.solve(
+            lensing_obj=cored_sis, source_plane_coordinate=(0.0, 0.05)
+        )
+
+        assert len(positions.in_grouped_list[0]) == 3
+        assert positions.in_grouped_list[0][1] == pytest.approx(
+            (0.0, -0.01256146), abs=1.0e-6
+        )
+
+        traced_positions = np.asarray(positions) - np.asarray(
+            cored_sis.deflections_from_grid(grid=np.asarray(positions))
+        )
+
+        assert traced_positions == pytest.approx(
+            np.array([[0.0, 0.05]] * 3), abs=1.0e-8
+        )
+
+    def test__multi_plane_tracer__same_positions_as_newton_solver(self):
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=1)
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+        )
+
+        g1 = al.Galaxy(
+            redshift=1.0,
+            mass=al.mp.SphericalIsothermal(centre=(0.05, 0.0), einstein_radius=0.2),
+        )
+
+        g2 = al.Galaxy(
+            redshift=2.0, light=al.lp.EllipticalLightProfile(centre=(0.0, 0.02))
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, g1, g2])
+
+        solver = al.PositionsSolverTriangles(grid=grid, pixel_scale_precision=1.0e-6)
+
+        positions = solver.solve(
+            lensing_obj=tracer, source_plane_coordinate=(0.0, 0.02)
+        )
+
+        positions_newton = al.PositionsSolverNewton(
+            grid=grid, pixel_scale_precision=1.0e-6
+        ).solve(lensing_obj=tracer, source_plane_coordinate=(0.0, 0.02))
+
+        assert len(positions.in_grouped_list[0]) == 4
+        assert np.asarray(positions) == pytest.approx(
+            np.asarray(positions_newton), abs=1.0e-6
+        )
+
+        positions_of_tracer = solver.solve_from_tracer(tracer=tracer)[0]
+
+        assert np.asarray(positions_of_tracer) == pytest.approx(
+            np.asarray(positions), 1.0e-8
+        )
+
 
 class TestGridRemoveDuplicates:
     def test__remove_duplicates_from_grid_within_tolerance(self):
@@ -283,6 +806,38 @@ class TestGridRemoveDuplicates:
 
         assert grid == [(1.0, 1.0), (2.0, 2.0), (4.0, 4.0), (5.0, 5.0), (3.0, 3.0)]
 
+        grid = [(1.0, 1.0), (1.0001, 1.0001), (3.0, 3.0)]
+
+        grid = pos.grid_remove_duplicates(grid=np.asarray(grid), tolerance=0.001)
+
+        assert grid == [(1.0001, 1.0001), (3.0, 3.0)]
+
+    def test__many_coordinates_near_cell_edges__same_as_comparing_every_pair(self):
+
+        np.random.seed(1)
+
+        grid = np.random.uniform(low=-1.0e-7, high=1.0e-7, size=(500, 2))
+        grid = np.concatenate((grid, grid[:100] + 0.9e-8, grid[200:300]))
+        grid[::50] = np.nan
+
+        grid_no_duplicates = pos.grid_remove_duplicates(grid=grid)
+
+        grid_no_duplicates_pairs = []
+
+        for i in range(grid.shape[0]):
+
+            separations = np.sqrt(np.sum(np.square(grid[i + 1 :] - grid[i]), axis=1))
+
+            if not np.any(separations < 1e-8):
+                grid_no_duplicates_pairs.append((grid[i, 0], grid[i, 1]))
+
+        assert len(grid_no_duplicates) < grid.shape[0] - 100
+        np.testing.assert_array_equal(
+            np.asarray(grid_no_duplicates), np.asarray(grid_no_duplicates_pairs)
+        )
+
+        assert pos.grid_remove_duplicates(grid=np.zeros(shape=(0, 2))) == []
+
 
 class TestGridBuffedAroundCoordinate:
     def test__single_point_grid_buffed_correctly__upscale_factor_1(self):
@@ -697,6 +1252,32 @@ class TestGridNeighbors1d:
             )
         ).all()
 
+    def test__cached_neighbors__integer_tables_computed_once_per_edge_length(self):
+
+        grid_indexes, neighbors = pos.grid_square_neighbors_cached_from(shape_of_edge=4)
+
+        assert (grid_indexes == np.array([5, 6, 9, 10])).all()
+        assert neighbors.dtype.kind == "i"
+        assert (
+            neighbors.T
+            == np.array(
+                [
+                    [0, 1, 2, 4, 6, 8, 9, 10],
+                    [1, 2, 3, 5, 7, 9, 10, 11],
+                    [4, 5, 6, 8, 10, 12, 13, 14],
+                    [5, 6, 7, 9, 11, 13, 14, 15],
+                ]
+            )
+        ).all()
+        assert not neighbors.flags.writeable
+
+        grid_indexes_cached, neighbors_cached = pos.grid_square_neighbors_cached_from(
+            shape_of_edge=4
+        )
+
+        assert grid_indexes_cached is grid_indexes
+        assert neighbors_cached is neighbors
+
 
 class TestPairCoordinateToGrid:
     def test__coordinate_paired_to_closest_pixel_on_grid(self):
@@ -759,13 +1340,8 @@ class TestGridPeaks:
             ]
         )
 
-        neighbors_1d, has_neighbors = pos.grid_square_neighbors_1d_from(shape_1d=9)
-
-        peaks_coordinates = pos.grid_peaks_from(
-            distance_1d=distance_1d,
-            grid_1d=grid_1d,
-            neighbors=neighbors_1d.astype("int"),
-            has_neighbors=has_neighbors,
+        peaks_coordinates = pos.grids_peaks_from(
+            distance_1d=distance_1d, grid_1d=grid_1d, total_grids=1
         )
 
         assert (np.asarray(peaks_coordinates) == np.array([[0.0, 0.0]])).all()
@@ -802,13 +1378,8 @@ class TestGridPeaks:
 
         grid_1d = al.Grid.uniform(shape_2d=(5, 5), pixel_scales=1.0)
 
-        neighbors_1d, has_neighbors = pos.grid_square_neighbors_1d_from(shape_1d=25)
-
-        peaks_coordinates = pos.grid_peaks_from(
-            distance_1d=distance_1d,
-            grid_1d=grid_1d,
-            neighbors=neighbors_1d.astype("int"),
-            has_neighbors=has_neighbors,
+        peaks_coordinates = pos.grids_peaks_from(
+            distance_1d=distance_1d, grid_1d=grid_1d, total_grids=1
         )
 
         assert (
@@ -816,6 +1387,144 @@ class TestGridPeaks:
         ).all()
 
 
+class TestGridsPeaks:
+    def test__stacked_grids__same_peaks_as_each_grid_separately(self):
+
+        distance_1d = np.array(
+            [1.0, 1.0, 1.0, 1.0, 0.1, 1.0, 1.0, 1.0, 1.0]
+            + [1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0]
+            + [1.0, 1.0, 1.0, 1.0, 0.5, 1.0, 1.0, 1.0, 1.0]
+        )
+
+        grid_1d = np.arange(54.0).reshape(27, 2)
+
+        peaks = pos.grids_peaks_from(
+            distance_1d=distance_1d, grid_1d=grid_1d, total_grids=3
+        )
+
+        assert (peaks == np.array([[8.0, 9.0], [44.0, 45.0]])).all()
+
+        peaks_of_each_grid = [
+            pos.grids_peaks_from(
+                distance_1d=distance_1d[9 * grid_index : 9 * grid_index + 9],
+                grid_1d=grid_1d[9 * grid_index : 9 * grid_index + 9],
+                total_grids=1,
+            )
+            for grid_index in range(3)
+        ]
+
+        assert (peaks == np.concatenate(peaks_of_each_grid)).all()
+
+
+class TestTriangles:
+    def test__grid_square_triangles(self):
+
+        triangles = pos.grid_square_triangles_from(shape_of_edge=3)
+
+        assert (
+            triangles
+            == np.array(
+                [
+                    [0, 1, 3],
+                    [1, 4, 3],
+                    [1, 2, 4],
+                    [2, 5, 4],
+                    [3, 4, 6],
+                    [4, 7, 6],
+                    [4, 5, 7],
+                    [5, 8, 7],
+                ]
+            )
+        ).all()
+
+    def test__triangles_containing_coordinate__subdivided_and_interpolated(self):
+
+        triangles = np.array(
+            [
+                [[0.0, 0.0], [0.0, 2.0], [2.0, 0.0]],
+                [[0.0, 2.0], [2.0, 2.0], [2.0, 0.0]],
+                [[5.0, 5.0], [5.0, 6.0], [6.0, 5.0]],
+            ]
+        )
+
+        is_containing = pos.triangles_containing_coordinate_from(
+            triangles=triangles, coordinate=(0.5, 0.5)
+        )
+
+        assert (is_containing == np.array([True, False, False])).all()
+
+        is_containing = pos.triangles_containing_coordinate_from(
+            triangles=triangles, coordinate=(1.0, 1.0)
+        )
+
+        assert (is_containing == np.array([True, True, False])).all()
+
+        is_near = pos.triangles_near_coordinate_from(
+            triangles=triangles, coordinate=(4.6, 4.6)
+        )
+
+        assert (is_near == np.array([False, False, True])).all()
+
+        midpoints = pos.triangles_midpoints_from(triangles=triangles)
+
+        assert (midpoints[0] == np.array([[0.0, 1.0], [1.0, 1.0], [1.0, 0.0]])).all()
+
+        sub_triangles = pos.triangles_subdivided_from(
+            triangles=triangles, midpoints=midpoints
+        )
+
+        assert sub_triangles.shape == (12, 3, 2)
+        assert (
+            sub_triangles[0] == np.array([[0.0, 0.0], [0.0, 1.0], [1.0, 0.0]])
+        ).all()
+        assert (
+            sub_triangles[3] == np.array([[0.0, 1.0], [1.0, 1.0], [1.0, 0.0]])
+        ).all()
+        assert pos.triangles_sizes_from(triangles=sub_triangles[0:1]) == pytest.approx(
+            np.sqrt(2.0), 1.0e-8
+        )
+
+        coordinates = pos.coordinates_in_triangles_from(
+            image_triangles=triangles[0:1] + 1.0,
+            source_triangles=2.0 * triangles[0:1],
+            coordinate=(1.0, 0.5),
+        )
+
+        assert coordinates == pytest.approx(np.array([[1.5, 1.25]]), 1.0e-8)
+
+    def test__triangle_index__same_triangles_as_testing_every_triangle(self):
+
+        np.random.seed(1)
+
+        image_triangles = pos.triangles_subdivided_from(
+            triangles=np.array([[[0.0, 0.0], [0.0, 1.0], [1.0, 0.0]]]),
+            midpoints=np.array([[[0.0, 0.5], [0.5, 0.5], [0.5, 0.0]]]),
+        )
+
+        source_triangles = np.random.uniform(low=-1.0, high=1.0, size=(200, 3, 2))
+        source_triangles[:100] *= 0.05
+        source_triangles[100] *= 50.0
+        source_triangles[101, 0, 0] = np.nan
+
+        triangle_index = pos.TriangleIndex(
+            image_triangles=np.repeat(image_triangles, 50, axis=0),
+            source_triangles=source_triangles,
+        )
+
+        assert 100 in triangle_index.large_triangle_indexes
+
+        for coordinate in [(0.0, 0.0), (0.3, -0.2), (0.01, 0.02), (5.0, 5.0)]:
+
+            is_near = pos.triangles_near_coordinate_from(
+                triangles=source_triangles, coordinate=coordinate
+            )
+
+            assert (
+                triangle_index.triangle_indexes_near(coordinate=coordinate)
+                == np.flatnonzero(is_near)
+            ).all()
+
+
 class TestWithinDistance:
     def test__grid_keeps_only_points_within_distance(self):
 
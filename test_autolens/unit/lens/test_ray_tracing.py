@@ -1,4 +1,5 @@
 import autolens as al
+import json
 import numpy as np
 import pytest
 import os
@@ -7,6 +8,8 @@ import shutil
 from astropy import cosmology as cosmo
 from skimage import measure
 from autoarray.mock import mock as mock_inv
+from autolens import exc
+from autolens.lens import ray_tracing
 
 
 test_path = path.join(
@@ -695,8 +698,197 @@ class TestAbstractTracer:
 
             assert tracer.galaxies[0].light.intensity == 1.1
 
+        def test__tracer_can_be_saved_and_loaded_in_compact_format(self, tmp_path):
+
+            os.makedirs(path.join(tmp_path, "tracer_0"))
+            os.makedirs(path.join(tmp_path, "tracer_1"))
+
+            tracer_0 = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        light=al.lp.EllipticalSersic(intensity=1.1, sersic_index=3.0),
+                        mass=al.mp.EllipticalIsothermal(
+                            centre=(0.1, 0.2), einstein_radius=1.5
+                        ),
+                    ),
+                    al.Galaxy(
+                        redshift=1.0,
+                        pixelization=al.pix.Rectangular(shape=(4, 5)),
+                        regularization=al.reg.Constant(coefficient=2.0),
+                    ),
+                ],
+                cosmology=cosmo.WMAP9,
+                deflections_opening_angle=0.3,
+            )
+
+            tracer_1 = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalNFWMCRLudlow(mass_at_200=1.0e9),
+                    ),
+                    al.Galaxy(redshift=1.0),
+                ],
+                cosmology=cosmo.FlatLambdaCDM(H0=70.0, Om0=0.3),
+            )
+
+            tracer_0.save_compact(
+                file_path=path.join(tmp_path, "tracer_0"), filename="test_tracer"
+            )
+            tracer_1.save_compact(
+                file_path=path.join(tmp_path, "tracer_1"), filename="test_tracer"
+            )
+
+            tracer = al.Tracer.load_compact(
+                file_path=path.join(tmp_path, "tracer_0"), filename="test_tracer"
+            )
+
+            assert tracer.plane_redshifts == [0.5, 1.0]
+            assert tracer.cosmology is cosmo.WMAP9
+            assert tracer.deflections_opening_angle == 0.3
+            assert tracer.galaxies[0].light == tracer_0.galaxies[0].light
+            assert tracer.galaxies[0].mass == tracer_0.galaxies[0].mass
+            assert tracer.galaxies[1].pixelization.shape == (4, 5)
+            assert tracer.galaxies[1].regularization.coefficient == 2.0
+
+            tracers = list(
+                al.Tracer.generator_from_compact_files(
+                    file_paths=[
+                        path.join(tmp_path, "tracer_0"),
+                        path.join(tmp_path, "tracer_1"),
+                    ],
+                    filename="test_tracer",
+                )
+            )
+
+            assert len(tracers) == 2
+            assert tracers[1].cosmology.H0 == tracer_1.cosmology.H0
+            assert tracers[1].cosmology.Om0 == tracer_1.cosmology.Om0
+
+            grid = al.Grid.uniform(shape_2d=(2, 2), pixel_scales=0.5)
+
+            assert tracers[1].deflections_from_grid(grid=grid) == pytest.approx(
+                tracer_1.deflections_from_grid(grid=grid), 1.0e-8
+            )
+
+        def test__compact_format__modified_realization_cosmology__parameters_saved(
+            self, tmp_path
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)],
+                cosmology=cosmo.Planck15.clone(H0=60.0),
+            )
+
+            tracer.save_compact(file_path=tmp_path)
+
+            tracer = al.Tracer.load_compact(file_path=tmp_path)
+
+            assert tracer.cosmology is not cosmo.Planck15
+            assert tracer.cosmology.H0.value == 60.0
+            assert tracer.cosmology.Om0 == cosmo.Planck15.Om0
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)],
+                cosmology=cosmo.Planck15.clone(),
+            )
+
+            tracer.save_compact(file_path=tmp_path)
+
+            assert (
+                al.Tracer.load_compact(file_path=tmp_path).cosmology is cosmo.Planck15
+            )
+
+        def test__compact_format__class_not_a_galaxy_object__raises_exception(
+            self, tmp_path
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5, light=al.lp.EllipticalSersic(intensity=1.1)
+                    ),
+                    al.Galaxy(redshift=1.0),
+                ]
+            )
+
+            tracer.save_compact(file_path=tmp_path)
+
+            with open(path.join(tmp_path, "tracer.json")) as f:
+                tracer_dict = json.load(f)
+
+            tracer_dict["planes"][0]["galaxies"][0]["objects"]["light"] = {
+                "class": "subprocess.Popen",
+                "parameters": {},
+                "constants": {"args": "echo"},
+            }
+
+            with open(path.join(tmp_path, "tracer.json"), "w") as f:
+                json.dump(tracer_dict, f)
+
+            with pytest.raises(exc.RayTracingException):
+                al.Tracer.load_compact(file_path=tmp_path)
+
 
 class TestAbstractTracerLensing:
+    class TestScalingFactors:
+        def test__4_planes__scaling_factors_match_cosmology_calculation(self):
+
+            g0 = al.Galaxy(redshift=0.1)
+            g1 = al.Galaxy(redshift=1.0)
+            g2 = al.Galaxy(redshift=2.0)
+            g3 = al.Galaxy(redshift=3.0)
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[g0, g1, g2, g3], cosmology=cosmo.Planck15
+            )
+
+            scaling_factors = tracer.scaling_factors_of_planes
+
+            assert scaling_factors.shape == (4, 4)
+            assert scaling_factors[1, 0] == pytest.approx(0.9348, 1e-4)
+            assert scaling_factors[2, 0] == pytest.approx(0.9839601, 1e-4)
+            assert scaling_factors[2, 1] == pytest.approx(0.7539734, 1e-4)
+            assert scaling_factors[3, 0] == pytest.approx(1.0, 1e-4)
+            assert scaling_factors[3, 2] == pytest.approx(1.0, 1e-4)
+            assert (np.triu(scaling_factors) == 0.0).all()
+
+        def test__tracers_with_same_redshifts_and_cosmology__share_cached_scaling_factors(
+            self
+        ):
+
+            tracer_0 = al.Tracer.from_galaxies(
+                galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)],
+                cosmology=cosmo.Planck15,
+            )
+            tracer_1 = al.Tracer.from_galaxies(
+                galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)],
+                cosmology=cosmo.Planck15,
+            )
+            tracer_2 = al.Tracer.from_galaxies(
+                galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=2.0)],
+                cosmology=cosmo.Planck15,
+            )
+
+            assert (
+                tracer_0.scaling_factors_of_planes is tracer_1.scaling_factors_of_planes
+            )
+            assert (
+                tracer_0.scaling_factors_of_planes
+                is not tracer_2.scaling_factors_of_planes
+            )
+            assert tracer_0.scaling_factors_of_planes.flags.writeable is False
+
+        def test__no_cosmology__scaling_factors_are_none(self):
+
+            tracer = al.Tracer(
+                planes=[al.Plane(redshift=0.5), al.Plane(redshift=1.0)],
+                cosmology=None,
+            )
+
+            assert tracer.scaling_factors_of_planes is None
+
     class TestTracedGridsFromGrid:
         def test__x2_planes__no_galaxy__image_and_source_planes_setup__same_coordinates(
             self, sub_grid_7x7
@@ -1191,6 +1383,127 @@ class TestAbstractTracerLensing:
 
             assert len(traced_grids_of_planes) == 2
 
+        def test__6_planes__recursive_tracing_matches_summed_scaled_deflections(
+            self, sub_grid_7x7
+        ):
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=redshift,
+                    mass=al.mp.EllipticalIsothermal(
+                        centre=(0.1 * index, -0.1 * index),
+                        elliptical_comps=(0.05, 0.1),
+                        einstein_radius=0.5,
+                    ),
+                )
+                for index, redshift in enumerate([0.2, 0.5, 0.9, 1.3, 1.8])
+            ]
+
+            galaxies.append(al.Galaxy(redshift=2.5))
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=galaxies, cosmology=cosmo.Planck15
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            traced_deflections = []
+
+            for (plane_index, plane) in enumerate(tracer.planes):
+
+                scaled_grid = np.asarray(sub_grid_7x7).copy()
+
+                for previous_plane_index in range(plane_index):
+                    scaled_grid -= (
+                        tracer.scaling_factors_of_planes[
+                            plane_index, previous_plane_index
+                        ]
+                        * traced_deflections[previous_plane_index]
+                    )
+
+                assert traced_grids_of_planes[plane_index] == pytest.approx(
+                    scaled_grid, 1.0e-10
+                )
+
+                traced_deflections.append(
+                    np.asarray(plane.deflections_from_grid(grid=scaled_grid))
+                )
+
+        def test__workspace_reused_between_calls__returned_grids_not_overwritten(
+            self, sub_grid_7x7, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            traced_grids_0 = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            workspace = tracer.traced_grids_workspace_from(
+                total_pixels=sub_grid_7x7.shape[0]
+            )
+
+            traced_grids_1 = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7 + 1.0
+            )
+
+            assert (
+                tracer.traced_grids_workspace_from(total_pixels=sub_grid_7x7.shape[0])
+                is workspace
+            )
+            assert (traced_grids_0[0] == sub_grid_7x7).all()
+            assert (traced_grids_1[0] == sub_grid_7x7 + 1.0).all()
+            assert isinstance(traced_grids_0[1], al.Grid)
+            assert (traced_grids_0[1].mask == sub_grid_7x7.mask).all()
+
+        def test__planes_without_mass__skipped_and_do_not_change_traced_grids(
+            self, sub_grid_7x7
+        ):
+
+            lens = al.Galaxy(
+                redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+            )
+            source = al.Galaxy(
+                redshift=2.0, light=al.lp.EllipticalSersic(intensity=1.0)
+            )
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.2, light=al.lp.EllipticalSersic(intensity=1.0)
+                    ),
+                    lens,
+                    al.Galaxy(
+                        redshift=1.0, light=al.lp.EllipticalSersic(intensity=1.0)
+                    ),
+                    source,
+                ]
+            )
+
+            assert tracer.plane_indexes_with_mass_profile == (1,)
+            assert tracer.plane_indexes_with_light_profile == (0, 2, 3)
+
+            tracer_no_light_planes = al.Tracer.from_galaxies(galaxies=[lens, source])
+
+            traced_grids = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+            traced_grids_no_light_planes = tracer_no_light_planes.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert (traced_grids[1] == sub_grid_7x7).all()
+            assert traced_grids[3] == pytest.approx(
+                traced_grids_no_light_planes[1], 1.0e-8
+            )
+
+            assert (
+                tracer.convergence_from_grid(grid=sub_grid_7x7)
+                == lens.convergence_from_grid(grid=sub_grid_7x7)
+            ).all()
+
     class TestProfileImages:
         def test__x1_plane__single_plane_tracer(self, sub_grid_7x7):
             g0 = al.Galaxy(
@@ -2015,6 +2328,127 @@ class TestAbstractTracerLensing:
                 tracer_deflections.in_2d_binned[:, :, 1] == np.zeros(shape=(7, 7))
             ).all()
 
+    class TestTraceCache:
+        def test__traced_grids_in_scope__reused_for_same_grid_and_lower_plane_limits(
+            self, sub_grid_7x7, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            traced_grids_no_cache = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert tracer.trace_cache is None
+
+            with tracer.trace_cache_scope() as trace_cache:
+
+                traced_grids_0 = tracer.traced_grids_of_planes_from_grid(
+                    grid=sub_grid_7x7
+                )
+                traced_grids_1 = tracer.traced_grids_of_planes_from_grid(
+                    grid=sub_grid_7x7
+                )
+                traced_grids_limit = tracer.traced_grids_of_planes_from_grid(
+                    grid=sub_grid_7x7, plane_index_limit=0
+                )
+
+                assert trace_cache.misses == 1
+                assert trace_cache.hits == 2
+
+                tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7.copy())
+
+                assert trace_cache.misses == 2
+
+                with tracer.trace_cache_scope() as trace_cache_nested:
+                    assert trace_cache_nested is trace_cache
+
+            assert tracer.trace_cache is None
+            assert trace_cache.hits == 2
+
+            assert (traced_grids_0[1] == traced_grids_no_cache[1]).all()
+            assert (traced_grids_1[1] == traced_grids_no_cache[1]).all()
+            assert len(traced_grids_limit) == 1
+            assert (traced_grids_limit[0] == traced_grids_no_cache[0]).all()
+
+        def test__lower_plane_limit_traced_first__higher_limit_is_a_miss(
+            self, sub_grid_7x7, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            with tracer.trace_cache_scope() as trace_cache:
+
+                tracer.traced_grids_of_planes_from_grid(
+                    grid=sub_grid_7x7, plane_index_limit=0
+                )
+                tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+                tracer.traced_grids_of_planes_from_grid(
+                    grid=sub_grid_7x7, plane_index_limit=0
+                )
+
+            assert trace_cache.misses == 2
+            assert trace_cache.hits == 1
+
+        def test__input_trace_cache__grids_kept_after_scope_until_cleared(
+            self, sub_grid_7x7, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            trace_cache = ray_tracing.TraceCache()
+
+            with tracer.trace_cache_scope(trace_cache=trace_cache) as trace_cache_scope:
+
+                assert trace_cache_scope is trace_cache
+
+                tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+
+            assert tracer.trace_cache is None
+            assert trace_cache.has_traced_grids(grid=sub_grid_7x7)
+
+            with tracer.trace_cache_scope(trace_cache=trace_cache):
+                tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+
+            assert trace_cache.misses == 1
+            assert trace_cache.hits == 1
+
+            trace_cache.clear()
+
+            assert not trace_cache.has_traced_grids(grid=sub_grid_7x7)
+
+        def test__input_trace_cache_in_nested_scope__used_in_scope_and_outer_cache_restored(
+            self, sub_grid_7x7, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            trace_cache = ray_tracing.TraceCache()
+
+            with tracer.trace_cache_scope() as trace_cache_outer:
+
+                with tracer.trace_cache_scope(
+                    trace_cache=trace_cache
+                ) as trace_cache_scope:
+
+                    assert trace_cache_scope is trace_cache
+
+                    tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+
+                assert tracer.trace_cache is trace_cache_outer
+                assert not trace_cache_outer.has_traced_grids(grid=sub_grid_7x7)
+
+            assert tracer.trace_cache is None
+            assert trace_cache.has_traced_grids(grid=sub_grid_7x7)
+
     class TestGridAtRedshift:
         def test__lens_z05_source_z01_redshifts__match_planes_redshifts__gives_same_grids(
             self, sub_grid_7x7
@@ -2164,6 +2598,68 @@ class TestAbstractTracerLensing:
 
             assert (grid_at_redshift == sub_grid_7x7.geometry.unmasked_grid_sub_1).all()
 
+        def test__multiple_redshifts__same_as_tracer_with_planes_at_redshifts__tracer_not_modified(
+            self, sub_grid_7x7
+        ):
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.SphericalIsothermal(
+                        centre=(0.1, 0.0), einstein_radius=1.0
+                    ),
+                ),
+                al.Galaxy(
+                    redshift=0.75,
+                    mass=al.mp.SphericalIsothermal(
+                        centre=(0.0, 0.1), einstein_radius=0.5
+                    ),
+                ),
+                al.Galaxy(
+                    redshift=1.0,
+                    mass=al.mp.SphericalIsothermal(
+                        centre=(0.0, 0.0), einstein_radius=0.3
+                    ),
+                ),
+                al.Galaxy(redshift=2.0),
+            ]
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+            redshifts = [0.3, 0.6, 0.75, 0.9, 1.5]
+
+            grids_at_redshifts = tracer.grids_at_redshifts_from_grid_and_redshifts(
+                grid=sub_grid_7x7, redshifts=redshifts
+            )
+
+            assert tracer.plane_redshifts == [0.5, 0.75, 1.0, 2.0]
+            assert len(tracer.planes) == 4
+
+            for redshift, grid_at_redshift in zip(redshifts, grids_at_redshifts):
+
+                tracer_with_plane = al.Tracer.from_galaxies(
+                    galaxies=galaxies + [al.Galaxy(redshift=redshift)]
+                )
+
+                plane_index = tracer_with_plane.plane_redshifts.index(redshift)
+
+                traced_grids_of_planes = tracer_with_plane.traced_grids_of_planes_from_grid(
+                    grid=sub_grid_7x7
+                )
+
+                assert isinstance(grid_at_redshift, al.Grid)
+                assert grid_at_redshift == pytest.approx(
+                    traced_grids_of_planes[plane_index], 1.0e-8
+                )
+                assert tracer.grid_at_redshift_from_grid_and_redshift(
+                    grid=sub_grid_7x7, redshift=redshift
+                ) == pytest.approx(grid_at_redshift, 1.0e-8)
+
+            with pytest.raises(exc.RayTracingException):
+                tracer.grid_at_redshift_from_grid_and_redshift(
+                    grid=sub_grid_7x7, redshift=2.5
+                )
+
     class TestContributionMap:
         def test__contribution_maps_are_same_as_hyper_galaxy_calculation(self):
 
@@ -2231,6 +2727,38 @@ class TestAbstractTracerLensing:
 
             assert tracer.contribution_maps_of_planes[1] == None
 
+    class TestTracerWithGalaxiesOfPlanes:
+        def test__planes_cosmology_and_settings_kept__galaxies_replaced(self):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(redshift=1.0, light=al.lp.SphericalSersic()),
+                    al.Galaxy(redshift=2.0, light=al.lp.SphericalSersic()),
+                ],
+                cosmology=cosmo.FlatLambdaCDM(H0=70.0, Om0=0.3),
+                deflections_opening_angle=0.3,
+            )
+
+            galaxy_0 = al.Galaxy(redshift=0.5)
+            galaxy_1 = al.Galaxy(redshift=0.5)
+
+            tracer_replaced = tracer.tracer_with_galaxies_of_planes_from(
+                galaxies_of_planes=[[galaxy_0], [], [galaxy_1]]
+            )
+
+            assert isinstance(tracer_replaced, al.Tracer)
+            assert tracer_replaced.plane_redshifts == [0.5, 1.0, 2.0]
+            assert tracer_replaced.cosmology is tracer.cosmology
+            assert tracer_replaced.deflections_opening_angle == 0.3
+            assert tracer_replaced.planes[0].galaxies == [galaxy_0]
+            assert tracer_replaced.planes[1].galaxies == []
+            assert tracer_replaced.planes[2].galaxies == [galaxy_1]
+            assert len(tracer.planes[1].galaxies) == 1
+
     class TestLensingObject:
         def test__correct_einstein_mass_caclulated_for_multiple_mass_profiles__means_all_innherited_methods_work(
             self,
@@ -2403,6 +2931,51 @@ class TestAbstractTracerData:
                 blurred_image_0.in_2d + blurred_image_1.in_2d, 1.0e-4
             )
 
+        def test__blurred_image_from_grid_and_convolver__out_buffer_used(
+            self, sub_grid_7x7, blurring_grid_7x7, convolver_7x7
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            g1 = al.Galaxy(
+                redshift=1.0, light_profile=al.lp.EllipticalSersic(intensity=2.0)
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+            blurred_image = tracer.blurred_image_from_grid_and_convolver(
+                grid=sub_grid_7x7,
+                convolver=convolver_7x7,
+                blurring_grid=blurring_grid_7x7,
+            )
+
+            out = np.full(shape=blurred_image.shape, fill_value=1.0)
+
+            blurred_image_out = tracer.blurred_image_from_grid_and_convolver(
+                grid=sub_grid_7x7,
+                convolver=convolver_7x7,
+                blurring_grid=blurring_grid_7x7,
+                out=out,
+            )
+
+            assert blurred_image_out is out
+            assert (out == blurred_image.in_1d).all()
+
+            tracer = al.Tracer.from_galaxies(galaxies=[al.Galaxy(redshift=0.5)])
+
+            blurred_image_out = tracer.blurred_image_from_grid_and_convolver(
+                grid=sub_grid_7x7,
+                convolver=convolver_7x7,
+                blurring_grid=blurring_grid_7x7,
+                out=out,
+            )
+
+            assert blurred_image_out is out
+            assert (out == np.zeros(9)).all()
+
         def test__blurred_images_of_planes_from_grid_and_convolver(
             self, sub_grid_7x7, blurring_grid_7x7, convolver_7x7
         ):
@@ -2450,6 +3023,97 @@ class TestAbstractTracerData:
             assert (blurred_images[0].in_2d == blurred_image_0.in_2d).all()
             assert (blurred_images[1].in_2d == blurred_image_1.in_2d).all()
 
+        def test__images_of_planes_from_grid_and_blurring_grid__same_as_tracing_each_grid(
+            self, sub_grid_7x7, blurring_grid_7x7
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            g1 = al.Galaxy(
+                redshift=1.0, light_profile=al.lp.EllipticalSersic(intensity=2.0)
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+            assert tracer.can_trace_grid_and_blurring_grid_together(
+                grid=sub_grid_7x7, blurring_grid=blurring_grid_7x7
+            )
+
+            images_of_planes, blurring_images_of_planes = tracer.images_of_planes_from_grid_and_blurring_grid(
+                grid=sub_grid_7x7, blurring_grid=blurring_grid_7x7
+            )
+
+            image_of_planes = tracer.images_of_planes_from_grid(grid=sub_grid_7x7)
+            blurring_image_of_planes = tracer.images_of_planes_from_grid(
+                grid=blurring_grid_7x7
+            )
+
+            for plane_index in range(2):
+
+                assert images_of_planes[plane_index].in_1d_binned == pytest.approx(
+                    image_of_planes[plane_index].in_1d_binned, 1.0e-8
+                )
+                assert blurring_images_of_planes[
+                    plane_index
+                ].in_1d_binned == pytest.approx(
+                    blurring_image_of_planes[plane_index].in_1d_binned, 1.0e-8
+                )
+
+            grid_iterate = al.GridIterate.from_mask(mask=sub_grid_7x7.mask)
+
+            assert not tracer.can_trace_grid_and_blurring_grid_together(
+                grid=grid_iterate, blurring_grid=blurring_grid_7x7
+            )
+
+        def test__traced_grids_of_planes_from_grid_and_blurring_grid__cached_grids_reused_up_to_upper_light_plane(
+            self, sub_grid_7x7, blurring_grid_7x7
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            g1 = al.Galaxy(
+                redshift=1.0,
+                light_profile=al.lp.EllipticalSersic(intensity=2.0),
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=0.5),
+            )
+            g2 = al.Galaxy(
+                redshift=2.0,
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=0.5),
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1, g2])
+
+            with tracer.trace_cache_scope() as trace_cache:
+
+                traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid_and_blurring_grid(
+                    grid=sub_grid_7x7, blurring_grid=blurring_grid_7x7
+                )
+
+                assert trace_cache.misses == 1
+                assert trace_cache.hits == 0
+
+                traced_grids_of_planes_cached = tracer.traced_grids_of_planes_from_grid_and_blurring_grid(
+                    grid=sub_grid_7x7, blurring_grid=blurring_grid_7x7
+                )
+
+                assert trace_cache.misses == 1
+                assert trace_cache.hits == 2
+
+            assert len(traced_grids_of_planes) == 2
+            assert len(traced_grids_of_planes_cached) == 2
+
+            for plane_index in range(2):
+                assert (
+                    traced_grids_of_planes_cached[plane_index]
+                    == traced_grids_of_planes[plane_index]
+                ).all()
+
         def test__galaxy_blurred_image_dict_from_grid_and_convolver(
             self, sub_grid_7x7, blurring_grid_7x7, convolver_7x7
         ):
@@ -3707,3 +4371,130 @@ class TestDecorators:
         grid = al.Grid.from_mask(mask=mask)
         traced_grids_no_interp = tracer.traced_grids_of_planes_from_grid(grid=grid)
         assert (traced_grids[1][0, 0] != traced_grids_no_interp[1][0, 0]).all()
+
+
+class TestTracerBatch:
+    def test__traced_grids_and_blurred_images__same_as_each_tracer(
+        self, sub_grid_7x7, blurring_grid_7x7, convolver_7x7
+    ):
+
+        tracers = [
+            al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        light=al.lp.EllipticalSersic(intensity=1.0),
+                        mass=al.mp.SphericalIsothermal(einstein_radius=einstein_radius),
+                    ),
+                    al.Galaxy(
+                        redshift=0.75,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=0.5),
+                    ),
+                    al.Galaxy(
+                        redshift=1.0,
+                        light=al.lp.EllipticalExponential(intensity=intensity),
+                    ),
+                ]
+            )
+            for einstein_radius, intensity in [(1.0, 2.0), (1.2, 0.5), (0.8, 1.0)]
+        ]
+
+        tracer_batch = al.TracerBatch(tracers=tracers)
+
+        traced_grids = tracer_batch.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+
+        assert traced_grids.shape == (3, 3, sub_grid_7x7.shape[0], 2)
+
+        blurred_images = tracer_batch.blurred_images_from_grid_and_convolver(
+            grid=sub_grid_7x7, convolver=convolver_7x7, blurring_grid=blurring_grid_7x7
+        )
+
+        for tracer_index, tracer in enumerate(tracers):
+
+            traced_grids_of_tracer = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            for plane_index in range(3):
+                assert traced_grids[tracer_index, plane_index] == pytest.approx(
+                    np.asarray(traced_grids_of_tracer[plane_index]), 1.0e-8
+                )
+
+            blurred_image = tracer.blurred_image_from_grid_and_convolver(
+                grid=sub_grid_7x7,
+                convolver=convolver_7x7,
+                blurring_grid=blurring_grid_7x7,
+            )
+
+            assert blurred_images[tracer_index] == pytest.approx(
+                blurred_image.in_1d_binned, 1.0e-8
+            )
+
+    def test__profiles_shared_by_tracers__evaluated_once_on_stacked_grids(
+        self, sub_grid_7x7
+    ):
+
+        shared_light = al.lp.EllipticalSersic(intensity=1.0)
+        shared_mass = al.mp.SphericalIsothermal(einstein_radius=0.5)
+
+        grid_sizes = {"light": [], "mass": []}
+
+        image_from_grid = shared_light.image_from_grid
+        deflections_from_grid = shared_mass.deflections_from_grid
+
+        def shared_image_from_grid(grid):
+            grid_sizes["light"].append(grid.shape[0])
+            return image_from_grid(grid=grid)
+
+        def shared_deflections_from_grid(grid):
+            grid_sizes["mass"].append(grid.shape[0])
+            return deflections_from_grid(grid=grid)
+
+        shared_light.image_from_grid = shared_image_from_grid
+        shared_mass.deflections_from_grid = shared_deflections_from_grid
+
+        tracers = [
+            al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        light=shared_light,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=einstein_radius),
+                    ),
+                    al.Galaxy(redshift=0.75, mass=shared_mass),
+                    al.Galaxy(
+                        redshift=1.0,
+                        light=al.lp.EllipticalExponential(intensity=intensity),
+                    ),
+                ]
+            )
+            for einstein_radius, intensity in [(1.0, 2.0), (1.2, 0.5), (0.8, 1.0)]
+        ]
+
+        tracer_batch = al.TracerBatch(tracers=tracers)
+
+        images = tracer_batch.images_from_grid(grid=sub_grid_7x7)
+
+        # The image-plane grid of every tracer is the same, so the shared light profile is evaluated on one grid,
+        # whereas the shared mass profile is evaluated on the traced grids of the three tracers stacked together.
+
+        assert grid_sizes["light"] == [sub_grid_7x7.shape[0]]
+        assert grid_sizes["mass"] == [3 * sub_grid_7x7.shape[0]]
+
+        for tracer_index, tracer in enumerate(tracers):
+
+            assert images[tracer_index] == pytest.approx(
+                np.asarray(tracer.image_from_grid(grid=sub_grid_7x7)), 1.0e-8
+            )
+
+    def test__tracers_with_different_plane_redshifts__raises_exception(self):
+
+        tracer_0 = al.Tracer.from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+        )
+        tracer_1 = al.Tracer.from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=2.0)]
+        )
+
+        with pytest.raises(exc.RayTracingException):
+            al.TracerBatch(tracers=[tracer_0, tracer_1])
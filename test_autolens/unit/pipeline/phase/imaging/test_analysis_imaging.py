@@ -5,7 +5,9 @@ import autolens as al
 from autolens import exc
 import pytest
 from astropy import cosmology as cosmo
+from autoarray.exc import GridException
 from autolens.fit.fit import FitImaging
+from autolens.lens import ray_tracing
 from autolens.mock import mock
 import numpy as np
 
@@ -94,6 +96,158 @@ class TestFit:
 
         assert fit.log_likelihood == fit_figure_of_merit
 
+    def test__figure_of_merit__constant_image_cache__matches_correct_fit_given_galaxy_profiles(
+        self, imaging_7x7, mask_7x7
+    ):
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(
+                    redshift=0.5,
+                    light=al.lp.SphericalSersic(intensity=0.1),
+                    mass=al.mp.SphericalIsothermal,
+                ),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.SphericalExponential),
+            ),
+            settings=al.SettingsPhaseImaging(
+                settings_masked_imaging=al.SettingsMaskedImaging(sub_size=2),
+                settings_lens=al.SettingsLens(use_constant_image_cache=True),
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        assert analysis.fit_likelihood.use_constant_image_cache is True
+
+        masked_imaging = al.MaskedImaging(
+            imaging=imaging_7x7,
+            mask=mask_7x7,
+            settings=al.SettingsMaskedImaging(sub_size=2),
+        )
+
+        for unit_value in [0.5, 0.55, 0.6]:
+
+            instance = phase_imaging_7x7.model.instance_from_unit_vector(
+                [unit_value] * phase_imaging_7x7.model.prior_count
+            )
+
+            fit_figure_of_merit = analysis.log_likelihood_function(instance=instance)
+
+            tracer = analysis.tracer_for_instance(instance=instance)
+
+            fit = al.FitImaging(masked_imaging=masked_imaging, tracer=tracer)
+
+            assert fit.log_likelihood == fit_figure_of_merit
+
+        assert [
+            image_cache.light_profile
+            for plane_index, image_cache in analysis.fit_likelihood.light_profile_image_caches
+        ] == [instance.galaxies.lens.light]
+
+    def test__figure_of_merit_batch__matches_figure_of_merit_of_each_instance(
+        self, imaging_7x7, mask_7x7
+    ):
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(
+                    redshift=0.5,
+                    light=al.lp.SphericalSersic,
+                    mass=al.mp.SphericalIsothermal,
+                ),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.SphericalExponential),
+            ),
+            settings=al.SettingsPhaseImaging(
+                settings_masked_imaging=al.SettingsMaskedImaging(sub_size=2)
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [unit_value] * phase_imaging_7x7.model.prior_count
+            )
+            for unit_value in [0.5, 0.55, 0.6]
+        ]
+
+        figures_of_merit = analysis.log_likelihood_function_batch(instances=instances)
+
+        assert figures_of_merit == pytest.approx(
+            [
+                analysis.log_likelihood_function(instance=instance)
+                for instance in instances
+            ],
+            1.0e-8,
+        )
+
+    def test__figure_of_merit_batch__batch_fails__each_instance_fitted_individually(
+        self, imaging_7x7, mask_7x7, monkeypatch
+    ):
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(
+                    redshift=0.5,
+                    light=al.lp.SphericalSersic,
+                    mass=al.mp.SphericalIsothermal,
+                ),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.SphericalExponential),
+            ),
+            settings=al.SettingsPhaseImaging(
+                settings_masked_imaging=al.SettingsMaskedImaging(sub_size=2)
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [unit_value] * phase_imaging_7x7.model.prior_count
+            )
+            for unit_value in [0.5, 0.55, 0.6]
+        ]
+
+        figures_of_merit_individual = [
+            analysis.log_likelihood_function(instance=instance)
+            for instance in instances
+        ]
+
+        def blurred_images_from_grid_and_convolver(*args, **kwargs):
+            raise GridException
+
+        monkeypatch.setattr(
+            ray_tracing.TracerBatch,
+            "blurred_images_from_grid_and_convolver",
+            blurred_images_from_grid_and_convolver,
+        )
+
+        tracers_for_instance = []
+
+        tracer_for_instance = analysis.tracer_for_instance
+
+        def tracer_for_instance_counted(instance):
+            tracers_for_instance.append(instance)
+            return tracer_for_instance(instance=instance)
+
+        monkeypatch.setattr(
+            analysis, "tracer_for_instance", tracer_for_instance_counted
+        )
+
+        figures_of_merit = analysis.log_likelihood_function_batch(instances=instances)
+
+        assert figures_of_merit.tolist() == figures_of_merit_individual
+        assert len(tracers_for_instance) == 3
+
     def test__figure_of_merit__includes_hyper_image_and_noise__matches_fit(
         self, imaging_7x7, mask_7x7
     ):